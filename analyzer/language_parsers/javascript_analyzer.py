@@ -2,29 +2,261 @@
 JavaScript/TypeScript code analyzer using Esprima AST parsing
 """
 
+import bisect
+import copy
+import hashlib
+import logging
+import os
+import pickle
 import re
-from typing import List, Optional, Dict, Any, Union
+import sys
+import tempfile
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from types import SimpleNamespace
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Union, Tuple, Protocol
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 try:
     import esprima
     from esprima import nodes
     HAS_ESPRIMA = True
 except ImportError:
-    print("Warning: esprima package not available. Using fallback regex-based parser.")
+    logger.warning("esprima package not available. Using fallback regex-based parser.")
     HAS_ESPRIMA = False
     esprima = None
     nodes = None
 
+try:
+    from tree_sitter_languages import get_parser as get_tree_sitter_parser
+    HAS_TREE_SITTER = True
+except ImportError:
+    HAS_TREE_SITTER = False
+    get_tree_sitter_parser = None
+
 from ..models import FunctionCandidate, FunctionParameter
 
+# Strings shared by every candidate, interned once so they are never re-allocated
+_LANG_JS = sys.intern('javascript')
+
+# Fallback names for nodes without an identifier
+_ANONYMOUS = sys.intern('anonymous')
+_ANONYMOUS_CLASS = sys.intern('AnonymousClass')
+_UNKNOWN = sys.intern('unknown')
+
+# Placeholder names for destructured parameters
+_DESTRUCTURED_OBJECT = sys.intern('destructured_object')
+_DESTRUCTURED_ARRAY = sys.intern('destructured_array')
+_DESTRUCTURED_PARAM = sys.intern('destructured_param')
+
+# Function declaration patterns used by the regex fallback parser, combined
+# into one alternation so the source is scanned in a single pass. Each
+# alternative is a named group whose name is the function type.
+_FUNCTION_RE = re.compile(
+    # Export function declarations: export function name(params) { }
+    r'(?P<export_function>export\s+function\s+(?P<export_function_name>\w+)\s*\((?P<export_function_params>[^)]*)\)\s*\{)'
+    # Export arrow functions: export const name = (params) => { }
+    r'|(?P<export_arrow>export\s+(?:const|let)\s+(?P<export_arrow_name>\w+)\s*=\s*(?:\([^)]*\)|[^=])\s*=>)'
+    # Regular function declarations: function name(params) { }
+    r'|(?P<function>function\s+(?P<function_name>\w+)\s*\((?P<function_params>[^)]*)\)\s*\{)'
+    # Arrow functions assigned to variables: const name = (params) => { }
+    r'|(?P<arrow>(?:const|let|var)\s+(?P<arrow_name>\w+)\s*=\s*(?:\([^)]*\)|[^=])\s*=>)',
+    re.MULTILINE
+)
+
+# Capture group names per function type: (name group, params group or None)
+_FUNCTION_GROUPS = {
+    sys.intern(func_type): (f'{func_type}_name', f'{func_type}_params' if has_params else None)
+    for func_type, has_params in (
+        ('export_function', True),
+        ('export_arrow', False),
+        ('function', True),
+        ('arrow', False),
+    )
+}
+
+# Cheap pre-scan for sources that may contain functions
+_HAS_FUNCTION_RE = re.compile(r'\bfunction\b|=>|\bclass\s')
+
+# Top-level import/export statements mark a source as an ES module
+_MODULE_HINT_RE = re.compile(r'^\s*(?:import|export)\b', re.MULTILINE)
+
+# Braces plus the string/comment tokens whose braces must be ignored when matching
+_BRACE_TOKEN_RE = re.compile(
+    r'"(?:\\.|[^"\\\n])*"'    # Double-quoted strings
+    r"|'(?:\\.|[^'\\\n])*'"   # Single-quoted strings
+    r'|`(?:\\.|[^`\\])*`'     # Template literals
+    r'|//[^\n]*'              # Line comments
+    r'|/\*.*?\*/'             # Block comments
+    r'|[{}]',
+    re.DOTALL
+)
+
+# AST fields that may lead to function definitions, per ESTree node type.
+# Node types without an entry (identifiers, literals, imports) are leaves.
+_CHILD_FIELDS = {
+    'Program': ('body',),
+    'BlockStatement': ('body',),
+    'ExpressionStatement': ('expression',),
+    'IfStatement': ('test', 'consequent', 'alternate'),
+    'LabeledStatement': ('body',),
+    'WithStatement': ('object', 'body'),
+    'SwitchStatement': ('discriminant', 'cases'),
+    'SwitchCase': ('test', 'consequent'),
+    'ReturnStatement': ('argument',),
+    'ThrowStatement': ('argument',),
+    'TryStatement': ('block', 'handler', 'finalizer'),
+    'CatchClause': ('param', 'body'),
+    'WhileStatement': ('test', 'body'),
+    'DoWhileStatement': ('body', 'test'),
+    'ForStatement': ('init', 'test', 'update', 'body'),
+    'ForInStatement': ('left', 'right', 'body'),
+    'ForOfStatement': ('left', 'right', 'body'),
+    'FunctionDeclaration': ('params', 'body'),
+    'FunctionExpression': ('params', 'body'),
+    'ArrowFunctionExpression': ('params', 'body'),
+    'VariableDeclaration': ('declarations',),
+    'VariableDeclarator': ('id', 'init'),
+    'ClassDeclaration': ('superClass', 'body'),
+    'ClassExpression': ('superClass', 'body'),
+    'ClassBody': ('body',),
+    'MethodDefinition': ('key', 'value'),
+    'Property': ('key', 'value'),
+    'ArrayExpression': ('elements',),
+    'ObjectExpression': ('properties',),
+    'UnaryExpression': ('argument',),
+    'UpdateExpression': ('argument',),
+    'BinaryExpression': ('left', 'right'),
+    'LogicalExpression': ('left', 'right'),
+    'AssignmentExpression': ('left', 'right'),
+    'ConditionalExpression': ('test', 'consequent', 'alternate'),
+    'CallExpression': ('callee', 'arguments'),
+    'NewExpression': ('callee', 'arguments'),
+    'MemberExpression': ('object', 'property'),
+    'SequenceExpression': ('expressions',),
+    'TemplateLiteral': ('expressions',),
+    'TaggedTemplateExpression': ('tag', 'quasi'),
+    'SpreadElement': ('argument',),
+    'RestElement': ('argument',),
+    'YieldExpression': ('argument',),
+    'AwaitExpression': ('argument',),
+    'AssignmentPattern': ('left', 'right'),
+    'ObjectPattern': ('properties',),
+    'ArrayPattern': ('elements',),
+    'ExportNamedDeclaration': ('declaration',),
+    'ExportDefaultDeclaration': ('declaration',),
+}
+
+# JSDoc helpers
+_JSDOC_STRIP_RE = re.compile(r'^[^\S\n]*(?:\*[^\S\n]?)?', re.MULTILINE)  # Indent and leading "* " per line
+_JSDOC_BLOCK_RE = re.compile(r'/\*\*.*?\*/', re.DOTALL)
+
+# Buffer size for reading source files
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Part of every analysis cache key; bump when extracted candidates change shape or content
+_CACHE_VERSION = '2'
+
+# Bounded LRU cache of extracted functions keyed by (source digest, file path, backend, version)
+_CACHE_MAX_ENTRIES = 1000
+_analysis_cache: "OrderedDict[Tuple[bytes, str, str, str], List[FunctionCandidate]]" = OrderedDict()
+
+
+def _source_digest(source: str) -> bytes:
+    """Compute a compact digest of the source text for cache lookups"""
+    return hashlib.blake2b(source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _get_cached_analysis(key: Tuple[bytes, str, str, str]) -> Optional[List[FunctionCandidate]]:
+    """Return copies of cached function candidates, or None on a cache miss"""
+    cached = _analysis_cache.get(key)
+    if cached is None:
+        return None
+    _analysis_cache.move_to_end(key)
+    return [copy.copy(function) for function in cached]
+
+
+def _store_cached_analysis(key: Tuple[bytes, str, str, str], functions: List[FunctionCandidate]):
+    """Store copies of function candidates, evicting the least recently used entry"""
+    _analysis_cache[key] = [copy.copy(function) for function in functions]
+    _analysis_cache.move_to_end(key)
+    if len(_analysis_cache) > _CACHE_MAX_ENTRIES:
+        _analysis_cache.popitem(last=False)
+
+
+def clear_analysis_cache():
+    """Drop all cached analysis results"""
+    _analysis_cache.clear()
+
+
+# Suggested location for the persistent on-disk analysis cache
+DEFAULT_DISK_CACHE_DIR = Path.home() / '.cache' / 'maverick-mcp' / 'js_analysis'
+
+
+def _disk_cache_prefix(file_path: str) -> str:
+    """File name prefix shared by all disk cache entries for a source file"""
+    return hashlib.sha1(os.path.abspath(file_path).encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _load_disk_cache(cache_path: Path) -> Optional[List[FunctionCandidate]]:
+    """Load cached function candidates, or None if the entry is missing or unreadable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Corrupt or incompatible entry, treat as a miss
+        return None
+
+
+def _store_disk_cache(cache_path: Path, functions: List[FunctionCandidate]):
+    """Atomically write cached function candidates and drop stale entries for the same file"""
+    cache_dir = cache_path.parent
+    prefix = cache_path.name.split('-', 1)[0]
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(functions, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        
+        # Earlier versions of this file can never be hit again
+        for stale in cache_dir.glob(f"{prefix}-*.pickle"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # The cache is best-effort
+        pass
+
+
+def _analyze_file_worker(file_path: str, cache_dir: Optional[str] = None) -> List[FunctionCandidate]:
+    """Analyze a single file in a worker process"""
+    return JavaScriptAnalyzer(cache_dir=cache_dir).analyze_file(file_path)
+
 
 class JavaScriptAnalyzer:
     """Analyzes JavaScript/TypeScript source code to extract function information"""
     
-    def __init__(self):
+    __slots__ = ('current_file', 'current_source', 'skipped_sources', 'failed_sources', 'cache_dir')
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Optional directory for a persistent analysis cache keyed by
+                file path, size, mtime, parser backend and cache version
+                (e.g. DEFAULT_DISK_CACHE_DIR)
+        """
         self.current_file = None
         self.current_source = None
+        self.skipped_sources = 0  # Sources skipped by the function-token pre-scan
+        self.failed_sources = 0  # Sources whose parsing raised, never cached
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def analyze_file(self, file_path: str) -> List[FunctionCandidate]:
         """
@@ -37,15 +269,71 @@ class JavaScriptAnalyzer:
             List of function candidates found in the file
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
+            stat = os.stat(file_path)
+            
+            # Empty files cannot contain functions
+            if stat.st_size == 0:
+                return []
+            
+            # Unchanged files are served from the persistent cache
+            cache_path = None
+            if self.cache_dir:
+                cache_path = self.cache_dir / (
+                    f"{_disk_cache_prefix(file_path)}-{_CACHE_VERSION}-{_backend_name(_get_parser_backend())}"
+                    f"-{stat.st_size}-{stat.st_mtime_ns}.pickle"
+                )
+                cached = _load_disk_cache(cache_path)
+                if cached is not None:
+                    return cached
+            
+            with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                source = f.read().decode('utf-8', errors='replace')
+            
+            failed_sources = self.failed_sources
+            functions = self.analyze_source(source, file_path)
             
-            return self.analyze_source(source, file_path)
+            # Only cache complete results for a file that did not change while it was being read
+            if (cache_path and self.failed_sources == failed_sources
+                    and os.stat(file_path).st_mtime_ns == stat.st_mtime_ns):
+                _store_disk_cache(cache_path, functions)
+            
+            return functions
         
         except Exception as e:
-            print(f"Error analyzing {file_path}: {e}")
+            logger.warning("Error analyzing %s: %s", file_path, e)
             return []
     
+    def analyze_files(
+        self,
+        file_paths: Iterable[str],
+        max_workers: Optional[int] = None
+    ) -> Iterator[FunctionCandidate]:
+        """
+        Analyze several JavaScript/TypeScript files across worker processes
+        
+        Args:
+            file_paths: Paths to the JS/TS files
+            max_workers: Maximum number of worker processes (defaults to CPU count)
+            
+        Yields:
+            Function candidates, grouped by file in input order
+        """
+        file_paths = list(file_paths)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        
+        # Parsing is pure Python, so only processes (not threads) run in parallel
+        if max_workers == 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield from self.analyze_file(file_path)
+            return
+        
+        cache_dir = str(self.cache_dir) if self.cache_dir else None
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for functions in executor.map(_analyze_file_worker, file_paths, repeat(cache_dir),
+                                          chunksize=16):
+                yield from functions
+    
     def analyze_source(self, source: str, file_path: str = "") -> List[FunctionCandidate]:
         """
         Analyze JavaScript/TypeScript source code and extract function candidates
@@ -60,176 +348,208 @@ class JavaScriptAnalyzer:
         self.current_file = file_path
         self.current_source = source
         
+        # Sources without any function-like token cannot yield candidates
+        if not _HAS_FUNCTION_RE.search(source):
+            self.skipped_sources += 1
+            return []
+        
+        # Unchanged sources skip parsing entirely
+        backend = _get_parser_backend()
+        cache_key = (_source_digest(source), file_path, _backend_name(backend), _CACHE_VERSION)
+        cached = _get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            if HAS_ESPRIMA:
-                # Try parsing as ES6 module first
-                try:
-                    ast = esprima.parseModule(source, 
-                                            tolerant=True,
-                                            attachComments=True,
-                                            range=True)
-                except:
-                    # Fallback to script parsing for non-module code
-                    ast = esprima.parseScript(source, 
-                                            tolerant=True,
-                                            attachComments=True,
-                                            range=True)
-                
+            if backend is not None:
+                ast = backend.parse(source)
                 visitor = JavaScriptFunctionVisitor(source, file_path)
-                return visitor.extract_functions(ast)
+                functions = visitor.extract_functions(ast)
             else:
                 # Use regex fallback parser
                 fallback_parser = JavaScriptRegexParser(source, file_path)
-                return fallback_parser.extract_functions()
+                functions = fallback_parser.extract_functions()
+            
+            _store_cached_analysis(cache_key, functions)
+            return functions
         
         except Exception as e:
-            print(f"Error parsing JavaScript/TypeScript {file_path}: {e}")
+            self.failed_sources += 1
+            logger.warning("Error parsing JavaScript/TypeScript %s: %s", file_path, e)
             return []
 
 
 class JavaScriptFunctionVisitor:
     """Extracts function information from JavaScript/TypeScript AST"""
     
+    __slots__ = (
+        'source', 'file_path', '_source_lines', 'functions', 'class_stack',
+        '_jsdoc_cache', '_handlers', '_processed_nodes'
+    )
+    
     def __init__(self, source: str, file_path: str):
         self.source = source
         self.file_path = file_path
-        self.source_lines = source.split('\n')
+        self._source_lines = None  # Split lazily, only line-based fallbacks need it
         self.functions = []
         self.class_stack = []  # Track nested classes
+        self._jsdoc_cache: Dict[int, Optional[str]] = {}  # id(node) -> cleaned JSDoc
+        self._processed_nodes = set()  # id(node) of functions already turned into candidates
+        
+        # Node type -> handler
+        self._handlers = {
+            sys.intern('ClassDeclaration'): self._visit_class,
+            sys.intern('FunctionDeclaration'): self._process_function_declaration,
+            sys.intern('VariableDeclaration'): self._visit_variable_declaration,
+            sys.intern('ExpressionStatement'): self._visit_expression_statement,
+            sys.intern('ExportNamedDeclaration'): self._visit_export_declaration,
+            sys.intern('ExportDefaultDeclaration'): self._visit_export_declaration,
+        }
+    
+    @property
+    def source_lines(self) -> List[str]:
+        """Source split into lines, computed on first use"""
+        if self._source_lines is None:
+            self._source_lines = self.source.split('\n')
+        return self._source_lines
     
     def extract_functions(self, ast) -> List[FunctionCandidate]:
         """Extract functions from the AST"""
+        return list(self.iter_functions(ast))
+    
+    def iter_functions(self, ast) -> Iterator[FunctionCandidate]:
+        """Yield functions from the AST as the walk reaches them"""
         self.functions = []
-        self._visit_node(ast)
-        return self.functions
+        self._jsdoc_cache.clear()
+        self._processed_nodes.clear()
+        yield from self._visit_node(ast)
     
-    def _visit_node(self, node):
-        """Visit AST node and extract function information"""
-        if not hasattr(node, 'type'):
-            return
-        
-        # Handle different node types
-        if node.type == 'Program':
-            for child in getattr(node, 'body', []):
-                self._visit_node(child)
-                
-        elif node.type == 'ClassDeclaration':
-            self._visit_class(node)
-            
-        elif node.type == 'FunctionDeclaration':
-            self._process_function_declaration(node)
-            
-        elif node.type == 'VariableDeclaration':
-            self._visit_variable_declaration(node)
-            
-        elif node.type == 'ExpressionStatement':
-            self._visit_expression_statement(node)
+    def _visit_node(self, root) -> Iterator[FunctionCandidate]:
+        """Walk the AST in pre-order using an explicit stack, yielding function information"""
+        handlers = self._handlers
+        # Handlers append candidates here; drained after each one so nothing accumulates
+        functions = self.functions
+        stack = [root]
+        
+        while stack:
+            node = stack.pop()
+            node_type = node.type
             
-        elif node.type == 'ExportNamedDeclaration' or node.type == 'ExportDefaultDeclaration':
-            self._visit_export_declaration(node)
+            handler = handlers.get(node_type)
+            if handler:
+                handler(node)
+                if functions:
+                    yield from functions
+                    functions.clear()
             
-        # Recursively visit child nodes
-        for key, value in vars(node).items():
-            if isinstance(value, list):
-                for child in value:
-                    if hasattr(child, 'type'):
-                        self._visit_node(child)
-            elif hasattr(value, 'type'):
-                self._visit_node(value)
+            # Queue child nodes, reversed so they are visited in source order
+            children = []
+            for field in _CHILD_FIELDS.get(node_type, ()):
+                value = getattr(node, field, None)
+                if isinstance(value, list):
+                    children.extend(child for child in value if child is not None)
+                elif value is not None:
+                    children.append(value)
+            stack.extend(reversed(children))
     
     def _visit_class(self, node):
         """Visit class declaration"""
-        class_name = getattr(node, 'id', {}).get('name', 'AnonymousClass')
+        class_name = node.id.name if node.id else _ANONYMOUS_CLASS
         self.class_stack.append(class_name)
         
         # Visit class body for methods
-        class_body = getattr(node, 'body', {})
-        for method in getattr(class_body, 'body', []):
+        for method in node.body.body:
             if method.type == 'MethodDefinition':
                 self._process_method(method, class_name)
         
         self.class_stack.pop()
     
-    def _visit_variable_declaration(self, node):
+    def _visit_variable_declaration(self, node, is_export=False, doc_node=None):
         """Visit variable declarations to find arrow functions"""
-        for declarator in getattr(node, 'declarations', []):
-            if hasattr(declarator, 'init') and declarator.init:
-                if declarator.init.type == 'ArrowFunctionExpression':
-                    func_name = getattr(declarator, 'id', {}).get('name', 'anonymous')
-                    self._process_arrow_function(declarator.init, func_name)
+        # esprima attaches leading comments to the declaration statement
+        doc_node = doc_node or node
+        for declarator in node.declarations:
+            init = declarator.init
+            if init and init.type == 'ArrowFunctionExpression':
+                func_name = declarator.id.name or _ANONYMOUS
+                self._process_arrow_function(init, func_name, is_export=is_export, doc_node=doc_node)
     
     def _visit_expression_statement(self, node):
         """Visit expression statements to find function expressions"""
-        expr = getattr(node, 'expression', {})
+        expr = node.expression
         if expr.type == 'AssignmentExpression':
-            left = getattr(expr, 'left', {})
-            right = getattr(expr, 'right', {})
+            right = expr.right
+            right_type = right.type
             
-            if right.type in ('FunctionExpression', 'ArrowFunctionExpression'):
-                func_name = self._extract_assignment_name(left)
-                if right.type == 'ArrowFunctionExpression':
-                    self._process_arrow_function(right, func_name)
+            if right_type in ('FunctionExpression', 'ArrowFunctionExpression'):
+                func_name = self._extract_assignment_name(expr.left)
+                if right_type == 'ArrowFunctionExpression':
+                    self._process_arrow_function(right, func_name, doc_node=node)
                 else:
-                    self._process_function_expression(right, func_name)
+                    self._process_function_expression(right, func_name, doc_node=node)
     
     def _visit_export_declaration(self, node):
         """Visit export declarations"""
-        declaration = getattr(node, 'declaration', None)
+        declaration = node.declaration
         if declaration:
             if declaration.type == 'FunctionDeclaration':
-                self._process_function_declaration(declaration, is_export=True)
+                self._process_function_declaration(declaration, is_export=True, doc_node=node)
             elif declaration.type == 'VariableDeclaration':
                 # Handle export const myFunc = () => {}
-                for declarator in getattr(declaration, 'declarations', []):
-                    if hasattr(declarator, 'init') and declarator.init:
-                        if declarator.init.type == 'ArrowFunctionExpression':
-                            func_name = getattr(declarator, 'id', {}).get('name', 'anonymous')
-                            self._process_arrow_function(declarator.init, func_name, is_export=True)
+                self._visit_variable_declaration(declaration, is_export=True, doc_node=node)
     
-    def _process_function_declaration(self, node, is_export=False):
+    def _process_function_declaration(self, node, is_export=False, doc_node=None):
         """Process function declaration"""
-        func_name = getattr(node, 'id', {}).get('name', 'anonymous')
+        func_name = node.id.name if node.id else _ANONYMOUS
+        doc_node = doc_node or node
         
         # Skip if private function (starting with _) and no substantial docs
-        if func_name.startswith('_') and not self._has_substantial_jsdoc(node):
+        if func_name.startswith('_') and not self._has_substantial_jsdoc(doc_node):
             return
         
-        self._create_function_candidate(node, func_name, is_export=is_export)
+        self._create_function_candidate(node, func_name, is_export=is_export, doc_node=doc_node)
     
     def _process_method(self, node, class_name):
         """Process class method"""
-        method_key = getattr(node, 'key', {})
-        method_name = getattr(method_key, 'name', 'anonymous')
-        func_node = getattr(node, 'value', {})
+        method_name = node.key.name or _ANONYMOUS
         
         # Skip private methods unless they have good docs
-        if method_name.startswith('_') and not self._has_substantial_jsdoc(func_node):
+        if method_name.startswith('_') and not self._has_substantial_jsdoc(node):
             return
         
-        self._create_function_candidate(func_node, method_name, class_name=class_name)
+        self._create_function_candidate(node.value, method_name, class_name=class_name, doc_node=node)
     
-    def _process_arrow_function(self, node, func_name, is_export=False):
+    def _process_arrow_function(self, node, func_name, is_export=False, doc_node=None):
         """Process arrow function"""
-        if func_name.startswith('_') and not self._has_substantial_jsdoc(node):
+        doc_node = doc_node or node
+        if func_name.startswith('_') and not self._has_substantial_jsdoc(doc_node):
             return
         
-        self._create_function_candidate(node, func_name, is_arrow=True, is_export=is_export)
+        self._create_function_candidate(node, func_name, is_arrow=True, is_export=is_export, doc_node=doc_node)
     
-    def _process_function_expression(self, node, func_name):
+    def _process_function_expression(self, node, func_name, doc_node=None):
         """Process function expression"""
-        if func_name.startswith('_') and not self._has_substantial_jsdoc(node):
+        doc_node = doc_node or node
+        if func_name.startswith('_') and not self._has_substantial_jsdoc(doc_node):
             return
         
-        self._create_function_candidate(node, func_name)
+        self._create_function_candidate(node, func_name, doc_node=doc_node)
     
-    def _create_function_candidate(self, node, func_name, class_name=None, is_arrow=False, is_export=False):
+    def _create_function_candidate(self, node, func_name, class_name=None, is_arrow=False, is_export=False,
+                                   doc_node=None):
         """Create a FunctionCandidate from the AST node"""
         
+        # Exported declarations are reached both from the export and directly
+        node_id = id(node)
+        if node_id in self._processed_nodes:
+            return
+        self._processed_nodes.add(node_id)
+        
         # Extract function source code
         source_code = self._extract_function_source(node)
         
         # Extract JSDoc comment
-        docstring = self._extract_jsdoc(node)
+        docstring = self._extract_jsdoc(doc_node or node)
         
         # Extract parameters
         parameters = self._extract_parameters(node)
@@ -237,17 +557,14 @@ class JavaScriptFunctionVisitor:
         # Extract return type (TypeScript)
         return_type = self._extract_return_type(node)
         
-        # Determine if async
-        is_async = getattr(node, 'async', False)
-        
         # Get line number
-        line_number = getattr(node, 'loc', {}).get('start', {}).get('line', 1)
+        line_number = self._extract_line_number(node)
         
         # Create function candidate
         function = FunctionCandidate(
             function_name=func_name,
             file_path=self.file_path,
-            language='javascript',
+            language=_LANG_JS,
             line_number=line_number,
             source_code=source_code,
             docstring=docstring,
@@ -259,24 +576,33 @@ class JavaScriptFunctionVisitor:
         
         self.functions.append(function)
     
+    def _extract_line_number(self, node) -> int:
+        """Get the 1-based line a function starts on"""
+        loc = node.loc
+        if loc:
+            return loc.start.line
+        
+        node_range = node.range
+        if node_range:
+            return self.source.count('\n', 0, node_range[0]) + 1
+        
+        return 1
+    
     def _extract_function_source(self, node) -> str:
         """Extract the complete source code for a function"""
         try:
             # Get the range from the AST node
-            node_range = getattr(node, 'range', None)
+            node_range = node.range
             if node_range:
                 start_idx, end_idx = node_range
                 return self.source[start_idx:end_idx]
             
             # Fallback: try to extract based on line numbers
-            loc = getattr(node, 'loc', {})
-            start_line = loc.get('start', {}).get('line', 1)
-            end_line = loc.get('end', {}).get('line', start_line)
-            
-            if start_line and end_line:
+            loc = node.loc
+            if loc:
                 # Convert to 0-based indexing
-                start_idx = start_line - 1
-                end_idx = end_line
+                start_idx = loc.start.line - 1
+                end_idx = loc.end.line
                 
                 function_lines = self.source_lines[start_idx:end_idx]
                 return '\n'.join(function_lines)
@@ -285,32 +611,33 @@ class JavaScriptFunctionVisitor:
             pass
         
         # Final fallback
-        return f"function {getattr(node, 'id', {}).get('name', 'anonymous')}() {{ /* source extraction failed */ }}"
+        func_name = node.id.name if node.id else _ANONYMOUS
+        return f"function {func_name}() {{ /* source extraction failed */ }}"
     
     def _extract_jsdoc(self, node) -> Optional[str]:
-        """Extract JSDoc comment from function"""
-        # Try to find leading comments
-        comments = getattr(node, 'leadingComments', [])
-        for comment in comments:
-            comment_value = getattr(comment, 'value', '')
+        """Extract JSDoc comment from function, memoized per node"""
+        node_id = id(node)
+        if node_id in self._jsdoc_cache:
+            return self._jsdoc_cache[node_id]
+        
+        docstring = None
+        
+        # Try to find leading comments, closest to the function first
+        for comment in reversed(node.leadingComments or ()):
+            comment_value = comment.value or ''
             if comment_value.startswith('*'):
                 # This is likely a JSDoc comment
-                return self._clean_jsdoc(comment_value)
+                docstring = self._clean_jsdoc(comment_value)
+                break
         
-        return None
+        self._jsdoc_cache[node_id] = docstring
+        return docstring
     
     def _clean_jsdoc(self, jsdoc_raw: str) -> str:
         """Clean JSDoc comment for better readability"""
-        lines = jsdoc_raw.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove leading * and whitespace
-            clean_line = re.sub(r'^\s*\*\s?', '', line.strip())
-            if clean_line:
-                cleaned_lines.append(clean_line)
-        
-        return '\n'.join(cleaned_lines)
+        # Strip leading "* " from every line in one pass, then drop blank lines
+        cleaned = _JSDOC_STRIP_RE.sub('', jsdoc_raw)
+        return '\n'.join(filter(None, map(str.rstrip, cleaned.split('\n'))))
     
     def _has_substantial_jsdoc(self, node) -> bool:
         """Check if function has substantial JSDoc documentation"""
@@ -326,9 +653,7 @@ class JavaScriptFunctionVisitor:
         """Extract function parameters with type information"""
         parameters = []
         
-        params = getattr(node, 'params', [])
-        
-        for param in params:
+        for param in node.params or ():
             param_info = self._parse_parameter(param)
             if param_info:
                 parameters.append(param_info)
@@ -337,11 +662,11 @@ class JavaScriptFunctionVisitor:
     
     def _parse_parameter(self, param) -> Optional[FunctionParameter]:
         """Parse individual parameter"""
-        param_type = getattr(param, 'type', '')
+        param_type = param.type
         
         if param_type == 'Identifier':
             # Simple parameter: function(param)
-            param_name = getattr(param, 'name', 'unknown')
+            param_name = param.name or _UNKNOWN
             return FunctionParameter(
                 name=param_name,
                 type_hint=None,
@@ -350,11 +675,8 @@ class JavaScriptFunctionVisitor:
         
         elif param_type == 'AssignmentPattern':
             # Parameter with default value: function(param = default)
-            left = getattr(param, 'left', {})
-            right = getattr(param, 'right', {})
-            
-            param_name = getattr(left, 'name', 'unknown')
-            default_value = self._extract_default_value(right)
+            param_name = param.left.name or _UNKNOWN
+            default_value = self._extract_default_value(param.right)
             
             return FunctionParameter(
                 name=param_name,
@@ -365,8 +687,7 @@ class JavaScriptFunctionVisitor:
         
         elif param_type == 'RestElement':
             # Rest parameter: function(...args)
-            argument = getattr(param, 'argument', {})
-            param_name = getattr(argument, 'name', 'unknown')
+            param_name = param.argument.name or _UNKNOWN
             return FunctionParameter(
                 name=f"...{param_name}",
                 type_hint='Array',
@@ -376,7 +697,7 @@ class JavaScriptFunctionVisitor:
         elif param_type == 'ObjectPattern':
             # Destructured object parameter: function({a, b})
             return FunctionParameter(
-                name="destructured_object",
+                name=_DESTRUCTURED_OBJECT,
                 type_hint='Object',
                 required=True
             )
@@ -384,7 +705,7 @@ class JavaScriptFunctionVisitor:
         elif param_type == 'ArrayPattern':
             # Destructured array parameter: function([a, b])
             return FunctionParameter(
-                name="destructured_array",
+                name=_DESTRUCTURED_ARRAY,
                 type_hint='Array',
                 required=True
             )
@@ -396,16 +717,16 @@ class JavaScriptFunctionVisitor:
         if not default_node:
             return "undefined"
         
-        node_type = getattr(default_node, 'type', '')
+        node_type = default_node.type
         
         if node_type == 'Literal':
-            value = getattr(default_node, 'value', None)
+            value = default_node.value
             if isinstance(value, str):
                 return f'"{value}"'
             return str(value)
         
         elif node_type == 'Identifier':
-            return getattr(default_node, 'name', 'undefined')
+            return default_node.name or 'undefined'
         
         elif node_type == 'ArrayExpression':
             return "[]"
@@ -418,7 +739,7 @@ class JavaScriptFunctionVisitor:
     def _extract_return_type(self, node) -> Optional[str]:
         """Extract return type hint (TypeScript)"""
         # TypeScript return type annotation
-        return_type = getattr(node, 'returnType', None)
+        return_type = node.returnType
         if return_type:
             # This would be a TypeScript type annotation
             return str(return_type)
@@ -427,15 +748,16 @@ class JavaScriptFunctionVisitor:
     
     def _extract_assignment_name(self, left_node) -> str:
         """Extract function name from assignment expression"""
-        if getattr(left_node, 'type', '') == 'Identifier':
-            return getattr(left_node, 'name', 'anonymous')
+        left_type = left_node.type
         
-        elif getattr(left_node, 'type', '') == 'MemberExpression':
+        if left_type == 'Identifier':
+            return left_node.name or _ANONYMOUS
+        
+        elif left_type == 'MemberExpression':
             # Handle cases like module.exports.funcName or obj.method
-            property_node = getattr(left_node, 'property', {})
-            return getattr(property_node, 'name', 'anonymous')
+            return left_node.property.name or _ANONYMOUS
         
-        return 'anonymous'
+        return _ANONYMOUS
     
     def _extract_module_name(self) -> Optional[str]:
         """Extract module name from file path"""
@@ -446,79 +768,420 @@ class JavaScriptFunctionVisitor:
         return path.stem
 
 
+class _Backend(Protocol):
+    """A JavaScript parser producing ESTree-shaped nodes for JavaScriptFunctionVisitor"""
+    
+    name: str
+    
+    def parse(self, source: str) -> Any:
+        ...
+
+
+class EsprimaBackend:
+    """Pure-Python esprima parser backend"""
+    
+    __slots__ = ()
+    
+    name = 'esprima'
+    
+    def parse(self, source: str):
+        """Parse source with the parser its import/export usage suggests, falling back to the other"""
+        if _MODULE_HINT_RE.search(source):
+            parse, fallback = esprima.parseModule, esprima.parseScript
+        else:
+            parse, fallback = esprima.parseScript, esprima.parseModule
+        
+        try:
+            return parse(source, tolerant=True, attachComment=True, range=True)
+        except esprima.Error:
+            return fallback(source, tolerant=True, attachComment=True, range=True)
+
+
+class TreeSitterBackend:
+    """Compiled tree-sitter parser backend exposing ESTree-shaped node shims"""
+    
+    __slots__ = ('parser',)
+    
+    name = 'tree-sitter'
+    
+    def __init__(self):
+        with warnings.catch_warnings():
+            # tree_sitter_languages still loads grammars through a deprecated API
+            warnings.simplefilter('ignore', FutureWarning)
+            self.parser = get_tree_sitter_parser('javascript')
+    
+    def parse(self, source: str) -> '_TreeSitterNode':
+        """Parse source and return the shim for the program node"""
+        source_bytes = source.encode('utf-8')
+        tree = self.parser.parse(source_bytes)
+        return _TreeSitterContext(source, source_bytes).wrap(tree.root_node)
+
+
+# tree-sitter node types mapped onto the ESTree types the visitor dispatches on;
+# unlisted types become BlockStatement so nested functions stay reachable
+_TREE_SITTER_TYPES = {
+    'program': 'Program',
+    'statement_block': 'BlockStatement',
+    'function_declaration': 'FunctionDeclaration',
+    'generator_function_declaration': 'FunctionDeclaration',
+    'function': 'FunctionExpression',
+    'function_expression': 'FunctionExpression',
+    'generator_function': 'FunctionExpression',
+    'arrow_function': 'ArrowFunctionExpression',
+    'class_declaration': 'ClassDeclaration',
+    'class': 'ClassExpression',
+    'class_body': 'ClassBody',
+    'method_definition': 'MethodDefinition',
+    'lexical_declaration': 'VariableDeclaration',
+    'variable_declaration': 'VariableDeclaration',
+    'variable_declarator': 'VariableDeclarator',
+    'expression_statement': 'ExpressionStatement',
+    'assignment_expression': 'AssignmentExpression',
+    'member_expression': 'MemberExpression',
+    'subscript_expression': 'MemberExpression',
+    'identifier': 'Identifier',
+    'property_identifier': 'Identifier',
+    'shorthand_property_identifier': 'Identifier',
+    'undefined': 'Identifier',
+    'assignment_pattern': 'AssignmentPattern',
+    'rest_pattern': 'RestElement',
+    'object_pattern': 'ObjectPattern',
+    'array_pattern': 'ArrayPattern',
+    'array': 'ArrayExpression',
+    'object': 'ObjectExpression',
+    'number': 'Literal',
+    'string': 'Literal',
+    'true': 'Literal',
+    'false': 'Literal',
+    'null': 'Literal',
+}
+
+_TREE_SITTER_LITERALS = {'true': True, 'false': False, 'null': None}
+
+# Expression node types of an `export default` value that esprima reports as declarations
+_TREE_SITTER_DEFAULT_DECLARATIONS = {
+    'function': 'FunctionDeclaration',
+    'function_expression': 'FunctionDeclaration',
+    'generator_function': 'FunctionDeclaration',
+    'class': 'ClassDeclaration',
+}
+
+# ESTree attribute -> tree-sitter field name, for attributes that map one to one
+_TREE_SITTER_FIELDS = {
+    'id': 'name',
+    'key': 'name',
+    'init': 'value',
+    'left': 'left',
+    'right': 'right',
+    'object': 'object',
+}
+
+
+def _named_children(ts_node) -> list:
+    """Named children of a tree-sitter node, without comments"""
+    return [child for child in ts_node.named_children if child.type != 'comment']
+
+
+class _TreeSitterContext:
+    """Per-parse state shared by node shims: source text and offset conversion"""
+    
+    __slots__ = ('source', 'source_bytes', 'is_ascii', '_shims', '_line_starts', '_line_bytes')
+    
+    def __init__(self, source: str, source_bytes: bytes):
+        self.source = source
+        self.source_bytes = source_bytes
+        self.is_ascii = len(source) == len(source_bytes)
+        self._shims = {}
+        self._line_starts = None
+        self._line_bytes = None
+    
+    def wrap(self, ts_node, node_type: Optional[str] = None) -> '_TreeSitterNode':
+        """Return the shim for a tree-sitter node, reusing it so node identity is stable"""
+        if node_type is None:
+            if ts_node.type == 'export_statement':
+                node_type = _resolve_export_type(ts_node)
+            else:
+                node_type = _TREE_SITTER_TYPES.get(ts_node.type, 'BlockStatement')
+        key = (ts_node.id, node_type)
+        shim = self._shims.get(key)
+        if shim is None:
+            shim = self._shims[key] = _TreeSitterNode(ts_node, self, node_type)
+        return shim
+    
+    def char_offset(self, byte_offset: int, point: Tuple[int, int]) -> int:
+        """Convert a tree-sitter byte position into a str index"""
+        if self.is_ascii:
+            return byte_offset
+        
+        if self._line_starts is None:
+            lines = self.source.split('\n')
+            self._line_starts = [0]
+            for line in lines[:-1]:
+                self._line_starts.append(self._line_starts[-1] + len(line) + 1)
+            self._line_bytes = self.source_bytes.split(b'\n')
+        
+        row, column = point
+        return self._line_starts[row] + len(self._line_bytes[row][:column].decode('utf-8', 'replace'))
+
+
+class _TreeSitterNode:
+    """ESTree-compatible view of a tree-sitter node; unknown attributes are None like esprima's"""
+    
+    __slots__ = ('node', 'context', 'type')
+    
+    def __init__(self, node, context: _TreeSitterContext, node_type: str):
+        self.node = node
+        self.context = context
+        self.type = node_type
+    
+    def __getattr__(self, name):
+        getter = _TREE_SITTER_GETTERS.get(name)
+        return getter(self) if getter else None
+    
+    def _wrap_field(self, field: str) -> Optional['_TreeSitterNode']:
+        child = self.node.child_by_field_name(field)
+        return self.context.wrap(child) if child is not None else None
+    
+    def _get_mapped_field(self, name: str) -> Optional['_TreeSitterNode']:
+        return self._wrap_field(_TREE_SITTER_FIELDS[name])
+    
+    def _get_body(self):
+        if self.type in ('FunctionDeclaration', 'FunctionExpression', 'ArrowFunctionExpression',
+                         'ClassDeclaration', 'ClassExpression'):
+            return self._wrap_field('body')
+        wrap = self.context.wrap
+        return [wrap(child) for child in _named_children(self.node)]
+    
+    def _get_params(self) -> list:
+        single = self.node.child_by_field_name('parameter')
+        if single is not None:
+            # Arrow functions with one unparenthesized parameter
+            return [self.context.wrap(single)]
+        params = self.node.child_by_field_name('parameters')
+        if params is None:
+            return []
+        wrap = self.context.wrap
+        return [wrap(child) for child in _named_children(params)]
+    
+    def _get_value(self):
+        if self.type == 'MethodDefinition':
+            # The method node doubles as its own function expression
+            return self.context.wrap(self.node, 'FunctionExpression')
+        if self.type == 'Literal':
+            text = self.node.text.decode('utf-8', 'replace')
+            node_type = self.node.type
+            if node_type in _TREE_SITTER_LITERALS:
+                return _TREE_SITTER_LITERALS[node_type]
+            if node_type == 'string':
+                return text[1:-1]
+            try:
+                return int(text)
+            except ValueError:
+                try:
+                    return float(text)
+                except ValueError:
+                    return text
+        return None
+    
+    def _get_name(self) -> Optional[str]:
+        if self.type == 'Identifier':
+            # Identifiers repeat across candidates (param names, methods); share one copy
+            return sys.intern(self.node.text.decode('utf-8', 'replace'))
+        return None
+    
+    def _get_property(self):
+        # Computed members (obj[key]) keep the key under 'index'
+        return self._wrap_field('property') or self._wrap_field('index')
+    
+    def _get_declarations(self) -> list:
+        wrap = self.context.wrap
+        return [wrap(child) for child in self.node.named_children if child.type == 'variable_declarator']
+    
+    def _get_declaration(self):
+        declaration = self.node.child_by_field_name('declaration')
+        if declaration is not None:
+            return self.context.wrap(declaration)
+        value = self.node.child_by_field_name('value')
+        if value is None:
+            return None
+        # ESTree makes anonymous default-exported functions and classes declarations
+        return self.context.wrap(value, _TREE_SITTER_DEFAULT_DECLARATIONS.get(value.type))
+    
+    def _get_expression(self):
+        children = _named_children(self.node)
+        return self.context.wrap(children[0]) if children else None
+    
+    def _get_argument(self):
+        children = _named_children(self.node)
+        return self.context.wrap(children[0]) if children else None
+    
+    def _get_super_class(self):
+        for child in self.node.named_children:
+            if child.type == 'class_heritage':
+                return self.context.wrap(child)
+        return None
+    
+    def _get_elements(self) -> list:
+        wrap = self.context.wrap
+        return [wrap(child) for child in _named_children(self.node)]
+    
+    def _get_range(self) -> Tuple[int, int]:
+        node = self.node
+        start = node
+        if self.type == 'FunctionExpression' and node.type == 'method_definition':
+            # Like esprima, a method's function starts at its parameter list
+            start = node.child_by_field_name('parameters') or node
+        char_offset = self.context.char_offset
+        return (char_offset(start.start_byte, start.start_point),
+                char_offset(node.end_byte, node.end_point))
+    
+    def _get_loc(self) -> SimpleNamespace:
+        node = self.node
+        return SimpleNamespace(start=SimpleNamespace(line=node.start_point[0] + 1),
+                               end=SimpleNamespace(line=node.end_point[0] + 1))
+    
+    def _get_leading_comments(self) -> list:
+        # Comments are siblings in tree-sitter; collect the run right before this node
+        comments = []
+        sibling = self.node.prev_sibling
+        while sibling is not None and sibling.type == 'comment':
+            text = sibling.text.decode('utf-8', 'replace')
+            if text.startswith('/*'):
+                comments.append(SimpleNamespace(type='Block', value=text[2:-2]))
+            else:
+                comments.append(SimpleNamespace(type='Line', value=text[2:]))
+            sibling = sibling.prev_sibling
+        comments.reverse()
+        return comments
+
+
+def _resolve_export_type(ts_node) -> str:
+    """Split tree-sitter export statements into the two ESTree export types"""
+    for child in ts_node.children:
+        if child.type == 'default':
+            return 'ExportDefaultDeclaration'
+    return 'ExportNamedDeclaration'
+
+
+_TREE_SITTER_GETTERS = {
+    'body': _TreeSitterNode._get_body,
+    'params': _TreeSitterNode._get_params,
+    'value': _TreeSitterNode._get_value,
+    'name': _TreeSitterNode._get_name,
+    'property': _TreeSitterNode._get_property,
+    'declarations': _TreeSitterNode._get_declarations,
+    'declaration': _TreeSitterNode._get_declaration,
+    'expression': _TreeSitterNode._get_expression,
+    'argument': _TreeSitterNode._get_argument,
+    'superClass': _TreeSitterNode._get_super_class,
+    'elements': _TreeSitterNode._get_elements,
+    'properties': _TreeSitterNode._get_elements,
+    'range': _TreeSitterNode._get_range,
+    'loc': _TreeSitterNode._get_loc,
+    'leadingComments': _TreeSitterNode._get_leading_comments,
+}
+_TREE_SITTER_GETTERS.update(
+    (name, lambda shim, name=name: shim._get_mapped_field(name)) for name in _TREE_SITTER_FIELDS
+)
+
+_parser_backends: Dict[str, _Backend] = {}
+
+
+def _get_parser_backend() -> Optional[_Backend]:
+    """Return the fastest available parser backend, or None to use the regex parser"""
+    global HAS_TREE_SITTER
+    
+    if HAS_TREE_SITTER:
+        backend = _parser_backends.get('tree-sitter')
+        if backend is None:
+            try:
+                backend = _parser_backends['tree-sitter'] = TreeSitterBackend()
+            except Exception as e:
+                # Grammar bundles can be incompatible with the installed tree-sitter
+                logger.warning("tree-sitter parser unavailable (%s). Falling back to esprima.", e)
+                HAS_TREE_SITTER = False
+        if backend is not None:
+            return backend
+    
+    if HAS_ESPRIMA:
+        return _parser_backends.setdefault('esprima', EsprimaBackend())
+    
+    return None
+
+
+def _backend_name(backend: Optional[_Backend]) -> str:
+    """Name of a parser backend for cache keys, "regex" for the regex fallback parser"""
+    return backend.name if backend is not None else 'regex'
+
+
 class JavaScriptRegexParser:
     """Fallback regex-based JavaScript parser when esprima is not available"""
     
+    __slots__ = (
+        'source', 'file_path', '_source_lines', 'newline_offsets',
+        '_open_braces', '_brace_pairs'
+    )
+    
     def __init__(self, source: str, file_path: str):
         self.source = source
         self.file_path = file_path
-        self.source_lines = source.split('\n')
-        
+        self._source_lines = None  # Split lazily, only line-based fallbacks need it
+        # Sorted offsets of every newline, for O(log n) offset -> line lookups
+        self.newline_offsets = [match.start() for match in re.finditer('\n', source)]
+        # Code-level brace positions, indexed lazily by _index_braces
+        self._open_braces = None
+        self._brace_pairs = None
+        
+    @property
+    def source_lines(self) -> List[str]:
+        """Source split into lines, computed on first use"""
+        if self._source_lines is None:
+            self._source_lines = self.source.split('\n')
+        return self._source_lines
+    
     def extract_functions(self) -> List[FunctionCandidate]:
-        """Extract functions using regex patterns"""
-        functions = []
-        
-        # Function declaration patterns
-        patterns = [
-            # Regular function declarations: function name(params) { }
-            (r'function\s+(\w+)\s*\(([^)]*)\)\s*\{', 'function'),
-            # Arrow functions assigned to variables: const name = (params) => { }
-            (r'(?:const|let|var)\s+(\w+)\s*=\s*(?:\([^)]*\)|[^=])\s*=>', 'arrow'),
-            # Export function declarations: export function name(params) { }
-            (r'export\s+function\s+(\w+)\s*\(([^)]*)\)\s*\{', 'export_function'),
-            # Export arrow functions: export const name = (params) => { }
-            (r'export\s+(?:const|let)\s+(\w+)\s*=\s*(?:\([^)]*\)|[^=])\s*=>', 'export_arrow'),
-        ]
-        
-        for pattern, func_type in patterns:
-            matches = re.finditer(pattern, self.source, re.MULTILINE)
-            
-            for match in matches:
-                func_name = match.group(1)
-                
-                # Skip private functions
-                if func_name.startswith('_'):
-                    continue
-                
-                # Try to extract parameters
-                params_str = match.group(2) if match.lastindex >= 2 else ""
-                parameters = self._parse_parameters_regex(params_str)
-                
-                # Find line number
-                line_num = self.source[:match.start()].count('\n') + 1
-                
-                # Extract function source (basic approximation)
-                source_code = self._extract_function_source_regex(match, func_type)
-                
-                # Extract JSDoc comment if present
-                docstring = self._extract_jsdoc_regex(match.start())
-                
-                function = FunctionCandidate(
-                    function_name=func_name,
-                    file_path=self.file_path,
-                    language='javascript',
-                    line_number=line_num,
-                    source_code=source_code,
-                    docstring=docstring,
-                    parameters=parameters,
-                    return_type=None,  # Hard to detect with regex
-                    class_name=None,   # Hard to detect with regex
-                    module_name=Path(self.file_path).stem if self.file_path else None
-                )
-                
-                functions.append(function)
-        
-        # Deduplicate functions by name and file_path
-        unique_functions = []
+        """Extract functions using a single regex scan over the source"""
+        return list(self.iter_functions())
+    
+    def iter_functions(self) -> Iterator[FunctionCandidate]:
+        """Yield functions as the regex scan finds them"""
         seen = set()
         
-        for func in functions:
-            key = (func.function_name, func.file_path)
-            if key not in seen:
-                seen.add(key)
-                unique_functions.append(func)
-        
-        return unique_functions
+        for match in _FUNCTION_RE.finditer(self.source):
+            func_type = match.lastgroup
+            name_group, params_group = _FUNCTION_GROUPS[func_type]
+            func_name = match.group(name_group)
+            
+            # Skip private functions and names already found in this file
+            if func_name.startswith('_') or func_name in seen:
+                continue
+            seen.add(func_name)
+            
+            # Try to extract parameters
+            params_str = match.group(params_group) if params_group else ""
+            parameters = self._parse_parameters_regex(params_str)
+            
+            # Find line number
+            line_num = self._count_newlines(0, match.start()) + 1
+            
+            # Extract function source (basic approximation)
+            source_code = self._extract_function_source_regex(match, func_type)
+            
+            # Extract JSDoc comment if present
+            docstring = self._extract_jsdoc_regex(match.start())
+            
+            yield FunctionCandidate(
+                function_name=func_name,
+                file_path=self.file_path,
+                language=_LANG_JS,
+                line_number=line_num,
+                source_code=source_code,
+                docstring=docstring,
+                parameters=parameters,
+                return_type=None,  # Hard to detect with regex
+                class_name=None,   # Hard to detect with regex
+                module_name=Path(self.file_path).stem if self.file_path else None
+            )
     
     def _parse_parameters_regex(self, params_str: str) -> List[FunctionParameter]:
         """Parse parameter string using regex"""
@@ -552,7 +1215,7 @@ class JavaScriptRegexParser:
                 elif param_part.startswith('{') or param_part.startswith('['):
                     # Destructured parameters
                     parameters.append(FunctionParameter(
-                        name="destructured_param",
+                        name=_DESTRUCTURED_PARAM,
                         type_hint='Object' if param_part.startswith('{') else 'Array',
                         required=True
                     ))
@@ -565,49 +1228,62 @@ class JavaScriptRegexParser:
         
         return parameters
     
+    def _index_braces(self):
+        """Record every code-level opening brace and the offset of its matching close"""
+        open_braces = []
+        brace_pairs = {}
+        pending = []
+        
+        for token in _BRACE_TOKEN_RE.finditer(self.source):
+            text = token.group()
+            if text == '{':
+                open_braces.append(token.start())
+                pending.append(token.start())
+            elif text == '}' and pending:
+                brace_pairs[pending.pop()] = token.start()
+        
+        self._open_braces = open_braces
+        self._brace_pairs = brace_pairs
+    
     def _extract_function_source_regex(self, match, func_type: str) -> str:
         """Extract function source code using basic heuristics"""
         start_pos = match.start()
         
+        if self._open_braces is None:
+            self._index_braces()
+        
         # Find the opening brace
-        open_brace = self.source.find('{', start_pos)
-        if open_brace == -1:
+        brace_index = bisect.bisect_left(self._open_braces, start_pos)
+        if brace_index == len(self._open_braces):
             # Might be an arrow function without braces
             line_end = self.source.find('\n', start_pos)
             if line_end == -1:
                 return self.source[start_pos:]
             return self.source[start_pos:line_end]
         
-        # Find matching closing brace
-        brace_count = 0
-        pos = open_brace
-        
-        while pos < len(self.source):
-            if self.source[pos] == '{':
-                brace_count += 1
-            elif self.source[pos] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    return self.source[start_pos:pos + 1]
-            pos += 1
+        # Look up the matching closing brace
+        close_brace = self._brace_pairs.get(self._open_braces[brace_index])
+        if close_brace is not None:
+            return self.source[start_pos:close_brace + 1]
         
         # Fallback: return until end of file or reasonable limit
         end_pos = min(start_pos + 1000, len(self.source))
         return self.source[start_pos:end_pos]
     
+    def _count_newlines(self, start: int, end: int) -> int:
+        """Count newlines in self.source[start:end] using the newline offset table"""
+        return (bisect.bisect_left(self.newline_offsets, end) -
+                bisect.bisect_left(self.newline_offsets, start))
+    
     def _extract_jsdoc_regex(self, func_start_pos: int) -> Optional[str]:
         """Extract JSDoc comment before function using regex"""
-        # Look backward for JSDoc comment
-        before_func = self.source[:func_start_pos]
-        
         # Find the last JSDoc comment before this position
-        jsdoc_pattern = r'/\*\*.*?\*/'
-        matches = list(re.finditer(jsdoc_pattern, before_func, re.DOTALL))
+        matches = list(_JSDOC_BLOCK_RE.finditer(self.source, 0, func_start_pos))
         
         if matches:
             last_match = matches[-1]
             # Check if it's close to the function (within a few lines)
-            lines_between = before_func[last_match.end():].count('\n')
+            lines_between = self._count_newlines(last_match.end(), func_start_pos)
             if lines_between <= 3:  # Allow up to 3 lines between comment and function
                 comment_text = last_match.group(0)
                 # Clean up the comment
@@ -620,13 +1296,6 @@ class JavaScriptRegexParser:
         # Remove /** and */ wrapper
         content = jsdoc_raw[3:-2] if jsdoc_raw.startswith('/**') else jsdoc_raw[2:-2]
         
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove leading * and whitespace
-            clean_line = re.sub(r'^\s*\*\s?', '', line.strip())
-            if clean_line:
-                cleaned_lines.append(clean_line)
-        
-        return '\n'.join(cleaned_lines)
\ No newline at end of file
+        # Strip leading "* " from every line in one pass, then drop blank lines
+        cleaned = _JSDOC_STRIP_RE.sub('', content)
+        return '\n'.join(filter(None, map(str.rstrip, cleaned.split('\n'))))
\ No newline at end of file
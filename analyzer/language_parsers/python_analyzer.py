@@ -4,12 +4,69 @@ Python code analyzer using AST parsing
 
 import ast
 import inspect
-from typing import List, Optional, Dict, Any
+import io
+import logging
+import os
+import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Union
 from pathlib import Path
 import re
 
 from ..models import FunctionCandidate, FunctionParameter
 
+logger = logging.getLogger(__name__)
+
+# Shared by every candidate, interned once
+_LANG_PYTHON = sys.intern('python')
+
+# Statement-list fields, in _fields order; definitions never occur inside expressions
+_STATEMENT_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+# Constant types whose repr() matches ast.unparse()
+_SIMPLE_CONSTANT_TYPES = (str, int, bool, type(None))
+
+# Docstring mentions that make a one-line docstring substantial
+_DOCSTRING_KEYWORDS = ('param', 'arg', 'return', 'yield')
+
+
+def _simple_unparse(node: ast.AST) -> Optional[str]:
+    """
+    Render names, dotted names and plain literals without ast.unparse
+    
+    Args:
+        node: Annotation or default value expression
+        
+    Returns:
+        The same text ast.unparse would produce, or None for anything more complex
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Constant):
+        # u'' prefixes and float/complex spellings are left to ast.unparse
+        if node.kind is None and type(node.value) in _SIMPLE_CONSTANT_TYPES:
+            return repr(node.value)
+        return None
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return f"{node.value.id}.{node.attr}"
+    return None
+
+
+def _decode_source(data: bytes) -> str:
+    """Decode source bytes per their PEP 263 cookie or BOM, with universal newlines"""
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+    source = data.decode(encoding, errors='replace')
+    if '\r' in source:
+        # Match text-mode reads, so line offsets agree with AST line numbers
+        source = source.replace('\r\n', '\n').replace('\r', '\n')
+    return source
+
+
+def _analyze_file_worker(file_path: str) -> List[FunctionCandidate]:
+    """Analyze a single file in a worker process"""
+    return PythonAnalyzer().analyze_file(file_path)
+
 
 class PythonAnalyzer:
     """Analyzes Python source code to extract function information"""
@@ -29,21 +86,51 @@ class PythonAnalyzer:
             List of function candidates found in the file
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # Raw bytes: the parser honors coding cookies itself, without a text-mode decode
+            with open(file_path, 'rb') as f:
                 source = f.read()
             
             return self.analyze_source(source, file_path)
         
         except Exception as e:
-            print(f"Error analyzing {file_path}: {e}")
+            logger.warning("Error analyzing %s: %s", file_path, e)
             return []
     
-    def analyze_source(self, source: str, file_path: str = "") -> List[FunctionCandidate]:
+    def analyze_files(
+        self,
+        file_paths: Iterable[str],
+        max_workers: Optional[int] = None
+    ) -> Iterator[FunctionCandidate]:
+        """
+        Analyze several Python files across worker processes
+        
+        Args:
+            file_paths: Paths to the Python files
+            max_workers: Maximum number of worker processes (defaults to CPU count)
+            
+        Yields:
+            Function candidates, grouped by file in input order
+        """
+        file_paths = list(file_paths)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        
+        # Parsing and visiting hold the GIL, so only processes (not threads) run in parallel
+        if max_workers == 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield from self.analyze_file(file_path)
+            return
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for functions in executor.map(_analyze_file_worker, file_paths, chunksize=16):
+                yield from functions
+    
+    def analyze_source(self, source: Union[str, bytes], file_path: str = "") -> List[FunctionCandidate]:
         """
         Analyze Python source code and extract function candidates
         
         Args:
-            source: Python source code
+            source: Python source code, as text or undecoded file bytes
             file_path: Optional file path for reference
             
         Returns:
@@ -53,16 +140,24 @@ class PythonAnalyzer:
         self.current_source = source
         
         try:
-            tree = ast.parse(source)
+            # Plain AST compile with a fixed flag set: no inherited future flags,
+            # no type comments, and the real filename in syntax errors
+            tree = compile(source, file_path or '<string>', 'exec',
+                           flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+            
+            # Function source is sliced from text, decoded once the parse succeeded
+            if isinstance(source, bytes):
+                source = self.current_source = _decode_source(source)
+            
             visitor = PythonFunctionVisitor(source, file_path)
             visitor.visit(tree)
             return visitor.functions
         
         except SyntaxError as e:
-            print(f"Syntax error in {file_path}: {e}")
+            logger.warning("Syntax error in %s: %s", file_path, e)
             return []
         except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
+            logger.warning("Error parsing %s: %s", file_path, e)
             return []
 
 
@@ -72,9 +167,22 @@ class PythonFunctionVisitor(ast.NodeVisitor):
     def __init__(self, source: str, file_path: str):
         self.source = source
         self.file_path = file_path
-        self.source_lines = source.split('\n')
+        # Offset of each line start, so function source is a single slice of the text
+        self.line_offsets = [0]
+        self.line_offsets.extend(match.end() for match in re.finditer('\n', source))
         self.functions = []
         self.class_stack = []  # Track nested classes
+        # Same for every function in the file, so resolved once
+        module_name = self._extract_module_name()
+        self.module_name = sys.intern(module_name) if module_name else None
+    
+    def generic_visit(self, node: ast.AST):
+        """Descend through statement lists only, skipping expression subtrees"""
+        for field in _STATEMENT_FIELDS:
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                for child in children:
+                    self.visit(child)
     
     def visit_ClassDef(self, node: ast.ClassDef):
         """Track class context for methods"""
@@ -95,16 +203,17 @@ class PythonFunctionVisitor(ast.NodeVisitor):
     def _process_function(self, node: ast.FunctionDef, is_async: bool = False):
         """Process a function or method definition"""
         
-        # Skip private functions (starting with _) unless they have good docstrings
-        if node.name.startswith('_') and not self._has_substantial_docstring(node):
+        # Extract docstring; it is all the private-function filter needs
+        docstring = self._extract_docstring(node)
+        
+        # Skip private functions (starting with _) unless they have good docstrings,
+        # before any of the costlier extraction below
+        if node.name.startswith('_') and not self._is_substantial_docstring(docstring):
             return
         
         # Extract function source code
         source_code = self._extract_function_source(node)
         
-        # Extract docstring
-        docstring = self._extract_docstring(node)
-        
         # Extract parameters
         parameters = self._extract_parameters(node)
         
@@ -112,46 +221,34 @@ class PythonFunctionVisitor(ast.NodeVisitor):
         return_type = self._extract_return_type(node)
         
         # Determine class context
-        class_name = self.class_stack[-1] if self.class_stack else None
+        class_stack = self.class_stack
+        class_name = class_stack[-1] if class_stack else None
         
         # Create function candidate
-        function = FunctionCandidate(
+        self.functions.append(FunctionCandidate(
             function_name=node.name,
             file_path=self.file_path,
-            language='python',
+            language=_LANG_PYTHON,
             line_number=node.lineno,
             source_code=source_code,
             docstring=docstring,
             parameters=parameters,
             return_type=return_type,
             class_name=class_name,
-            module_name=self._extract_module_name()
-        )
-        
-        self.functions.append(function)
+            module_name=self.module_name
+        ))
     
     def _extract_function_source(self, node: ast.FunctionDef) -> str:
         """Extract the complete source code for a function"""
         try:
-            # Calculate the end line by finding the next function/class or end of file
-            end_line = len(self.source_lines)
-            
-            # Find the next top-level definition after this function
-            for other_node in ast.walk(ast.parse(self.source)):
-                if (isinstance(other_node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)) and
-                    other_node != node and 
-                    other_node.lineno > node.lineno):
-                    end_line = min(end_line, other_node.lineno - 1)
-            
-            # Extract the function source
-            start_line = node.lineno - 1  # Convert to 0-based indexing
-            function_lines = self.source_lines[start_line:end_line]
+            line_offsets = self.line_offsets
+            start = line_offsets[node.lineno - 1]
+            end_line = node.end_lineno
             
-            # Remove trailing empty lines
-            while function_lines and not function_lines[-1].strip():
-                function_lines.pop()
-            
-            return '\n'.join(function_lines)
+            if end_line >= len(line_offsets):
+                return self.source[start:]
+            # Stop before the newline ending the function's last line
+            return self.source[start:line_offsets[end_line] - 1]
         
         except Exception:
             # Fallback: return just the function signature
@@ -168,13 +265,19 @@ class PythonFunctionVisitor(ast.NodeVisitor):
     
     def _has_substantial_docstring(self, node: ast.FunctionDef) -> bool:
         """Check if function has a substantial docstring (more than just a title)"""
-        docstring = self._extract_docstring(node)
+        return self._is_substantial_docstring(self._extract_docstring(node))
+    
+    @staticmethod
+    def _is_substantial_docstring(docstring: Optional[str]) -> bool:
+        """Check if a docstring is more than just a title"""
         if not docstring:
             return False
         
         # Consider it substantial if it has multiple lines or mentions parameters/returns
-        return (len(docstring.split('\n')) > 1 or 
-                any(keyword in docstring.lower() for keyword in ['param', 'arg', 'return', 'yield']))
+        if '\n' in docstring:
+            return True
+        docstring_lower = docstring.lower()
+        return any(keyword in docstring_lower for keyword in _DOCSTRING_KEYWORDS)
     
     def _extract_parameters(self, node: ast.FunctionDef) -> List[FunctionParameter]:
         """Extract function parameters with type hints and defaults"""
@@ -227,29 +330,21 @@ class PythonFunctionVisitor(ast.NodeVisitor):
         if annotation is None:
             return None
         
-        try:
-            return ast.unparse(annotation)
-        except AttributeError:
-            # Fallback for older Python versions
-            if isinstance(annotation, ast.Name):
-                return annotation.id
-            elif isinstance(annotation, ast.Constant):
-                return str(annotation.value)
-            else:
-                return str(annotation)
+        # Most hints are plain names (int, str) or dotted names (np.ndarray)
+        simple = _simple_unparse(annotation)
+        if simple is not None:
+            return sys.intern(simple)
+        
+        # A handful of hints (Optional[str], List[int]) repeat across a repository
+        return sys.intern(ast.unparse(annotation))
     
     def _extract_default_value(self, default_node) -> str:
         """Extract default value as string"""
-        try:
-            return ast.unparse(default_node)
-        except AttributeError:
-            # Fallback for older Python versions
-            if isinstance(default_node, ast.Constant):
-                return repr(default_node.value)
-            elif isinstance(default_node, ast.Name):
-                return default_node.id
-            else:
-                return str(default_node)
+        simple = _simple_unparse(default_node)
+        if simple is not None:
+            return simple
+        
+        return ast.unparse(default_node)
     
     def _extract_return_type(self, node: ast.FunctionDef) -> Optional[str]:
         """Extract return type hint"""
@@ -3,11 +3,14 @@ Data models for repository analysis
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, TextIO
 import json
 
+# Shared encoder matching json.dumps(..., indent=2)
+_JSON_ENCODER = json.JSONEncoder(indent=2)
 
-@dataclass
+
+@dataclass(slots=True)
 class FunctionParameter:
     """Represents a function parameter"""
     name: str
@@ -17,7 +20,7 @@ class FunctionParameter:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCandidate:
     """Represents a function found during repository analysis"""
     function_name: str
@@ -32,7 +35,7 @@ class FunctionCandidate:
     module_name: Optional[str] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class MCPToolCandidate:
     """Analyzed function with MCP conversion metadata"""
     function: FunctionCandidate
@@ -59,30 +62,54 @@ class AnalysisResult:
     
     def to_json(self) -> str:
         """Convert to JSON format"""
-        data = {
-            "repository": self.repository,
-            "analyzed_files": self.analyzed_files,
-            "languages": self.languages,
-            "candidates": [
-                {
-                    "function_name": c.function.function_name,
-                    "file_path": c.function.file_path,
-                    "language": c.function.language,
-                    "mcp_score": c.mcp_score,
-                    "description": c.description,
-                    "parameters": {
-                        p.name: {
-                            "type": p.type_hint,
-                            "description": p.description,
-                            "default": p.default_value,
-                            "required": p.required
-                        } for p in c.function.parameters
-                    },
-                    "security_warnings": c.security_warnings,
-                    "suggested_tool_name": c.suggested_tool_name,
-                    "docker_requirements": c.docker_requirements
-                } for c in self.candidates
-            ],
-            "security_summary": self.security_summary
+        return ''.join(self.iter_json())
+    
+    def write_json(self, fp: TextIO):
+        """Write the JSON form to a text file, one candidate at a time"""
+        fp.writelines(self.iter_json())
+    
+    def iter_json(self) -> Iterator[str]:
+        """Yield the JSON form in chunks, encoding candidates one at a time"""
+        def encode(value, depth: int) -> str:
+            # JSON strings escape newlines, so re-indenting the encoded text is safe
+            return _JSON_ENCODER.encode(value).replace('\n', '\n' + '  ' * depth)
+        
+        yield '{\n'
+        yield f'  "repository": {encode(self.repository, 1)},\n'
+        yield f'  "analyzed_files": {encode(self.analyzed_files, 1)},\n'
+        yield f'  "languages": {encode(self.languages, 1)},\n'
+        
+        if self.candidates:
+            yield '  "candidates": [\n'
+            last = len(self.candidates) - 1
+            for index, candidate in enumerate(self.candidates):
+                separator = ',\n' if index < last else '\n'
+                yield '    ' + encode(self._candidate_data(candidate), 2) + separator
+            yield '  ],\n'
+        else:
+            yield '  "candidates": [],\n'
+        
+        yield f'  "security_summary": {encode(self.security_summary, 1)}\n'
+        yield '}'
+    
+    @staticmethod
+    def _candidate_data(c: MCPToolCandidate) -> Dict[str, Any]:
+        """JSON-ready summary of a single candidate"""
+        return {
+            "function_name": c.function.function_name,
+            "file_path": c.function.file_path,
+            "language": c.function.language,
+            "mcp_score": c.mcp_score,
+            "description": c.description,
+            "parameters": {
+                p.name: {
+                    "type": p.type_hint,
+                    "description": p.description,
+                    "default": p.default_value,
+                    "required": p.required
+                } for p in c.function.parameters
+            },
+            "security_warnings": c.security_warnings,
+            "suggested_tool_name": c.suggested_tool_name,
+            "docker_requirements": c.docker_requirements
         }
-        return json.dumps(data, indent=2)
\ No newline at end of file
@@ -2,10 +2,11 @@
 Main repository analyzer orchestrator
 """
 
+import logging
 import os
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import Iterator, List, Dict, Set, Optional
 import json
 
 from .models import (
@@ -16,17 +17,43 @@ from .language_parsers.python_analyzer import PythonAnalyzer
 from .language_parsers.javascript_analyzer import JavaScriptAnalyzer
 from .security.pattern_scanner import SecurityScanner
 
+logger = logging.getLogger(__name__)
+
+# Name fragments marking utility-style functions (boosted) and generic entry points (penalized)
+_UTILITY_KEYWORDS = frozenset({
+    'process', 'parse', 'convert', 'transform', 'validate', 'format', 'generate', 'calculate'
+})
+_GENERIC_NAMES = frozenset({'main', 'run', 'execute', 'handler', 'callback'})
+
+# Word boundaries in snake_case, kebab-case and camelCase names
+_NAME_SPLIT_RE = re.compile(r'[_-]|(?<=[a-z])(?=[A-Z])')
+
+# Source patterns hinting at package usage, combined into one alternation so a
+# function's source is scanned once; the matching group names the package
+_PACKAGE_RE = re.compile('|'.join(f'(?P<{package}>{pattern})' for package, pattern in {
+    'requests': r'\brequests\.',
+    'pandas': r'\bpd\.|pandas\.',
+    'numpy': r'\bnp\.|numpy\.',
+    'json': r'\bjson\.',
+    'yaml': r'yaml\.',
+    'sqlite3': r'sqlite3\.',
+    'csv': r'\bcsv\.',
+    'xml': r'\bxml\.',
+    'datetime': r'datetime\.',
+    'pathlib': r'pathlib\.|Path\(',
+}.items()))
+
 
 class RepositoryAnalyzer:
     """
     Main orchestrator for repository analysis and MCP tool candidate identification
     """
     
-    # File patterns for different languages
-    LANGUAGE_PATTERNS = {
-        'python': [r'\.py$'],
-        'javascript': [r'\.js$', r'\.jsx$', r'\.ts$', r'\.tsx$'],
-        'go': [r'\.go$']
+    # File extensions for different languages
+    LANGUAGE_EXTENSIONS = {
+        'python': ('.py',),
+        'javascript': ('.js', '.jsx', '.ts', '.tsx'),
+        'go': ('.go',)
     }
     
     # Common directories to skip
@@ -46,7 +73,13 @@ class RepositoryAnalyzer:
         'manage.py'  # Django management
     }
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Worker processes per language for file analysis
+                (defaults to CPU count, 1 analyzes in-process)
+        """
+        self.max_workers = max_workers
         self.analyzers = {
             'python': PythonAnalyzer(),
             'javascript': JavaScriptAnalyzer()
@@ -68,7 +101,7 @@ class RepositoryAnalyzer:
         if not repo_path.exists():
             raise ValueError(f"Repository path does not exist: {repo_path}")
         
-        print(f"Analyzing repository: {repo_path}")
+        logger.info("Analyzing repository: %s", repo_path)
         
         # Discover all relevant files
         files_by_language = self._discover_files(repo_path)
@@ -76,24 +109,30 @@ class RepositoryAnalyzer:
         # Analyze files by language
         all_functions = []
         for language, files in files_by_language.items():
-            print(f"Analyzing {len(files)} {language} files...")
+            logger.info("Analyzing %d %s files...", len(files), language)
             
             if language in self.analyzers:
                 analyzer = self.analyzers[language]
-                for file_path in files:
-                    try:
-                        functions = analyzer.analyze_file(str(file_path))
-                        all_functions.extend(functions)
-                    except Exception as e:
-                        print(f"Error analyzing {file_path}: {e}")
+                # Files are independent, so they are analyzed across worker processes;
+                # analyze_file reports per-file errors itself
+                try:
+                    all_functions.extend(analyzer.analyze_files(
+                        [str(file_path) for file_path in files],
+                        max_workers=self.max_workers
+                    ))
+                except Exception as e:
+                    logger.warning("Error analyzing %s files: %s", language, e)
+        
+        logger.info("Found %d functions across all files", len(all_functions))
         
-        print(f"Found {len(all_functions)} functions across all files")
+        # Scan each function's source once; candidate filtering and the summary share the results
+        function_warnings = [self.security_scanner.scan_function(function) for function in all_functions]
         
         # Convert functions to MCP tool candidates
-        mcp_candidates = self._evaluate_mcp_candidates(all_functions)
+        mcp_candidates = self._evaluate_mcp_candidates(all_functions, function_warnings)
         
         # Generate security summary
-        security_summary = self.security_scanner.get_security_summary(all_functions)
+        security_summary = self.security_scanner.get_security_summary(all_functions, function_warnings)
         
         # Create final result
         result = AnalysisResult(
@@ -104,7 +143,7 @@ class RepositoryAnalyzer:
             security_summary=security_summary
         )
         
-        print(f"Analysis complete: {len(mcp_candidates)} MCP tool candidates identified")
+        logger.info("Analysis complete: %d MCP tool candidates identified", len(mcp_candidates))
         
         return result
     
@@ -118,54 +157,80 @@ class RepositoryAnalyzer:
         Returns:
             Dictionary mapping language to list of file paths
         """
-        files_by_language = {}
+        files_by_language = {language: [] for language in self.LANGUAGE_EXTENSIONS}
         
-        for language, patterns in self.LANGUAGE_PATTERNS.items():
-            files_by_language[language] = []
-            compiled_patterns = [re.compile(pattern) for pattern in patterns]
+        for entry in self._iter_files(repo_path):
+            # Skip unwanted files
+            if entry.name in self.SKIP_FILES:
+                continue
             
-            for root, dirs, files in os.walk(repo_path):
-                # Skip unwanted directories
-                dirs[:] = [d for d in dirs if d not in self.SKIP_DIRECTORIES]
-                
-                root_path = Path(root)
-                
-                for file_name in files:
-                    # Skip unwanted files
-                    if file_name in self.SKIP_FILES:
-                        continue
+            for language, extensions in self.LANGUAGE_EXTENSIONS.items():
+                # Check if file matches language extensions
+                if entry.name.endswith(extensions):
+                    # Additional filtering for empty or very small files
+                    try:
+                        if entry.stat().st_size < 50:  # Skip very small files
+                            break
+                    except OSError:
+                        break
                     
-                    # Check if file matches language patterns
-                    if any(pattern.search(file_name) for pattern in compiled_patterns):
-                        file_path = root_path / file_name
-                        
-                        # Additional filtering for empty or very small files
-                        try:
-                            if file_path.stat().st_size < 50:  # Skip very small files
-                                continue
-                        except OSError:
-                            continue
-                        
-                        files_by_language[language].append(file_path)
+                    files_by_language[language].append(Path(entry.path))
+                    break
         
         # Remove languages with no files found
         files_by_language = {k: v for k, v in files_by_language.items() if v}
         
         return files_by_language
     
-    def _evaluate_mcp_candidates(self, functions: List[FunctionCandidate]) -> List[MCPToolCandidate]:
+    def _iter_files(self, repo_path: Path) -> Iterator[os.DirEntry]:
+        """
+        Yield file entries below repo_path in os.walk order, pruning skipped directories
+        
+        Directory entries cache their stat results, so each file costs one stat call.
+        """
+        pending = [str(repo_path)]
+        
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            
+            subdirectories = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if not is_dir:
+                    yield entry
+                elif entry.name not in self.SKIP_DIRECTORIES and not entry.is_symlink():
+                    subdirectories.append(entry.path)
+            
+            # Reversed so subdirectories are walked in listing order
+            pending.extend(reversed(subdirectories))
+    
+    def _evaluate_mcp_candidates(
+        self,
+        functions: List[FunctionCandidate],
+        function_warnings: Optional[List[List[str]]] = None
+    ) -> List[MCPToolCandidate]:
         """
         Evaluate functions and convert suitable ones to MCP tool candidates
         
         Args:
             functions: List of all discovered functions
+            function_warnings: Security warnings per function, if already scanned
             
         Returns:
             List of MCP tool candidates with scores and metadata
         """
         candidates = []
         
-        for function in functions:
+        for index, function in enumerate(functions):
             # Calculate MCP suitability score
             mcp_score = self._calculate_mcp_score(function)
             
@@ -174,7 +239,10 @@ class RepositoryAnalyzer:
                 continue
             
             # Run security analysis
-            security_warnings = self.security_scanner.scan_function(function)
+            if function_warnings is not None:
+                security_warnings = function_warnings[index]
+            else:
+                security_warnings = self.security_scanner.scan_function(function)
             
             # Skip functions with high security risks (unless they have amazing documentation)
             risk_score = self.security_scanner.calculate_risk_score(security_warnings)
@@ -227,27 +295,31 @@ class RepositoryAnalyzer:
             elif docstring_quality > 5:
                 score += 1.0
             
+            # Lowercase once for all keyword checks below
+            docstring_lower = function.docstring.lower()
+            
             # Extra boost for parameter documentation
-            if 'param' in function.docstring.lower() or 'arg' in function.docstring.lower():
+            if 'param' in docstring_lower or 'arg' in docstring_lower:
                 score += 1.0
             
             # Extra boost for return documentation  
-            if 'return' in function.docstring.lower() or 'yield' in function.docstring.lower():
+            if 'return' in docstring_lower or 'yield' in docstring_lower:
                 score += 0.5
         else:
             score -= 2.0  # Penalty for no docstring
         
         # Boost for reasonable parameter count (2-6 parameters ideal for MCP tools)
-        param_count = len(function.parameters)
+        parameters = function.parameters
+        param_count = len(parameters)
         if 2 <= param_count <= 6:
             score += 1.0
         elif param_count > 10:
             score -= 1.0
         
         # Boost for type hints
-        typed_params = sum(1 for p in function.parameters if p.type_hint)
-        type_coverage = typed_params / max(len(function.parameters), 1)
-        score += type_coverage * 1.0
+        if param_count:
+            typed_params = sum(1 for p in parameters if p.type_hint)
+            score += typed_params / param_count
         
         # Boost for return type hint
         if function.return_type:
@@ -261,13 +333,11 @@ class RepositoryAnalyzer:
         
         # Boost for functions that look like utilities or data processors
         name_lower = function.function_name.lower()
-        utility_keywords = ['process', 'parse', 'convert', 'transform', 'validate', 'format', 'generate', 'calculate']
-        if any(keyword in name_lower for keyword in utility_keywords):
+        if any(keyword in name_lower for keyword in _UTILITY_KEYWORDS):
             score += 1.0
         
         # Penalty for overly generic names
-        generic_names = ['main', 'run', 'execute', 'handler', 'callback']
-        if any(name in name_lower for name in generic_names):
+        if any(name in name_lower for name in _GENERIC_NAMES):
             score -= 0.5
         
         return max(0.0, min(10.0, score))
@@ -288,8 +358,7 @@ class RepositoryAnalyzer:
             return description
         
         # Generate description from function name and signature
-        name_words = re.sub(r'[_-]', ' ', function.function_name)
-        name_words = re.sub(r'([a-z])([A-Z])', r'\1 \2', name_words)
+        name_words = ' '.join(_NAME_SPLIT_RE.split(function.function_name))
         
         if function.parameters:
             param_names = [p.name for p in function.parameters[:3]]  # First 3 params
@@ -360,35 +429,17 @@ class RepositoryAnalyzer:
     
     def _infer_docker_requirements(self, function: FunctionCandidate) -> List[str]:
         """Infer basic Docker/Python package requirements from function source"""
-        requirements = set()
         source = function.source_code.lower()
+        requirements = {match.lastgroup for match in _PACKAGE_RE.finditer(source)}
         
-        # Common patterns for package usage
-        package_patterns = {
-            'requests': r'\brequests\.',
-            'pandas': r'\bpd\.|pandas\.',
-            'numpy': r'\bnp\.|numpy\.',
-            'json': r'\bjson\.',
-            'yaml': r'yaml\.',
-            'sqlite3': r'sqlite3\.',
-            'csv': r'\bcsv\.',
-            'xml': r'\bxml\.',
-            'datetime': r'datetime\.',
-            'pathlib': r'pathlib\.|Path\(',
-        }
-        
-        for package, pattern in package_patterns.items():
-            if re.search(pattern, source):
-                requirements.add(package)
-        
-        return sorted(list(requirements))
+        return sorted(requirements)
     
     def save_result(self, result: AnalysisResult, output_path: str):
         """Save analysis result to JSON file"""
         with open(output_path, 'w') as f:
-            f.write(result.to_json())
+            result.write_json(f)
         
-        print(f"Analysis result saved to: {output_path}")
+        logger.info("Analysis result saved to: %s", output_path)
 
 
 def main():
@@ -399,6 +450,9 @@ def main():
         print("Usage: python repository_analyzer.py <repository_path>")
         sys.exit(1)
     
+    # Progress messages go through logging; show them on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     repo_path = sys.argv[1]
     analyzer = RepositoryAnalyzer()
     
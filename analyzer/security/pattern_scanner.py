@@ -3,7 +3,7 @@ Security pattern scanner for dangerous code detection
 """
 
 import re
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 from ..models import FunctionCandidate
 
 
@@ -159,12 +159,17 @@ class SecurityScanner:
         
         return risk_score <= max_risk_score
     
-    def get_security_summary(self, functions: List[FunctionCandidate]) -> Dict[str, int]:
+    def get_security_summary(
+        self,
+        functions: List[FunctionCandidate],
+        function_warnings: Optional[List[List[str]]] = None
+    ) -> Dict[str, int]:
         """
         Generate security summary for a list of functions
         
         Args:
             functions: List of functions to analyze
+            function_warnings: Warnings from scan_function for each function, if already scanned
             
         Returns:
             Dictionary with security statistics
@@ -174,8 +179,10 @@ class SecurityScanner:
         medium_risk_functions = 0
         safe_functions = 0
         
-        for func in functions:
-            warnings = self.scan_function(func)
+        if function_warnings is None:
+            function_warnings = map(self.scan_function, functions)
+        
+        for warnings in function_warnings:
             total_warnings += len(warnings)
             
             risk_score = self.calculate_risk_score(warnings)
@@ -0,0 +1,61 @@
+"""
+Shared rendering for the documentation, prompt and resource templates
+
+Templates are rendered with Jinja2 when it is installed. Without it, templates
+that only substitute plain ``{{ name }}`` placeholders still render.
+"""
+
+import re
+from typing import Any, Dict, Iterator, Optional
+
+# Optional Jinja2 import
+try:
+    from jinja2 import DictLoader, Environment
+    HAS_JINJA2 = True
+except ImportError:
+    HAS_JINJA2 = False
+
+_PLACEHOLDER_RE = re.compile(r'\{\{ (\w+) \}\}')
+
+
+def make_env(templates: Dict[str, str]) -> Optional['Environment']:
+    """
+    Build a Jinja2 environment over in-memory template sources
+
+    Args:
+        templates: Template sources by name
+
+    Returns:
+        Environment that compiles templates on first use and never reloads them,
+        or None when Jinja2 is not installed
+    """
+    if not HAS_JINJA2:
+        return None
+    return Environment(
+        loader=DictLoader(templates),
+        autoescape=False,
+        cache_size=-1,
+        auto_reload=False,
+        keep_trailing_newline=True,
+    )
+
+
+class TemplateRenderer:
+    """Renders a fixed set of templates, falling back to placeholder substitution without Jinja2"""
+
+    def __init__(self, templates: Dict[str, str]):
+        self.env = make_env(templates)
+        # Templates split into alternating literal text and placeholder names
+        self._pieces = {name: _PLACEHOLDER_RE.split(source) for name, source in templates.items()}
+
+    def generate(self, name: str, context: Dict[str, Any]) -> Iterator[str]:
+        """Yield the chunks of a rendered template"""
+        if self.env is not None:
+            yield from self.env.get_template(name).generate(context)
+            return
+        for index, piece in enumerate(self._pieces[name]):
+            yield str(context[piece]) if index % 2 else piece
+
+    def render(self, name: str, context: Dict[str, Any]) -> str:
+        """Render a template to a string"""
+        return ''.join(self.generate(name, context))
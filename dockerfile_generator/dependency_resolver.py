@@ -4,7 +4,8 @@ Dependency resolution system for MCP server generation
 
 import re
 import ast
-from typing import List, Set, Dict, Optional
+from collections import OrderedDict
+from typing import FrozenSet, List, Set, Dict, Optional, Tuple
 from pathlib import Path
 
 # Import from analyzer
@@ -13,6 +14,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 from analyzer.models import MCPToolCandidate
 
 
+# Resolution inputs of a candidate set: the language plus each candidate's
+# (source code, docker requirements); order and duplicates do not affect the result
+_ResolutionKey = Tuple[str, FrozenSet[Tuple[str, Tuple[str, ...]]]]
+
+
 class DependencyResolver:
     """Resolves dependencies for different programming languages"""
     
@@ -57,10 +63,19 @@ class DependencyResolver:
         'url', 'util', 'vm', 'zlib'
     }
     
+    # Resolved candidate sets kept per resolver, least recently used first
+    CACHE_MAX_ENTRIES = 256
+    
+    def __init__(self):
+        self._cache: "OrderedDict[_ResolutionKey, List[str]]" = OrderedDict()
+    
     def resolve_dependencies(self, candidates: List[MCPToolCandidate], language: str) -> List[str]:
         """
         Resolve dependencies for a list of MCP tool candidates
         
+        Results are cached by the candidates' source code and docker requirements,
+        so packages generated from overlapping candidate sets resolve once.
+        
         Args:
             candidates: List of MCP tool candidates
             language: Programming language ('python', 'javascript', 'go')
@@ -68,6 +83,24 @@ class DependencyResolver:
         Returns:
             List of dependency specifications
         """
+        key = (language, frozenset(
+            (candidate.function.source_code, tuple(candidate.docker_requirements))
+            for candidate in candidates
+        ))
+        
+        dependencies = self._cache.get(key)
+        if dependencies is None:
+            dependencies = self._resolve_uncached(candidates, language)
+            self._cache[key] = dependencies
+            if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        
+        return list(dependencies)
+    
+    def _resolve_uncached(self, candidates: List[MCPToolCandidate], language: str) -> List[str]:
+        """Resolve dependencies without consulting the cache"""
         if language == 'python':
             return self._resolve_python_dependencies(candidates)
         elif language == 'javascript':
@@ -85,10 +118,10 @@ class DependencyResolver:
         dependencies.add("mcp>=1.0.0")
         
         for candidate in candidates:
-            func = candidate.function
+            source_code = candidate.function.source_code
             
             # Extract imports from function source
-            imports = self._extract_python_imports(func.source_code)
+            imports = self._extract_python_imports(source_code)
             
             # Add discovered dependencies  
             for imp in imports:
@@ -101,7 +134,7 @@ class DependencyResolver:
             dependencies.update(candidate.docker_requirements)
             
             # Infer additional dependencies from function patterns
-            source_lower = func.source_code.lower()
+            source_lower = source_code.lower()
             
             if 'requests.' in source_lower or 'import requests' in source_lower:
                 dependencies.add("requests")
@@ -127,10 +160,10 @@ class DependencyResolver:
         dependencies.add("@modelcontextprotocol/sdk")
         
         for candidate in candidates:
-            func = candidate.function
+            source_code = candidate.function.source_code
             
             # Extract requires/imports from function source
-            imports = self._extract_nodejs_imports(func.source_code)
+            imports = self._extract_nodejs_imports(source_code)
             
             # Add discovered dependencies
             for imp in imports:
@@ -141,7 +174,7 @@ class DependencyResolver:
             dependencies.update(candidate.docker_requirements)
             
             # Infer additional dependencies from function patterns
-            source_lower = func.source_code.lower()
+            source_lower = source_code.lower()
             
             if 'axios' in source_lower:
                 dependencies.add("axios")
@@ -161,10 +194,10 @@ class DependencyResolver:
         dependencies = set()
         
         for candidate in candidates:
-            func = candidate.function
+            source_code = candidate.function.source_code
             
             # Extract imports from function source
-            imports = self._extract_go_imports(func.source_code)
+            imports = self._extract_go_imports(source_code)
             
             # Add non-standard library dependencies
             for imp in imports:
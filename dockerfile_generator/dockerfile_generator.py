@@ -2,19 +2,35 @@
 Main Dockerfile generator with template system
 """
 
+import io
 import os
 import json
-from datetime import datetime
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from string import Template
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, TextIO, Tuple, Union
 
 # Optional Jinja2 import
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import (
+        Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, select_autoescape
+    )
     HAS_JINJA2 = True
 except ImportError:
     HAS_JINJA2 = False
 
+# Optional orjson import for faster JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import from analyzer
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
@@ -25,55 +41,299 @@ from .server_wrapper_generator import ServerWrapperGenerator
 from .documentation_generator import DocumentationGenerator
 
 
+# Compiled template bytecode is kept here so it survives process restarts
+DEFAULT_BYTECODE_CACHE_DIR = Path.home() / '.cache' / 'maverick-mcp' / 'jinja'
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Templates precompiled to Python modules by scripts/compile_templates.py
+COMPILED_TEMPLATES_PATH = Path(__file__).parent / "templates_compiled.zip"
+
+
+def _make_bytecode_cache(cache_dir: Path) -> Optional["FileSystemBytecodeCache"]:
+    """Create a bytecode cache in cache_dir, or None if the directory is not writable"""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # The cache is best-effort
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def _compiled_templates_are_fresh(template_dir: Path) -> bool:
+    """Check that the precompiled archive exists and is newer than every template"""
+    try:
+        compiled_mtime = COMPILED_TEMPLATES_PATH.stat().st_mtime
+        return all(
+            entry.stat().st_mtime <= compiled_mtime
+            for entry in template_dir.glob("*.j2")
+        )
+    except OSError:
+        return False
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj as JSON indented by two spaces, identically with or without orjson"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Source file extension per language
+_FILE_EXTENSIONS = MappingProxyType({
+    'python': 'py',
+    'javascript': 'js',
+    'go': 'go'
+})
+
+
+# Characters replaced by the sanitize_name filter
+_SANITIZE_NAME_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+# Contents of the generated .dockerignore
+_DOCKERIGNORE = '\n'.join((
+    ".git",
+    ".gitignore",
+    "README.md",
+    "*.md",
+    ".env*",
+    "tests/",
+    "test/",
+    "__pycache__/",
+    "*.pyc",
+    ".pytest_cache/",
+    "node_modules/",
+    ".npm/",
+    "coverage/",
+    ".coverage"
+))
+
+
+# Fallback Dockerfiles for when Jinja2 is unavailable, filled in from SUPPORTED_LANGUAGES
+_BASIC_DOCKERFILE_TEMPLATES = {
+    'python': Template("""FROM $base_image
+
+WORKDIR /app
+
+# Install Python dependencies
+COPY $package_file .
+RUN pip install --no-cache-dir -r $package_file
+
+# Copy application files
+COPY $server_file .
+COPY original_functions.py .
+
+# Set Python path
+ENV PYTHONPATH=/app
+
+# Create non-root user for security
+RUN adduser --disabled-password --gecos '' mcpuser
+USER mcpuser
+
+# Run the MCP server
+CMD ["python", "$server_file"]
+"""),
+    'javascript': Template("""FROM $base_image
+
+WORKDIR /app
+
+# Initialize npm and install dependencies
+RUN npm init -y && npm pkg set type="module"
+COPY $package_file .
+RUN npm install
+
+# Copy application files
+COPY $server_file .
+COPY original_functions.js .
+
+# Set environment
+ENV NODE_ENV=production
+
+# Create non-root user for security
+RUN adduser -D mcpuser
+USER mcpuser
+
+# Run the MCP server
+CMD ["node", "$server_file"]
+""")
+}
+
+
+def _render_basic_dockerfiles(languages: Mapping[str, Mapping[str, str]]) -> Dict[str, str]:
+    """
+    Render the fallback Dockerfiles once per language
+    
+    Args:
+        languages: Language configurations keyed by language name
+        
+    Returns:
+        Complete Dockerfile text keyed by language name
+    """
+    return {
+        language: template.substitute(languages[language])
+        for language, template in _BASIC_DOCKERFILE_TEMPLATES.items()
+        if language in languages
+    }
+
+
+# Source patterns that suggest an environment variable, one named group per pattern
+_ENV_VAR_RE = re.compile(
+    r'(?P<api_key>api_key)|(?P<database_url>database_url|db_url)|(?P<secret>secret)|(?P<key>key)',
+    re.IGNORECASE
+)
+_ENV_VAR_GROUPS = frozenset(_ENV_VAR_RE.groupindex)
+
+
+@lru_cache(maxsize=4096)
+def _source_environment_vars(source_code: str) -> Tuple[str, ...]:
+    """
+    Find the environment variables a function's source appears to need
+    
+    Results are memoized by source text, so a function shared by several
+    packages is only scanned once.
+    
+    Args:
+        source_code: Function source code
+        
+    Returns:
+        Names of the environment variables the source refers to
+    """
+    # Look for common environment variable patterns in a single scan
+    seen = set()
+    for match in _ENV_VAR_RE.finditer(source_code):
+        seen.add(match.lastgroup)
+        if len(seen) == len(_ENV_VAR_GROUPS):
+            break
+    
+    found = []
+    if 'api_key' in seen:
+        found.append('API_KEY')
+    if 'database_url' in seen:
+        found.append('DATABASE_URL')
+    # 'secret' and 'key' may appear anywhere; a matched api_key also contains 'key'
+    if 'secret' in seen and ('key' in seen or 'api_key' in seen):
+        found.append('SECRET_KEY')
+    return tuple(found)
+
+
 class DockerfileGenerator:
     """
     Template-based Dockerfile generator for MCP servers
     """
     
-    SUPPORTED_LANGUAGES = {
-        'python': {
+    SUPPORTED_LANGUAGES = MappingProxyType({
+        'python': MappingProxyType({
             'base_image': 'python:3.11-slim',
             'package_manager': 'pip',
             'package_file': 'requirements.txt',
             'server_file': 'mcp_server.py'
-        },
-        'javascript': {
+        }),
+        'javascript': MappingProxyType({
             'base_image': 'node:18-alpine',
             'package_manager': 'npm',
             'package_file': 'package.json',
             'server_file': 'mcp_server.js'
-        },
-        'go': {
+        }),
+        'go': MappingProxyType({
             'base_image': 'golang:1.21-alpine',
             'package_manager': 'go',
             'package_file': 'go.mod',
             'server_file': 'mcp_server.go'
-        }
-    }
+        })
+    })
+    
+    # Fallback Dockerfiles have no per-package fields, so they are rendered once
+    _BASIC_DOCKERFILES = _render_basic_dockerfiles(SUPPORTED_LANGUAGES)
+    
+    # Jinja2 environments shared by all generators, keyed by template directory
+    _env_cache: Dict[Path, "Environment"] = {}
     
-    def __init__(self, template_dir: Optional[str] = None):
+    def __init__(self, template_dir: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            template_dir: Directory containing the Dockerfile templates
+            max_workers: Threads used to generate a package's files
+                (defaults to one per file up to the CPU count, 1 generates serially)
+        """
         if template_dir is None:
-            template_dir = Path(__file__).parent / "templates"
+            template_dir = DEFAULT_TEMPLATE_DIR
         
         self.template_dir = Path(template_dir)
+        self.max_workers = max_workers
         self.dependency_resolver = DependencyResolver()
         self.server_wrapper_generator = ServerWrapperGenerator()
         self.documentation_generator = DocumentationGenerator()
         
-        # Initialize Jinja2 environment if available
-        if HAS_JINJA2:
-            self.env = Environment(
-                loader=FileSystemLoader(str(self.template_dir)),
-                autoescape=select_autoescape(['html', 'xml']),
-                trim_blocks=True,
-                lstrip_blocks=True
-            )
+        # Loaded templates by name, so repeated renders skip the loader
+        self._template_cache: Dict[str, Any] = {}
+        
+        # Reuse the Jinja2 environment for this template directory if available
+        self.env = self._get_env(self.template_dir) if HAS_JINJA2 else None
+    
+    @classmethod
+    def _get_env(cls, template_dir: Path) -> "Environment":
+        """
+        Get the shared Jinja2 environment for a template directory
+        
+        Args:
+            template_dir: Directory containing the Dockerfile templates
             
-            # Add custom filters
-            self.env.filters['sanitize_name'] = self._sanitize_name
-            self.env.filters['quote_list'] = self._quote_list
-        else:
-            self.env = None
+        Returns:
+            Environment with the custom filters, loading the bundled templates
+            from their precompiled archive when it is up to date
+        """
+        template_dir = template_dir.resolve()
+        env = cls._env_cache.get(template_dir)
+        if env is None:
+            if (template_dir == DEFAULT_TEMPLATE_DIR.resolve()
+                    and _compiled_templates_are_fresh(template_dir)):
+                env = cls._new_env(ModuleLoader(str(COMPILED_TEMPLATES_PATH)))
+            else:
+                env = cls._new_env(
+                    FileSystemLoader(str(template_dir)),
+                    bytecode_cache=_make_bytecode_cache(DEFAULT_BYTECODE_CACHE_DIR)
+                )
+            cls._env_cache[template_dir] = env
+        return env
+    
+    @classmethod
+    def _new_env(cls, loader, bytecode_cache=None) -> "Environment":
+        """Create a Jinja2 environment with the generator's settings and filters"""
+        env = Environment(
+            loader=loader,
+            autoescape=select_autoescape(['html', 'xml']),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=bytecode_cache
+        )
+        
+        # Add custom filters
+        env.filters['sanitize_name'] = cls._sanitize_name
+        env.filters['quote_list'] = cls._quote_list
+        return env
+    
+    @classmethod
+    def compile_templates(
+        cls,
+        target: Path = COMPILED_TEMPLATES_PATH,
+        template_dir: Path = DEFAULT_TEMPLATE_DIR
+    ) -> Path:
+        """
+        Precompile Dockerfile templates into a zip archive of Python modules
+        
+        Args:
+            target: Archive to write
+            template_dir: Directory containing the Dockerfile templates
+            
+        Returns:
+            Path of the written archive
+        """
+        env = cls._new_env(FileSystemLoader(str(template_dir)))
+        env.compile_templates(
+            str(target), extensions=['j2'], zip='deflated', ignore_errors=False
+        )
+        return Path(target)
     
     def generate_mcp_server_package(
         self,
@@ -95,87 +355,81 @@ class DockerfileGenerator:
             Dictionary with generation results and file paths
         """
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        generated_at = datetime.now(timezone.utc).isoformat()
         
         # Determine primary language
         language = self._determine_primary_language(candidates)
         
-        if language not in self.SUPPORTED_LANGUAGES:
+        lang_config = self.SUPPORTED_LANGUAGES.get(language)
+        if lang_config is None:
             raise ValueError(f"Unsupported language: {language}")
         
         # Build generation context
         context = self._build_generation_context(
-            candidates, language, server_name, repo_info
+            candidates, language, server_name, repo_info, generated_at
         )
         
-        generated_files = {}
+        # Every output depends only on the shared read-only context, so the
+        # generators run concurrently; results are collected in task order
+        tasks = [
+            ('requirements', lang_config['package_file'],
+             self._generate_requirements_file, (language, context)),
+            ('server', lang_config['server_file'],
+             self.server_wrapper_generator.generate_wrapper,
+             (language, candidates, server_name, repo_info)),
+            ('functions', f"original_functions.{context['file_extension']}",
+             self._extract_original_functions, (candidates, language)),
+            ('dockerignore', ".dockerignore", self._generate_dockerignore, (language,)),
+        ]
         
-        # Generate Dockerfile
-        dockerfile_content = self._generate_dockerfile(language, context)
-        dockerfile_path = output_path / "Dockerfile"
-        dockerfile_path.write_text(dockerfile_content)
-        generated_files['dockerfile'] = str(dockerfile_path)
+        max_workers = self.max_workers
+        if max_workers is None:
+            max_workers = min(len(tasks), os.cpu_count() or 4)
         
-        # Generate package requirements file
-        requirements_content = self._generate_requirements_file(language, context)
-        requirements_file = self.SUPPORTED_LANGUAGES[language]['package_file']
-        requirements_path = output_path / requirements_file
-        requirements_path.write_text(requirements_content)
-        generated_files['requirements'] = str(requirements_path)
+        if max_workers == 1:
+            contents = [generate(*args) for _, _, generate, args in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(generate, *args) for _, _, generate, args in tasks]
+                contents = [future.result() for future in futures]
         
-        # Generate MCP server wrapper
-        server_content = self.server_wrapper_generator.generate_wrapper(
-            language, candidates, server_name, repo_info
-        )
-        server_file = self.SUPPORTED_LANGUAGES[language]['server_file']
-        server_path = output_path / server_file
-        server_path.write_text(server_content)
-        generated_files['server'] = str(server_path)
-        
-        # Generate original functions file
-        functions_content = self._extract_original_functions(candidates, language)
-        functions_file = f"original_functions.{self._get_file_extension(language)}"
-        functions_path = output_path / functions_file
-        functions_path.write_text(functions_content)
-        generated_files['functions'] = str(functions_path)
-        
-        # Generate .dockerignore
-        dockerignore_content = self._generate_dockerignore(language)
-        dockerignore_path = output_path / ".dockerignore"
-        dockerignore_path.write_text(dockerignore_content)
-        generated_files['dockerignore'] = str(dockerignore_path)
-        
-        # Generate comprehensive README
-        readme_content = self.documentation_generator.generate_readme(
-            candidates, server_name, repo_info, language
-        )
-        readme_path = output_path / "README.md"
-        readme_path.write_text(readme_content)
-        generated_files['readme'] = str(readme_path)
+        # Build every file's content first, then write them in one pass
+        writes: List[Tuple[Path, Union[str, Callable[[TextIO], Any]]]] = []
+        generated_files = {}
         
-        # Generate integration guide
-        integration_content = self.documentation_generator.generate_integration_guide(
-            server_name, repo_info, candidates
-        )
-        integration_path = output_path / "INTEGRATION.md"
-        integration_path.write_text(integration_content)
-        generated_files['integration'] = str(integration_path)
+        # The Dockerfile template renders straight into its file
+        dockerfile_path = output_path / "Dockerfile"
+        writes.append((dockerfile_path, partial(
+            self._generate_dockerfile_to, language=language, context=context)))
+        generated_files['dockerfile'] = str(dockerfile_path)
         
-        # Generate deployment guide
-        deployment_content = self.documentation_generator.generate_deployment_guide(
-            server_name, candidates
-        )
-        deployment_path = output_path / "DEPLOYMENT.md"
-        deployment_path.write_text(deployment_content)
-        generated_files['deployment'] = str(deployment_path)
+        for (key, file_name, _, _), content in zip(tasks, contents):
+            file_path = output_path / file_name
+            writes.append((file_path, content))
+            generated_files[key] = str(file_path)
+        
+        # Documentation is streamed into its files while writing, never held in memory
+        docs = self.documentation_generator
+        streamed = [
+            ('readme', "README.md", partial(
+                docs.generate_readme_to, candidates=candidates, server_name=server_name,
+                repo_info=repo_info, language=language)),
+            ('integration', "INTEGRATION.md", partial(
+                docs.generate_integration_guide_to, server_name=server_name,
+                repo_info=repo_info, candidates=candidates)),
+            ('deployment', "DEPLOYMENT.md", partial(
+                docs.generate_deployment_guide_to, server_name=server_name,
+                candidates=candidates)),
+            ('servers_entry', "servers_entry.yaml", partial(
+                docs.generate_servers_yaml_entry_to, server_name=server_name,
+                repo_info=repo_info, candidates=candidates)),
+        ]
+        for key, file_name, write_document in streamed:
+            file_path = output_path / file_name
+            writes.append((file_path, write_document))
+            generated_files[key] = str(file_path)
         
-        # Generate enhanced servers.yaml entry
-        servers_entry = self.documentation_generator.generate_servers_yaml_entry(
-            server_name, repo_info, candidates
-        )
-        servers_path = output_path / "servers_entry.yaml"
-        servers_path.write_text(servers_entry)
-        generated_files['servers_entry'] = str(servers_path)
+        self._flush_writes(writes)
         
         return {
             'server_name': server_name,
@@ -183,34 +437,85 @@ class DockerfileGenerator:
             'generated_files': generated_files,
             'context': context,
             'total_functions': len(candidates),
-            'generation_time': datetime.now().isoformat()
+            'generation_time': generated_at
         }
     
+    @staticmethod
+    def _flush_writes(writes: List[Tuple[Path, Union[str, Callable[[TextIO], Any]]]]):
+        """
+        Write generated files, creating each output directory once
+        
+        Args:
+            writes: (path, content) pairs in write order, where content is the
+                file text or a callable that streams it into an open file
+        """
+        for directory in {path.parent for path, _ in writes}:
+            os.makedirs(directory, exist_ok=True)
+        
+        for path, content in writes:
+            DockerfileGenerator._write(path, content)
+    
+    @staticmethod
+    def _write(path: Path, content: Union[str, Callable[[TextIO], Any]]):
+        """
+        Write a generated file as UTF-8 with LF line endings
+        
+        Args:
+            path: File to create or overwrite
+            content: Complete file content, or a callable that writes it to the open file
+        """
+        # newline='\n' skips line-ending translation; files are built for Linux containers
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                content(f)
+    
     def _determine_primary_language(self, candidates: List[MCPToolCandidate]) -> str:
         """Determine the primary language from candidates"""
-        language_counts = {}
-        for candidate in candidates:
-            lang = candidate.function.language
-            language_counts[lang] = language_counts.get(lang, 0) + 1
+        language_counts = Counter(candidate.function.language for candidate in candidates)
+        if not language_counts:
+            raise ValueError("Cannot determine the language of an empty candidate list")
         
-        # Return the most common language
-        return max(language_counts.items(), key=lambda x: x[1])[0]
+        # Return the most common language (the first one seen wins ties)
+        return language_counts.most_common(1)[0][0]
     
     def _build_generation_context(
         self,
         candidates: List[MCPToolCandidate],
         language: str,
         server_name: str,
-        repo_info: Dict[str, Any]
+        repo_info: Dict[str, Any],
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Build context dictionary for template rendering"""
+        """
+        Build context dictionary for template rendering
+        
+        Args:
+            candidates: List of MCP tool candidates
+            language: Primary language of the package
+            server_name: Name for the generated server
+            repo_info: Repository information
+            generated_at: ISO timestamp of the generation run (defaults to now, in UTC)
+            
+        Returns:
+            Template context
+        """
+        if generated_at is None:
+            generated_at = datetime.now(timezone.utc).isoformat()
         
         lang_config = self.SUPPORTED_LANGUAGES[language]
         dependencies = self.dependency_resolver.resolve_dependencies(candidates, language)
         
-        # Calculate security level
-        security_warnings = sum(len(c.security_warnings) for c in candidates)
-        high_risk_count = sum(1 for c in candidates if any("HIGH RISK" in w for w in c.security_warnings))
+        # Calculate security level in one pass over the candidates
+        security_warnings = 0
+        high_risk_count = 0
+        for candidate in candidates:
+            warnings = candidate.security_warnings
+            if warnings:
+                security_warnings += len(warnings)
+                if any("HIGH RISK" in w for w in warnings):
+                    high_risk_count += 1
         security_level = "high" if high_risk_count > 0 else ("medium" if security_warnings > 0 else "low")
         
         context = {
@@ -225,7 +530,7 @@ class DockerfileGenerator:
             # Repository info
             'repo_name': repo_info.get('name', 'unknown'),
             'repo_url': repo_info.get('url', ''),
-            'generation_date': datetime.now().isoformat(),
+            'generation_date': generated_at,
             
             # Functions and dependencies
             'candidates': candidates,
@@ -251,72 +556,44 @@ class DockerfileGenerator:
     
     def _generate_dockerfile(self, language: str, context: Dict[str, Any]) -> str:
         """Generate Dockerfile using templates"""
+        buffer = io.StringIO()
+        self._generate_dockerfile_to(buffer, language, context)
+        return buffer.getvalue()
+    
+    def _generate_dockerfile_to(self, fp: TextIO, language: str, context: Dict[str, Any]):
+        """
+        Stream the Dockerfile for a language into an open file
+        
+        Args:
+            fp: Text file positioned at the start of the Dockerfile
+            language: Primary language of the package
+            context: Template context
+        """
         if HAS_JINJA2 and self.env:
             template_name = f"{language}.dockerfile.j2"
+            start = fp.tell()
             
             try:
-                template = self.env.get_template(template_name)
-                return template.render(**context)
+                template = self._template_cache.get(template_name)
+                if template is None:
+                    template = self.env.get_template(template_name)
+                    self._template_cache[template_name] = template
+                template.stream(**context).dump(fp)
+                return
             except Exception as e:
-                # Fallback to basic template
-                return self._generate_basic_dockerfile(language, context)
-        else:
-            # Use basic template when Jinja2 is not available
-            return self._generate_basic_dockerfile(language, context)
+                # Fallback to basic template, replacing anything already streamed
+                fp.seek(start)
+                fp.truncate()
+        
+        # Use basic template when Jinja2 is not available or rendering failed
+        fp.write(self._generate_basic_dockerfile(language, context))
     
     def _generate_basic_dockerfile(self, language: str, context: Dict[str, Any]) -> str:
         """Generate basic Dockerfile as fallback"""
-        lang_config = self.SUPPORTED_LANGUAGES[language]
-        
-        if language == 'python':
-            return f"""FROM {lang_config['base_image']}
-
-WORKDIR /app
-
-# Install Python dependencies
-COPY {lang_config['package_file']} .
-RUN pip install --no-cache-dir -r {lang_config['package_file']}
-
-# Copy application files
-COPY {lang_config['server_file']} .
-COPY original_functions.py .
-
-# Set Python path
-ENV PYTHONPATH=/app
-
-# Create non-root user for security
-RUN adduser --disabled-password --gecos '' mcpuser
-USER mcpuser
-
-# Run the MCP server
-CMD ["python", "{lang_config['server_file']}"]
-"""
-        elif language == 'javascript':
-            return f"""FROM {lang_config['base_image']}
-
-WORKDIR /app
-
-# Initialize npm and install dependencies
-RUN npm init -y && npm pkg set type="module"
-COPY {lang_config['package_file']} .
-RUN npm install
-
-# Copy application files
-COPY {lang_config['server_file']} .
-COPY original_functions.js .
-
-# Set environment
-ENV NODE_ENV=production
-
-# Create non-root user for security
-RUN adduser -D mcpuser
-USER mcpuser
-
-# Run the MCP server
-CMD ["node", "{lang_config['server_file']}"]
-"""
-        else:
-            raise ValueError(f"No basic template for language: {language}")
+        try:
+            return self._BASIC_DOCKERFILES[language]
+        except KeyError:
+            raise ValueError(f"No basic template for language: {language}") from None
     
     def _generate_requirements_file(self, language: str, context: Dict[str, Any]) -> str:
         """Generate requirements/package file"""
@@ -325,7 +602,7 @@ CMD ["node", "{lang_config['server_file']}"]
         if language == 'python':
             return '\n'.join(dependencies) + '\n'
         elif language == 'javascript':
-            deps_dict = {dep.split('==')[0] if '==' in dep else dep: "latest" for dep in dependencies}
+            deps_dict = {dep.partition('==')[0]: "latest" for dep in dependencies}
             package_json = {
                 "name": f"mcp-{context['server_name']}",
                 "version": "1.0.0",
@@ -335,80 +612,55 @@ CMD ["node", "{lang_config['server_file']}"]
                     "start": f"node {context['server_file']}"
                 }
             }
-            return json.dumps(package_json, indent=2)
+            return _dumps_indented(package_json)
         else:
             return "# Dependencies for " + language
     
     def _extract_original_functions(self, candidates: List[MCPToolCandidate], language: str) -> str:
         """Extract original function source code"""
         if language == 'python':
-            header = '"""\\nOriginal functions extracted from repository\\n"""\\n\\n'
+            parts = ['"""\nOriginal functions extracted from repository\n"""\n\n']
+            comment = '#'
         else:
-            header = '// Original functions extracted from repository\\n\\n'
-        
-        functions_code = header
+            parts = ['// Original functions extracted from repository\n\n']
+            comment = '//'
         
         for candidate in candidates:
             func = candidate.function
-            functions_code += f"# Function: {func.function_name}\\n"
-            functions_code += f"# File: {func.file_path}\\n"
-            functions_code += f"# Line: {func.line_number}\\n\\n"
-            functions_code += func.source_code + "\\n\\n"
+            parts.append(
+                f"{comment} Function: {func.function_name}\n"
+                f"{comment} File: {func.file_path}\n"
+                f"{comment} Line: {func.line_number}\n\n"
+            )
+            parts.append(func.source_code)
+            parts.append("\n\n")
         
-        return functions_code
+        return ''.join(parts)
     
     def _generate_mcp_tool_definitions(self, candidates: List[MCPToolCandidate]) -> List[Dict[str, Any]]:
         """Generate MCP tool definitions for server registration"""
-        tools = []
-        
-        for candidate in candidates:
-            func = candidate.function
-            tool_def = {
+        return [
+            {
                 'name': candidate.suggested_tool_name,
                 'description': candidate.description,
                 'parameters': candidate.mcp_parameters
             }
-            tools.append(tool_def)
-        
-        return tools
+            for candidate in candidates
+        ]
     
     def _extract_environment_vars(self, candidates: List[MCPToolCandidate]) -> Dict[str, str]:
         """Extract environment variables needed by functions"""
         env_vars = {}
         
         for candidate in candidates:
-            source = candidate.function.source_code.lower()
-            
-            # Look for common environment variable patterns
-            if 'api_key' in source:
-                env_vars['API_KEY'] = '${API_KEY}'
-            if 'database_url' in source or 'db_url' in source:
-                env_vars['DATABASE_URL'] = '${DATABASE_URL}'
-            if 'secret' in source and 'key' in source:
-                env_vars['SECRET_KEY'] = '${SECRET_KEY}'
+            for name in _source_environment_vars(candidate.function.source_code):
+                env_vars[name] = f'${{{name}}}'
         
         return env_vars
     
     def _generate_dockerignore(self, language: str) -> str:
         """Generate .dockerignore file"""
-        common_ignores = [
-            ".git",
-            ".gitignore", 
-            "README.md",
-            "*.md",
-            ".env*",
-            "tests/",
-            "test/",
-            "__pycache__/",
-            "*.pyc",
-            ".pytest_cache/",
-            "node_modules/",
-            ".npm/",
-            "coverage/",
-            ".coverage"
-        ]
-        
-        return '\\n'.join(common_ignores)
+        return _DOCKERIGNORE
     
     def _generate_readme(self, context: Dict[str, Any]) -> str:
         """Generate README for the MCP server"""
@@ -457,41 +709,40 @@ Generated by MCP Gateway Repository Analyzer
     
     def _generate_servers_yaml_entry(self, context: Dict[str, Any]) -> str:
         """Generate servers.yaml entry"""
+        parts = [f"""{context['server_name']}:
+  image: "mcp-{context['server_name']}"
+  command: ["{context.get('runtime', 'python')}", "{context['server_file']}"]
+  description: "Auto-generated from {context['repo_name']}"
+  idle_timeout: 300"""]
+        
         env_vars = context.get('environment_vars', {})
-        env_section = ""
         if env_vars:
-            env_section = "\\n  environment:"
+            parts.append("\n  environment:")
             for key, value in env_vars.items():
-                env_section += f"\\n    {key}: \"{value}\""
+                parts.append(f"\n    {key}: \"{value}\"")
         
-        tools_section = "\\n  tools:"
+        parts.append("\n  tools:")
         for tool in context['mcp_tools']:
-            tools_section += f"""
+            parts.append(f"""
     - name: "{tool['name']}"
       description: "{tool['description']}"
-      parameters: {json.dumps(tool['parameters'], indent=6)}"""
+      parameters: {json.dumps(tool['parameters'], indent=6)}""")
         
-        return f"""{context['server_name']}:
-  image: "mcp-{context['server_name']}"
-  command: ["{context.get('runtime', 'python')}", "{context['server_file']}"]
-  description: "Auto-generated from {context['repo_name']}"
-  idle_timeout: 300{env_section}{tools_section}
-"""
+        parts.append("\n")
+        return ''.join(parts)
     
     def _get_file_extension(self, language: str) -> str:
         """Get file extension for language"""
-        extensions = {
-            'python': 'py',
-            'javascript': 'js',
-            'go': 'go'
-        }
-        return extensions.get(language, 'txt')
+        return _FILE_EXTENSIONS.get(language, 'txt')
     
-    def _sanitize_name(self, name: str) -> str:
+    @staticmethod
+    def _sanitize_name(name: str) -> str:
         """Jinja2 filter to sanitize names"""
-        import re
-        return re.sub(r'[^a-zA-Z0-9_-]', '_', name.lower())
+        if not name.islower():
+            name = name.lower()
+        return _SANITIZE_NAME_RE.sub('_', name)
     
-    def _quote_list(self, items: List[str]) -> str:
+    @staticmethod
+    def _quote_list(items: List[str]) -> str:
         """Jinja2 filter to quote list items"""
         return ', '.join(f'"{item}"' for item in items)
\ No newline at end of file
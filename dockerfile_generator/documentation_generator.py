@@ -6,63 +6,35 @@ for generated MCP servers to ensure proper setup and usage.
 """
 
 import json
-from typing import List, Dict, Any
-from pathlib import Path
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import resources
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, TextIO, Tuple
 from datetime import datetime
 
-# Import from analyzer
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from analyzer.models import MCPToolCandidate
+from ._template_render import TemplateRenderer
 
+# MCPToolCandidate is only needed for annotations; importing it at runtime
+# would require putting the repository root on sys.path
+if TYPE_CHECKING:
+    from analyzer.models import MCPToolCandidate
 
-class DocumentationGenerator:
-    """Generates comprehensive documentation for MCP servers"""
-    
-    def generate_readme(
-        self,
-        candidates: List[MCPToolCandidate],
-        server_name: str,
-        repo_info: Dict[str, Any],
-        language: str = "python"
-    ) -> str:
-        """Generate comprehensive README.md for the MCP server"""
-        
-        tool_count = len(candidates)
-        repo_name = repo_info.get('name', 'Unknown Repository')
-        
-        # Categorize tools by security level
-        safe_tools = []
-        medium_risk_tools = []
-        high_risk_tools = []
-        
-        for candidate in candidates:
-            security_level = getattr(candidate, 'security_level', 'safe').lower()
-            if security_level in ['high', 'critical']:
-                high_risk_tools.append(candidate)
-            elif security_level in ['medium', 'moderate']:
-                medium_risk_tools.append(candidate)
-            else:
-                safe_tools.append(candidate)
-        
-        # Generate tool tables
-        safe_tools_table = self._generate_tools_table(safe_tools) if safe_tools else "None"
-        medium_tools_table = self._generate_tools_table(medium_risk_tools) if medium_risk_tools else "None"
-        high_tools_table = self._generate_tools_table(high_risk_tools) if high_risk_tools else "None"
-        
-        return f"""# {server_name} MCP Server
 
-**Auto-generated MCP Server** - Created from repository: `{repo_name}`
+_README_TEMPLATE = """# {{ server_name }} MCP Server
+
+**Auto-generated MCP Server** - Created from repository: `{{ repo_name }}`
 
-> Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} using Maverick-MCP
+> Generated on {{ generated_on }} using Maverick-MCP
 
 ## Overview
 
-This MCP (Model Context Protocol) server exposes **{tool_count} functions** from the source repository as AI-accessible tools. The server provides comprehensive documentation, examples, and integration guides through built-in prompts and resources.
+This MCP (Model Context Protocol) server exposes **{{ tool_count }} functions** from the source repository as AI-accessible tools. The server provides comprehensive documentation, examples, and integration guides through built-in prompts and resources.
 
 ### Key Features
 
-- ✅ **{tool_count} MCP Tools** - Repository functions exposed as MCP tools
+- ✅ **{{ tool_count }} MCP Tools** - Repository functions exposed as MCP tools
 - 📚 **Built-in Documentation** - Comprehensive prompts and resources
 - 🔒 **Security Classified** - Risk assessment for all functions
 - 🐳 **Docker Ready** - Container deployment support
@@ -71,14 +43,14 @@ This MCP (Model Context Protocol) server exposes **{tool_count} functions** from
 
 ## Tools Overview
 
-### 🟢 Safe Tools ({len(safe_tools)})
-{safe_tools_table}
+### 🟢 Safe Tools ({{ safe_count }})
+{{ safe_tools_table }}
 
-### 🟡 Medium Risk Tools ({len(medium_risk_tools)})
-{medium_tools_table}
+### 🟡 Medium Risk Tools ({{ medium_count }})
+{{ medium_tools_table }}
 
-### 🔴 High Risk Tools ({len(high_risk_tools)})
-{high_tools_table}
+### 🔴 High Risk Tools ({{ high_count }})
+{{ high_tools_table }}
 
 ## Quick Start
 
@@ -102,24 +74,24 @@ This MCP (Model Context Protocol) server exposes **{tool_count} functions** from
 
 3. **Test with MCP client:**
    ```bash
-   echo '{{"jsonrpc":"2.0","method":"initialize","params":{{"protocolVersion":"2024-11-05","clientInfo":{{"name":"test","version":"1.0.0"}},"capabilities":{{}}}},"id":1}}' | python mcp_server.py
+   echo '{"jsonrpc":"2.0","method":"initialize","params":{"protocolVersion":"2024-11-05","clientInfo":{"name":"test","version":"1.0.0"},"capabilities":{}},"id":1}' | python mcp_server.py
    ```
 
 ### Docker Deployment
 
 1. **Build container:**
    ```bash
-   docker build -t {server_name} .
+   docker build -t {{ server_name }} .
    ```
 
 2. **Run container:**
    ```bash
-   docker run -i --rm {server_name}
+   docker run -i --rm {{ server_name }}
    ```
 
 3. **Test container:**
    ```bash
-   echo '{{"jsonrpc":"2.0","method":"tools/list","params":{{}},"id":1}}' | docker run -i --rm {server_name}
+   echo '{"jsonrpc":"2.0","method":"tools/list","params":{},"id":1}' | docker run -i --rm {{ server_name }}
    ```
 
 ## MCP Protocol Usage
@@ -127,41 +99,41 @@ This MCP (Model Context Protocol) server exposes **{tool_count} functions** from
 ### Initialize Connection
 
 ```json
-{{
+{
   "jsonrpc": "2.0",
   "method": "initialize",
-  "params": {{
+  "params": {
     "protocolVersion": "2024-11-05",
-    "clientInfo": {{"name": "your-client", "version": "1.0.0"}},
-    "capabilities": {{}}
-  }},
+    "clientInfo": {"name": "your-client", "version": "1.0.0"},
+    "capabilities": {}
+  },
   "id": 1
-}}
+}
 ```
 
 ### List Available Tools
 
 ```json
-{{
+{
   "jsonrpc": "2.0",
   "method": "tools/list",
-  "params": {{}},
+  "params": {},
   "id": 2
-}}
+}
 ```
 
 ### Call a Tool
 
 ```json
-{{
+{
   "jsonrpc": "2.0",
   "method": "tools/call",
-  "params": {{
+  "params": {
     "name": "tool_name",
-    "arguments": {{"param1": "value1", "param2": "value2"}}
-  }},
+    "arguments": {"param1": "value1", "param2": "value2"}
+  },
   "id": 3
-}}
+}
 ```
 
 ## Built-in Documentation
@@ -177,23 +149,23 @@ This server includes comprehensive documentation accessible via MCP prompts and
 
 ### Available Resources
 
-- **`docs://{server_name}/api`** - Complete API reference
-- **`docs://{server_name}/architecture`** - Architecture documentation
-- **`docs://{server_name}/examples`** - Usage examples for all tools
-- **`docs://{server_name}/integration`** - Integration guides
+- **`docs://{{ server_name }}/api`** - Complete API reference
+- **`docs://{{ server_name }}/architecture`** - Architecture documentation
+- **`docs://{{ server_name }}/examples`** - Usage examples for all tools
+- **`docs://{{ server_name }}/integration`** - Integration guides
 
 ### Example: Get Tool Help
 
 ```json
-{{
+{
   "jsonrpc": "2.0",
   "method": "prompts/get",
-  "params": {{
+  "params": {
     "name": "tool_help",
-    "arguments": {{"tool_name": "your_tool_name"}}
-  }},
+    "arguments": {"tool_name": "your_tool_name"}
+  },
   "id": 4
-}}
+}
 ```
 
 ## Integration Guides
@@ -202,10 +174,10 @@ This server includes comprehensive documentation accessible via MCP prompts and
 
 1. **Add to servers.yaml:**
    ```yaml
-   {server_name}:
-     image: "{server_name}"
+   {{ server_name }}:
+     image: "{{ server_name }}"
      command: ["python", "mcp_server.py"]
-     description: "Generated MCP server from {repo_name}"
+     description: "Generated MCP server from {{ repo_name }}"
      environment:
        PYTHONUNBUFFERED: "1"
      idle_timeout: 300
@@ -225,14 +197,14 @@ This server includes comprehensive documentation accessible via MCP prompts and
 
 1. **Add to `.claude.json`:**
    ```json
-   {{
-     "mcpServers": {{
-       "{server_name}": {{
+   {
+     "mcpServers": {
+       "{{ server_name }}": {
          "command": "docker",
-         "args": ["run", "-i", "--rm", "{server_name}"]
-       }}
-     }}
-   }}
+         "args": ["run", "-i", "--rm", "{{ server_name }}"]
+       }
+     }
+   }
    ```
 
 2. **Test connection:**
@@ -254,16 +226,16 @@ process = subprocess.Popen(
 )
 
 # Initialize connection
-init_message = {{
+init_message = {
     "jsonrpc": "2.0",
     "method": "initialize",
-    "params": {{
+    "params": {
         "protocolVersion": "2024-11-05",
-        "clientInfo": {{"name": "python-client", "version": "1.0.0"}},
-        "capabilities": {{}}
-    }},
+        "clientInfo": {"name": "python-client", "version": "1.0.0"},
+        "capabilities": {}
+    },
     "id": 1
-}}
+}
 
 process.stdin.write(json.dumps(init_message) + "\\n")
 process.stdin.flush()
@@ -294,14 +266,14 @@ Tools are categorized by security risk:
 
 ### Dangerous Operations
 
-{self._generate_security_warnings(high_risk_tools)}
+{{ security_warnings }}
 
 ## Architecture
 
 ### Communication Flow
 
 ```
-AI Model/Client ↔ MCP Protocol ↔ STDIO ↔ {server_name} Server ↔ Original Functions
+AI Model/Client ↔ MCP Protocol ↔ STDIO ↔ {{ server_name }} Server ↔ Original Functions
 ```
 
 ### Components
@@ -323,7 +295,7 @@ AI Model/Client ↔ MCP Protocol ↔ STDIO ↔ {server_name} Server ↔ Original
 ### Project Structure
 
 ```
-{server_name}/
+{{ server_name }}/
 ├── mcp_server.py           # Generated MCP server
 ├── original_functions.py   # Original repository functions
 ├── requirements.txt        # Python dependencies
@@ -373,72 +345,24 @@ This is an auto-generated MCP server. To modify:
 
 ## License
 
-This generated MCP server inherits the license of the source repository: `{repo_name}`.
+This generated MCP server inherits the license of the source repository: `{{ repo_name }}`.
 
 ## Generated by Maverick-MCP
 
 - **Generator**: Maverick-MCP Intelligent Repository Conversion Platform
 - **Version**: 1.0.0
-- **Generated**: {datetime.now().isoformat()}
-- **Source Repository**: {repo_name}
-- **Repository Path**: {repo_info.get('path', 'Unknown')}
+- **Generated**: {{ generated_at }}
+- **Source Repository**: {{ repo_name }}
+- **Repository Path**: {{ repo_path }}
 
 For more information about Maverick-MCP, visit: https://github.com/your-repo/maverick-mcp
 """
 
-    def _generate_tools_table(self, tools: List[MCPToolCandidate]) -> str:
-        """Generate a markdown table of tools"""
-        if not tools:
-            return "None available"
-        
-        rows = []
-        for tool in tools:
-            param_count = len(tool.function.parameters)
-            required_params = len([p for p in tool.function.parameters if p.required])
-            
-            rows.append(f"| `{tool.suggested_tool_name}` | {tool.description[:60]}{'...' if len(tool.description) > 60 else ''} | {param_count} ({required_params} req) | {tool.mcp_score}/10 |")
-        
-        table = """| Tool Name | Description | Parameters | Score |
-|-----------|-------------|------------|-------|
-""" + "\n".join(rows)
-        
-        return table
-    
-    def _generate_security_warnings(self, high_risk_tools: List[MCPToolCandidate]) -> str:
-        """Generate security warnings for high-risk tools"""
-        if not high_risk_tools:
-            return "No high-risk tools detected."
-        
-        warnings = []
-        for tool in high_risk_tools:
-            warnings.append(f"- **`{tool.suggested_tool_name}`**: {tool.description}")
-        
-        return f"""⚠️  **HIGH RISK TOOLS DETECTED**
-
-The following tools have been identified as having significant security implications:
-
-{chr(10).join(warnings)}
-
-**Recommendation**: Review these tools carefully and consider:
-- Restricting access through authentication/authorization
-- Running in isolated containers with limited privileges  
-- Monitoring usage and outputs
-- Implementing additional input validation
-- Using read-only file systems where possible"""
-
-    def generate_integration_guide(
-        self,
-        server_name: str,
-        repo_info: Dict[str, Any],
-        candidates: List[MCPToolCandidate]
-    ) -> str:
-        """Generate detailed integration guide"""
-        
-        return f"""# {server_name} Integration Guide
+_INTEGRATION_GUIDE_TEMPLATE = """# {{ server_name }} Integration Guide
 
 ## Overview
 
-This guide provides detailed instructions for integrating the `{server_name}` MCP server with various systems and clients.
+This guide provides detailed instructions for integrating the `{{ server_name }}` MCP server with various systems and clients.
 
 ## Integration Options
 
@@ -451,10 +375,10 @@ The easiest way to deploy and manage this MCP server is through the Maverick-MCP
 Add this entry to your gateway's `servers.yaml`:
 
 ```yaml
-{server_name}:
-  image: "{server_name}"
+{{ server_name }}:
+  image: "{{ server_name }}"
   command: ["python", "mcp_server.py"]
-  description: "Generated MCP server from {repo_info.get('name', 'repository')}"
+  description: "Generated MCP server from {{ repo_name }}"
   environment:
     PYTHONUNBUFFERED: "1"
     DEBUG: "0"  # Set to "1" for verbose logging
@@ -468,13 +392,13 @@ Add this entry to your gateway's `servers.yaml`:
 
 1. **Build Docker image:**
    ```bash
-   cd /path/to/{server_name}
-   docker build -t {server_name} .
+   cd /path/to/{{ server_name }}
+   docker build -t {{ server_name }} .
    ```
 
 2. **Test the image:**
    ```bash
-   docker run -i --rm {server_name} <<< '{{"jsonrpc":"2.0","method":"tools/list","params":{{}},"id":1}}'
+   docker run -i --rm {{ server_name }} <<< '{"jsonrpc":"2.0","method":"tools/list","params":{},"id":1}'
    ```
 
 3. **Update gateway configuration:**
@@ -491,7 +415,7 @@ Add this entry to your gateway's `servers.yaml`:
    # Test via gateway
    curl -X POST http://localhost:8000/mcp \\
      -H "Content-Type: application/json" \\
-     -d '{{"jsonrpc":"2.0","method":"tools/list","params":{{}},"id":1}}'
+     -d '{"jsonrpc":"2.0","method":"tools/list","params":{},"id":1}'
    ```
 
 #### Benefits of Gateway Integration
@@ -511,17 +435,17 @@ Integrate directly with Claude Code for development and testing.
 Add to your project's `.claude.json`:
 
 ```json
-{{
-  "mcpServers": {{
-    "{server_name}": {{
+{
+  "mcpServers": {
+    "{{ server_name }}": {
       "command": "python",
-      "args": ["/path/to/{server_name}/mcp_server.py"],
-      "env": {{
+      "args": ["/path/to/{{ server_name }}/mcp_server.py"],
+      "env": {
         "PYTHONUNBUFFERED": "1"
-      }}
-    }}
-  }}
-}}
+      }
+    }
+  }
+}
 ```
 
 #### Docker-based Claude Code Integration
@@ -529,19 +453,19 @@ Add to your project's `.claude.json`:
 For containerized deployment with Claude Code:
 
 ```json
-{{
-  "mcpServers": {{
-    "{server_name}": {{
+{
+  "mcpServers": {
+    "{{ server_name }}": {
       "command": "docker",
       "args": [
         "run",
         "-i",
         "--rm",
-        "{server_name}"
+        "{{ server_name }}"
       ]
-    }}
-  }}
-}}
+    }
+  }
+}
 ```
 
 #### Testing Claude Code Integration
@@ -584,25 +508,25 @@ class MCPClient:
     
     async def initialize(self):
         \"\"\"Initialize MCP connection\"\"\"
-        init_message = {{
+        init_message = {
             "jsonrpc": "2.0",
             "method": "initialize",
-            "params": {{
+            "params": {
                 "protocolVersion": "2024-11-05",
-                "clientInfo": {{"name": "python-client", "version": "1.0.0"}},
-                "capabilities": {{}}
-            }},
+                "clientInfo": {"name": "python-client", "version": "1.0.0"},
+                "capabilities": {}
+            },
             "id": self._next_id()
-        }}
+        }
         
         response = await self.send_message(init_message)
         
         # Send initialized notification
-        initialized_message = {{
+        initialized_message = {
             "jsonrpc": "2.0",
             "method": "notifications/initialized",
-            "params": {{}}
-        }}
+            "params": {}
+        }
         
         self.process.stdin.write(json.dumps(initialized_message) + "\\n")
         self.process.stdin.flush()
@@ -620,31 +544,31 @@ class MCPClient:
     
     async def list_tools(self) -> List[Dict[str, Any]]:
         \"\"\"List available tools\"\"\"
-        message = {{
+        message = {
             "jsonrpc": "2.0",
             "method": "tools/list",
-            "params": {{}},
+            "params": {},
             "id": self._next_id()
-        }}
+        }
         
         response = await self.send_message(message)
-        return response.get("result", {{}}).get("tools", [])
+        return response.get("result", {}).get("tools", [])
     
     async def call_tool(self, name: str, arguments: Dict[str, Any] = None) -> Any:
         \"\"\"Call a specific tool\"\"\"
-        message = {{
+        message = {
             "jsonrpc": "2.0",
             "method": "tools/call",
-            "params": {{
+            "params": {
                 "name": name,
-                "arguments": arguments or {{}}
-            }},
+                "arguments": arguments or {}
+            },
             "id": self._next_id()
-        }}
+        }
         
         response = await self.send_message(message)
         if "error" in response:
-            raise Exception(f"Tool call failed: {{response['error']}}")
+            raise Exception(f"Tool call failed: {response['error']}")
         
         return response.get("result")
     
@@ -660,20 +584,20 @@ class MCPClient:
 
 # Usage example
 async def main():
-    client = MCPClient("/path/to/{server_name}/mcp_server.py")
+    client = MCPClient("/path/to/{{ server_name }}/mcp_server.py")
     
     try:
         await client.start()
         
         # List available tools
         tools = await client.list_tools()
-        print(f"Available tools: {{[t['name'] for t in tools]}}")
+        print(f"Available tools: {[t['name'] for t in tools]}")
         
         # Call a tool (example)
         if tools:
             tool_name = tools[0]['name']
-            result = await client.call_tool(tool_name, {{}})
-            print(f"Tool result: {{result}}")
+            result = await client.call_tool(tool_name, {})
+            print(f"Tool result: {result}")
     
     finally:
         await client.close()
@@ -693,12 +617,12 @@ Deploy using container orchestration platforms.
 version: '3.8'
 
 services:
-  {server_name}:
+  {{ server_name }}:
     build:
       context: .
       dockerfile: Dockerfile
-    image: {server_name}:latest
-    container_name: {server_name}
+    image: {{ server_name }}:latest
+    container_name: {{ server_name }}
     stdin_open: true
     tty: true
     restart: unless-stopped
@@ -711,7 +635,7 @@ services:
       timeout: 10s
       retries: 3
     labels:
-      - "mcp.server.name={server_name}"
+      - "mcp.server.name={{ server_name }}"
       - "mcp.server.type=generated"
 ```
 
@@ -721,23 +645,23 @@ services:
 apiVersion: apps/v1
 kind: Deployment
 metadata:
-  name: {server_name}
+  name: {{ server_name }}
   labels:
-    app: {server_name}
+    app: {{ server_name }}
     type: mcp-server
 spec:
   replicas: 1
   selector:
     matchLabels:
-      app: {server_name}
+      app: {{ server_name }}
   template:
     metadata:
       labels:
-        app: {server_name}
+        app: {{ server_name }}
     spec:
       containers:
-      - name: {server_name}
-        image: {server_name}:latest
+      - name: {{ server_name }}
+        image: {{ server_name }}:latest
         stdin: true
         tty: true
         env:
@@ -762,10 +686,10 @@ spec:
 apiVersion: v1
 kind: Service
 metadata:
-  name: {server_name}-service
+  name: {{ server_name }}-service
 spec:
   selector:
-    app: {server_name}
+    app: {{ server_name }}
   ports:
   - port: 80
     targetPort: 8080
@@ -778,13 +702,13 @@ spec:
 
 ```bash
 #!/bin/bash
-# {server_name} Integration Test
+# {{ server_name }} Integration Test
 
-echo "Testing {server_name} MCP Server Integration..."
+echo "Testing {{ server_name }} MCP Server Integration..."
 
 # Test 1: Basic STDIO communication
 echo "1. Testing STDIO communication..."
-echo '{{"jsonrpc":"2.0","method":"initialize","params":{{"protocolVersion":"2024-11-05","clientInfo":{{"name":"test","version":"1.0.0"}},"capabilities":{{}}}},"id":1}}' | python mcp_server.py > /tmp/init_response.json
+echo '{"jsonrpc":"2.0","method":"initialize","params":{"protocolVersion":"2024-11-05","clientInfo":{"name":"test","version":"1.0.0"},"capabilities":{}},"id":1}' | python mcp_server.py > /tmp/init_response.json
 
 if grep -q "result" /tmp/init_response.json; then
     echo "   ✅ STDIO communication working"
@@ -795,9 +719,9 @@ fi
 
 # Test 2: Tools discovery
 echo "2. Testing tools discovery..."
-(echo '{{"jsonrpc":"2.0","method":"initialize","params":{{"protocolVersion":"2024-11-05","clientInfo":{{"name":"test","version":"1.0.0"}},"capabilities":{{}}}},"id":1}}'; \\
- echo '{{"jsonrpc":"2.0","method":"notifications/initialized","params":{{}}}}'; \\
- echo '{{"jsonrpc":"2.0","method":"tools/list","params":{{}},"id":2}}') | python mcp_server.py > /tmp/tools_response.json
+(echo '{"jsonrpc":"2.0","method":"initialize","params":{"protocolVersion":"2024-11-05","clientInfo":{"name":"test","version":"1.0.0"},"capabilities":{}},"id":1}'; \\
+ echo '{"jsonrpc":"2.0","method":"notifications/initialized","params":{}}'; \\
+ echo '{"jsonrpc":"2.0","method":"tools/list","params":{},"id":2}') | python mcp_server.py > /tmp/tools_response.json
 
 if grep -q "tools" /tmp/tools_response.json; then
     echo "   ✅ Tools discovery working"
@@ -810,10 +734,10 @@ fi
 
 # Test 3: Docker container
 echo "3. Testing Docker container..."
-if docker build -t {server_name}-test . > /dev/null 2>&1; then
+if docker build -t {{ server_name }}-test . > /dev/null 2>&1; then
     echo "   ✅ Docker build successful"
     
-    if echo '{{"jsonrpc":"2.0","method":"tools/list","params":{{}},"id":1}}' | docker run -i --rm {server_name}-test | grep -q "tools"; then
+    if echo '{"jsonrpc":"2.0","method":"tools/list","params":{},"id":1}' | docker run -i --rm {{ server_name }}-test | grep -q "tools"; then
         echo "   ✅ Container execution working"
     else
         echo "   ❌ Container execution failed"
@@ -835,7 +759,7 @@ import statistics
 from mcp_client import MCPClient  # Using the client from above
 
 async def benchmark_tools():
-    client = MCPClient("/path/to/{server_name}/mcp_server.py")
+    client = MCPClient("/path/to/{{ server_name }}/mcp_server.py")
     
     try:
         await client.start()
@@ -850,17 +774,17 @@ async def benchmark_tools():
             for i in range(10):
                 start_time = time.time()
                 try:
-                    await client.call_tool(tool_name, {{}})
+                    await client.call_tool(tool_name, {})
                     end_time = time.time()
                     times.append(end_time - start_time)
                 except Exception as e:
-                    print(f"Tool {{tool_name}} failed: {{e}}")
+                    print(f"Tool {tool_name} failed: {e}")
                     continue
             
             if times:
                 avg_time = statistics.mean(times)
                 median_time = statistics.median(times)
-                print(f"{{tool_name}}: avg={{avg_time:.3f}}s, median={{median_time:.3f}}s")
+                print(f"{tool_name}: avg={avg_time:.3f}s, median={median_time:.3f}s")
     
     finally:
         await client.close()
@@ -885,12 +809,12 @@ Implement health check endpoints:
 ```python
 # Add to mcp_server.py for health monitoring
 def health_check():
-    return {{
+    return {
         "status": "healthy",
         "timestamp": time.time(),
         "tools_count": len(available_tools),
         "memory_usage": get_memory_usage()
-    }}
+    }
 ```
 
 ### Metrics Collection
@@ -947,618 +871,454 @@ Monitor key metrics:
 For additional support, use the built-in troubleshooting prompt or check the server logs.
 """
 
-    def generate_servers_yaml_entry(
-        self,
-        server_name: str,
-        repo_info: Dict[str, Any],
-        candidates: List[MCPToolCandidate]
-    ) -> str:
-        """Generate servers.yaml entry for gateway integration"""
-        
-        # Generate tool definitions for the yaml entry
-        tools_yaml = []
-        for candidate in candidates:
-            # Create comprehensive tool description
-            tool_entry = f"""  - name: "{candidate.suggested_tool_name}"
-    description: |
-      {candidate.description}
-      
-      Original function: {candidate.function.function_name}() from {candidate.function.file_path}
-      Security level: {getattr(candidate, 'security_level', 'safe')}
-      MCP score: {candidate.mcp_score}/10
-    
-    when_to_use: |
-      Use this tool when you need to {candidate.description.lower()}.
-      {"⚠️  High security risk - review parameters carefully" if getattr(candidate, 'security_level', 'safe').lower() in ['high', 'critical'] else "Safe for general use"}
-    
-    parameters:
-      type: "object"
-      properties:"""
-        
-            # Add parameter definitions
-            for param in candidate.function.parameters:
-                param_desc = f"""        {param.name}:
-          type: "{param.type_hint.lower() if param.type_hint else 'string'}"
-          description: "{param.description or f'Parameter {param.name}'}"
-          {"" if param.required else f'          default: {param.default_value or "null"}'}"""
-                tool_entry += f"\n{param_desc}"
-            
-            # Add required parameters
-            required_params = [p.name for p in candidate.function.parameters if p.required]
-            if required_params:
-                tool_entry += f"\n      required: {json.dumps(required_params)}"
-            
-            # Add examples
-            tool_entry += f"""
-    
-    examples:
-      - description: "Basic usage example"
-        parameters:"""
-            
-            # Generate example parameters
-            for param in candidate.function.parameters[:2]:  # Limit to first 2 params
-                if 'int' in (param.type_hint or 'string').lower():
-                    example_val = 42
-                elif 'float' in (param.type_hint or 'string').lower():
-                    example_val = 3.14
-                elif 'bool' in (param.type_hint or 'string').lower():
-                    example_val = True
-                else:
-                    example_val = "example_value"
-                
-                tool_entry += f"\n          {param.name}: {json.dumps(example_val)}"
-            
-            tool_entry += f"""
-        expected_output: |
-          Execution result from {candidate.function.function_name}() function"""
-            
-            tools_yaml.append(tool_entry)
-        
-        tools_section = "\n".join(tools_yaml)
-        
-        return f"""# Add this entry to your servers.yaml file
+_SERVERS_YAML_TEMPLATE = """# Add this entry to your servers.yaml file
 
-{server_name}:
-  image: "{server_name}"
+{{ server_name }}:
+  image: "{{ server_name }}"
   command: ["python", "mcp_server.py"]
   description: |
-    Generated MCP server from repository: {repo_info.get('name', 'unknown')}
+    Generated MCP server from repository: {{ repo_name }}
     
-    This server exposes {len(candidates)} functions as MCP tools with comprehensive
+    This server exposes {{ tool_count }} functions as MCP tools with comprehensive
     documentation via built-in prompts and resources. Generated by Maverick-MCP
-    on {datetime.now().strftime('%Y-%m-%d')}.
+    on {{ generated_date }}.
     
-    Available tools: {', '.join([c.suggested_tool_name for c in candidates[:5]])}
-    {'...' if len(candidates) > 5 else ''}
+    Available tools: {{ tool_preview }}
+    {{ preview_more }}
     
   environment:
     PYTHONUNBUFFERED: "1"
-    DEBUG: "${{DEBUG:-0}}"  # Set to 1 for debug logging
+    DEBUG: "${DEBUG:-0}"  # Set to 1 for debug logging
   idle_timeout: 300  # 5 minutes
   
   tools:
-{tools_section}
+{{ tool_entries }}
   
   # Additional metadata
   meta:
     generator: "Maverick-MCP"
     version: "1.0.0"
-    generated: "{datetime.now().isoformat()}"
-    source_repo: "{repo_info.get('name', 'unknown')}"
-    tool_count: {len(candidates)}
+    generated: "{{ generated_at }}"
+    source_repo: "{{ repo_name }}"
+    tool_count: {{ tool_count }}
     security_levels:
-      safe: {len([c for c in candidates if getattr(c, 'security_level', 'safe').lower() == 'safe'])}
-      medium: {len([c for c in candidates if getattr(c, 'security_level', 'safe').lower() == 'medium'])}
-      high: {len([c for c in candidates if getattr(c, 'security_level', 'safe').lower() in ['high', 'critical']])}"""
+      safe: {{ safe_count }}
+      medium: {{ medium_count }}
+      high: {{ high_count }}"""
 
-    def generate_deployment_guide(self, server_name: str, candidates: List[MCPToolCandidate]) -> str:
-        """Generate deployment guide for various platforms"""
-        
-        return f"""# {server_name} Deployment Guide
 
-## Production Deployment Options
+# The deployment guide is the largest document, so it ships as a package
+# resource instead of a source literal
+_DEPLOYMENT_GUIDE_TEMPLATE = resources.files(__package__).joinpath(
+    "templates/deployment_guide.md.j2"
+).read_text(encoding="utf-8")
 
-### 1. Maverick-MCP Gateway (Recommended)
+_TEMPLATES = {
+    "readme": _README_TEMPLATE,
+    "integration": _INTEGRATION_GUIDE_TEMPLATE,
+    "servers_yaml": _SERVERS_YAML_TEMPLATE,
+    "deployment": _DEPLOYMENT_GUIDE_TEMPLATE,
+}
 
-The simplest production deployment through the Maverick-MCP Gateway system.
+_RENDERER = TemplateRenderer(_TEMPLATES)
 
-#### Prerequisites
-- Maverick-MCP Gateway installed and running
-- Docker installed
-- Sufficient system resources
+# JSON-encoded example values by type hint substring, checked in order
+_EXAMPLE_VALUES_JSON = {
+    "int": "42",
+    "float": "3.14",
+    "bool": "true",
+}
 
-#### Deployment Steps
+def _security_level(candidate: 'MCPToolCandidate') -> str:
+    """Lower-cased security level of a candidate, treating a missing level as safe"""
+    return getattr(candidate, 'security_level', 'safe').lower()
 
-1. **Build and test locally:**
-   ```bash
-   # Build Docker image
-   docker build -t {server_name} .
-   
-   # Test the image
-   echo '{{"jsonrpc":"2.0","method":"tools/list","params":{{}},"id":1}}' | docker run -i --rm {server_name}
-   ```
 
-2. **Add to gateway configuration:**
-   ```bash
-   # Edit servers.yaml
-   sudo vim /path/to/gateway/servers.yaml
-   # Add the server entry (see servers.yaml example)
-   ```
+def _stream_template(fp: TextIO, name: str, context: Dict[str, Any]):
+    """Stream a documentation template into fp chunk by chunk"""
+    fp.writelines(_RENDERER.generate(name, context))
 
-3. **Deploy:**
-   ```bash
-   # Restart gateway to pick up new configuration
-   sudo systemctl restart mcp-gateway
-   
-   # Verify deployment
-   curl http://localhost:8000/tools/list | grep {server_name}
-   ```
-
-### 2. Docker Compose Deployment
-
-For standalone deployment or development environments.
-
-#### docker-compose.yml
-```yaml
-version: '3.8'
-
-services:
-  {server_name}:
-    build:
-      context: .
-      dockerfile: Dockerfile
-    image: {server_name}:latest
-    container_name: {server_name}
-    stdin_open: true
-    tty: true
-    restart: unless-stopped
-    environment:
-      - PYTHONUNBUFFERED=1
-      - DEBUG=0
-    volumes:
-      - ./logs:/app/logs  # Optional: for log persistence
-    networks:
-      - mcp-network
-    healthcheck:
-      test: ["CMD", "python", "-c", "import sys; print('OK')"]
-      interval: 30s
-      timeout: 10s
-      retries: 3
-    labels:
-      - "mcp.server.name={server_name}"
-      - "mcp.server.type=generated"
-      - "mcp.tools.count={len(candidates)}"
-
-networks:
-  mcp-network:
-    driver: bridge
-
-volumes:
-  logs:
-    driver: local
-```
-
-#### Deployment Commands
-```bash
-# Start services
-docker-compose up -d
-
-# Check status
-docker-compose ps
-
-# View logs
-docker-compose logs -f {server_name}
-
-# Stop services
-docker-compose down
-```
-
-### 3. Kubernetes Deployment
-
-For scalable production environments.
-
-#### Namespace
-```yaml
-apiVersion: v1
-kind: Namespace
-metadata:
-  name: mcp-servers
-  labels:
-    name: mcp-servers
-```
-
-#### Deployment
-```yaml
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: {server_name}
-  namespace: mcp-servers
-  labels:
-    app: {server_name}
-    type: mcp-server
-spec:
-  replicas: 2  # Scale as needed
-  selector:
-    matchLabels:
-      app: {server_name}
-  template:
-    metadata:
-      labels:
-        app: {server_name}
-    spec:
-      containers:
-      - name: {server_name}
-        image: {server_name}:latest
-        imagePullPolicy: Always
-        stdin: true
-        tty: true
-        ports:
-        - containerPort: 8080
-          name: http
-        env:
-        - name: PYTHONUNBUFFERED
-          value: "1"
-        - name: DEBUG
-          value: "0"
-        resources:
-          requests:
-            memory: "128Mi"
-            cpu: "100m"
-          limits:
-            memory: "512Mi"
-            cpu: "500m"
-        livenessProbe:
-          exec:
-            command:
-            - python
-            - -c
-            - "print('healthy')"
-          initialDelaySeconds: 30
-          periodSeconds: 30
-        readinessProbe:
-          exec:
-            command:
-            - python
-            - -c
-            - "print('ready')"
-          initialDelaySeconds: 5
-          periodSeconds: 10
-        volumeMounts:
-        - name: logs
-          mountPath: /app/logs
-      volumes:
-      - name: logs
-        emptyDir: {{}}
-      restartPolicy: Always
-```
 
-#### Service
-```yaml
-apiVersion: v1
-kind: Service
-metadata:
-  name: {server_name}-service
-  namespace: mcp-servers
-spec:
-  selector:
-    app: {server_name}
-  ports:
-  - name: http
-    port: 80
-    targetPort: 8080
-    protocol: TCP
-  type: ClusterIP
-```
-
-#### Deploy to Kubernetes
-```bash
-# Apply configurations
-kubectl apply -f namespace.yaml
-kubectl apply -f deployment.yaml
-kubectl apply -f service.yaml
-
-# Check deployment
-kubectl get pods -n mcp-servers
-kubectl logs -f deployment/{server_name} -n mcp-servers
-
-# Scale deployment
-kubectl scale deployment {server_name} --replicas=3 -n mcp-servers
-```
-
-## Monitoring and Observability
-
-### Logging Configuration
-
-#### Structured Logging
-```python
-import logging
-import json
-from datetime import datetime
-
-# Configure structured logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s'
-)
-
-def log_tool_execution(tool_name, parameters, result, duration):
-    log_entry = {{
-        "timestamp": datetime.utcnow().isoformat(),
-        "event": "tool_execution",
-        "tool": tool_name,
-        "parameters": parameters,
-        "success": "error" not in str(result).lower(),
-        "duration_ms": duration * 1000
-    }}
-    logging.info(json.dumps(log_entry))
-```
-
-#### Log Aggregation with ELK Stack
-```yaml
-# filebeat.yml
-filebeat.inputs:
-- type: container
-  paths:
-    - '/var/lib/docker/containers/*/*.log'
-  processors:
-    - add_docker_metadata:
-        host: "unix:///var/run/docker.sock"
-
-output.elasticsearch:
-  hosts: ["elasticsearch:9200"]
-  index: "mcp-servers-%{{+yyyy.MM.dd}}"
-
-# Kibana dashboard for MCP server logs
-```
-
-### Metrics Collection
-
-#### Prometheus Metrics
-```python
-from prometheus_client import Counter, Histogram, Gauge, start_http_server
-
-# Metrics
-TOOL_CALLS = Counter('mcp_tool_calls_total', 'Total tool calls', ['tool_name', 'status'])
-TOOL_DURATION = Histogram('mcp_tool_duration_seconds', 'Tool execution duration', ['tool_name'])
-ACTIVE_CONNECTIONS = Gauge('mcp_active_connections', 'Active MCP connections')
-
-def record_tool_call(tool_name, duration, success):
-    TOOL_CALLS.labels(tool_name=tool_name, status='success' if success else 'error').inc()
-    TOOL_DURATION.labels(tool_name=tool_name).observe(duration)
-
-# Start metrics server
-start_http_server(8080)
-```
-
-### Health Checks
-
-#### Docker Health Check
-```dockerfile
-# Add to Dockerfile
-HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
-  CMD python -c "
-import json, subprocess
-proc = subprocess.run(['python', 'mcp_server.py'], 
-                     input='{{\\"jsonrpc\\": \\"2.0\\", \\"method\\": \\"tools/list\\", \\"id\\": 1}}',
-                     capture_output=True, text=True, timeout=5)
-response = json.loads(proc.stdout.strip())
-assert 'result' in response and 'tools' in response['result']
-print('Health check passed')
-" || exit 1
-```
-
-#### Kubernetes Liveness/Readiness Probes
-```yaml
-livenessProbe:
-  exec:
-    command:
-    - /bin/sh
-    - -c
-    - |
-      python3 -c "
-      import json, subprocess, sys
-      try:
-          proc = subprocess.run(['python3', 'mcp_server.py'], 
-                               input='{{\\"jsonrpc\\": \\"2.0\\", \\"method\\": \\"tools/list\\", \\"id\\": 1}}',
-                               capture_output=True, text=True, timeout=5)
-          response = json.loads(proc.stdout.strip())
-          assert 'result' in response
-          print('Liveness check passed')
-      except Exception as e:
-          print(f'Liveness check failed: {{e}}')
-          sys.exit(1)
-      "
-  initialDelaySeconds: 30
-  periodSeconds: 30
-
-readinessProbe:
-  exec:
-    command:
-    - python3
-    - -c
-    - "import mcp_server; print('Ready')"
-  initialDelaySeconds: 5
-  periodSeconds: 10
-```
-
-## Security Hardening
-
-### Container Security
-
-#### Secure Dockerfile
-```dockerfile
-FROM python:3.11-slim
-
-# Create non-root user
-RUN groupadd -r mcpuser && useradd -r -g mcpuser mcpuser
-
-# Install dependencies
-WORKDIR /app
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-# Copy application
-COPY --chown=mcpuser:mcpuser . .
-
-# Security hardening
-RUN chmod -R 755 /app && \\
-    chmod 644 /app/mcp_server.py && \\
-    rm -rf /tmp/* /var/tmp/* && \\
-    apt-get clean
-
-# Switch to non-root user
-USER mcpuser
-
-# Run with minimal privileges
-CMD ["python", "mcp_server.py"]
-```
-
-#### Security Scanning
-```bash
-# Scan Docker image for vulnerabilities
-docker run --rm -v /var/run/docker.sock:/var/run/docker.sock \\
-  aquasec/trivy image {server_name}:latest
-
-# Scan for secrets
-docker run --rm -v $(pwd):/workspace \\
-  trufflesecurity/trufflehog filesystem /workspace
-
-# Container security benchmark
-docker run --rm --net host --pid host --userns host --cap-add audit_control \\
-  -v /var/lib:/var/lib -v /var/run/docker.sock:/var/run/docker.sock \\
-  docker/docker-bench-security
-```
-
-### Network Security
-
-#### Container Network Isolation
-```yaml
-# docker-compose.yml with network isolation
-services:
-  {server_name}:
-    # ... other config
-    networks:
-      - mcp-internal
-    security_opt:
-      - no-new-privileges:true
-    read_only: true
-    tmpfs:
-      - /tmp
-      - /var/tmp
-
-networks:
-  mcp-internal:
-    driver: bridge
-    internal: true  # No external access
-```
-
-### Access Control
+@lru_cache(maxsize=32)
+def _integration_guide(server_name: str, repo_name: str) -> str:
+    """
+    Render the integration guide, which depends only on the server and repository names
+    
+    Args:
+        server_name: Name of the generated server
+        repo_name: Name of the source repository
+        
+    Returns:
+        Integration guide markdown
+    """
+    return _RENDERER.render("integration", {'server_name': server_name, 'repo_name': repo_name})
 
-#### RBAC for Kubernetes
-```yaml
-apiVersion: v1
-kind: ServiceAccount
-metadata:
-  name: {server_name}-sa
-  namespace: mcp-servers
 
----
-apiVersion: rbac.authorization.k8s.io/v1
-kind: Role
-metadata:
-  name: {server_name}-role
-  namespace: mcp-servers
-rules:
-- apiGroups: [""]
-  resources: ["pods", "services"]
-  verbs: ["get", "list"]
+def _deployment_context(server_name: str, tool_count: int) -> Dict[str, Any]:
+    """
+    Build the deployment guide template context
+    
+    Memory requests grow with the number of tools the server imports. CPU
+    requests grow more slowly and are capped, since idle tools cost no CPU.
+    Limits allow 4x headroom over requests.
+    
+    Args:
+        server_name: Name of the generated server
+        tool_count: Number of tools the server exposes
+        
+    Returns:
+        Template context with memory in MiB and CPU in millicores
+    """
+    memory_request = 64 + 2 * tool_count
+    cpu_request = min(50 + 5 * tool_count, 250)
+    return {
+        'server_name': server_name,
+        'tool_count': tool_count,
+        'memory_request': memory_request,
+        'memory_limit': 4 * memory_request,
+        'cpu_request': cpu_request,
+        'cpu_limit': 4 * cpu_request,
+    }
+
+
+@lru_cache(maxsize=256)
+def _deployment_guide(server_name: str, tool_count: int) -> str:
+    """
+    Render the deployment guide, which depends only on the server name and tool count
+    
+    Args:
+        server_name: Name of the generated server
+        tool_count: Number of tools the server exposes
+        
+    Returns:
+        Deployment guide markdown
+    """
+    return _RENDERER.render("deployment", _deployment_context(server_name, tool_count))
 
----
-apiVersion: rbac.authorization.k8s.io/v1
-kind: RoleBinding
-metadata:
-  name: {server_name}-binding
-  namespace: mcp-servers
-subjects:
-- kind: ServiceAccount
-  name: {server_name}-sa
-  namespace: mcp-servers
-roleRef:
-  kind: Role
-  name: {server_name}-role
-  apiGroup: rbac.authorization.k8s.io
-```
 
-## Backup and Disaster Recovery
+@lru_cache(maxsize=64)
+def _tools_table(rows: Tuple[Tuple[str, str, int, int, str], ...]) -> str:
+    """
+    Render the markdown tools table
+    
+    Args:
+        rows: (tool name, description, parameter count, required count, score) per tool
+        
+    Returns:
+        Markdown table
+    """
+    lines = [
+        "| Tool Name | Description | Parameters | Score |",
+        "|-----------|-------------|------------|-------|",
+    ]
+    for name, description, param_count, required_params, score in rows:
+        short = description if len(description) <= 60 else description[:60] + '...'
+        lines.append(f"| `{name}` | {short} | {param_count} ({required_params} req) | {score}/10 |")
+    
+    return "\n".join(lines)
 
-### Configuration Backup
-```bash
-#!/bin/bash
-# backup-mcp-config.sh
 
-BACKUP_DIR="/backup/mcp-{server_name}"
-DATE=$(date +%Y%m%d_%H%M%S)
+@lru_cache(maxsize=64)
+def _security_warnings(tools: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Render the security warnings section
+    
+    Args:
+        tools: (tool name, description) per high-risk tool
+        
+    Returns:
+        Markdown warnings section
+    """
+    warnings = "\n".join(f"- **`{name}`**: {description}" for name, description in tools)
+    
+    return f"""⚠️  **HIGH RISK TOOLS DETECTED**
 
-# Create backup directory
-mkdir -p "$BACKUP_DIR/$DATE"
+The following tools have been identified as having significant security implications:
 
-# Backup configuration
-cp servers.yaml "$BACKUP_DIR/$DATE/"
-cp docker-compose.yml "$BACKUP_DIR/$DATE/"
-cp -r kubernetes/ "$BACKUP_DIR/$DATE/"
+{warnings}
 
-# Backup Docker image
-docker save {server_name}:latest | gzip > "$BACKUP_DIR/$DATE/{server_name}.tar.gz"
+**Recommendation**: Review these tools carefully and consider:
+- Restricting access through authentication/authorization
+- Running in isolated containers with limited privileges  
+- Monitoring usage and outputs
+- Implementing additional input validation
+- Using read-only file systems where possible"""
 
-# Create restore script
-cat > "$BACKUP_DIR/$DATE/restore.sh" << 'EOF'
-#!/bin/bash
-# Restore {server_name}
-echo "Restoring {server_name}..."
 
-# Load Docker image
-gunzip -c {server_name}.tar.gz | docker load
+class DocumentationGenerator:
+    """Generates comprehensive documentation for MCP servers"""
+    
+    def generate_readme(
+        self,
+        candidates: List['MCPToolCandidate'],
+        server_name: str,
+        repo_info: Dict[str, Any],
+        language: str = "python"
+    ) -> str:
+        """Generate comprehensive README.md for the MCP server"""
+        return _RENDERER.render("readme", self._readme_context(candidates, server_name, repo_info))
 
-# Restore configurations
-cp servers.yaml /path/to/gateway/
-cp docker-compose.yml /path/to/deployment/
+    def generate_readme_to(
+        self,
+        fp: TextIO,
+        candidates: List['MCPToolCandidate'],
+        server_name: str,
+        repo_info: Dict[str, Any],
+        language: str = "python"
+    ):
+        """Write the README.md for the MCP server to fp"""
+        _stream_template(fp, "readme", self._readme_context(candidates, server_name, repo_info))
 
-echo "Restore complete. Restart services manually."
-EOF
+    @staticmethod
+    def _readme_context(
+        candidates: List['MCPToolCandidate'],
+        server_name: str,
+        repo_info: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the README template context"""
+        
+        # Categorize tools by security level
+        safe_tools = []
+        medium_risk_tools = []
+        high_risk_tools = []
+        
+        for candidate in candidates:
+            security_level = _security_level(candidate)
+            if security_level in ['high', 'critical']:
+                high_risk_tools.append(candidate)
+            elif security_level in ['medium', 'moderate']:
+                medium_risk_tools.append(candidate)
+            else:
+                safe_tools.append(candidate)
+        
+        now = datetime.now()
+        return {
+            'server_name': server_name,
+            'repo_name': repo_info.get('name', 'Unknown Repository'),
+            'repo_path': repo_info.get('path', 'Unknown'),
+            'tool_count': len(candidates),
+            'generated_on': now.isoformat(' ', 'seconds'),
+            'generated_at': now.isoformat(),
+            'safe_count': len(safe_tools),
+            'medium_count': len(medium_risk_tools),
+            'high_count': len(high_risk_tools),
+            # Generate tool tables
+            'safe_tools_table': DocumentationGenerator._generate_tools_table(safe_tools) if safe_tools else "None",
+            'medium_tools_table': DocumentationGenerator._generate_tools_table(medium_risk_tools) if medium_risk_tools else "None",
+            'high_tools_table': DocumentationGenerator._generate_tools_table(high_risk_tools) if high_risk_tools else "None",
+            'security_warnings': DocumentationGenerator._generate_security_warnings(high_risk_tools),
+        }
+
+    @staticmethod
+    def _generate_tools_table(tools: List['MCPToolCandidate']) -> str:
+        """Generate a markdown table of tools"""
+        if not tools:
+            return "None available"
+        
+        rows = []
+        for tool in tools:
+            params = tool.function.parameters
+            # Scores are keyed by their text so 7 and 7.0 do not share a cache entry
+            rows.append((
+                tool.suggested_tool_name,
+                tool.description,
+                len(params),
+                sum(1 for p in params if p.required),
+                str(tool.mcp_score),
+            ))
+        
+        return _tools_table(tuple(rows))
+    
+    @staticmethod
+    def _generate_security_warnings(high_risk_tools: List['MCPToolCandidate']) -> str:
+        """Generate security warnings for high-risk tools"""
+        if not high_risk_tools:
+            return "No high-risk tools detected."
+        
+        return _security_warnings(tuple((tool.suggested_tool_name, tool.description) for tool in high_risk_tools))
 
-chmod +x "$BACKUP_DIR/$DATE/restore.sh"
-echo "Backup created: $BACKUP_DIR/$DATE"
-```
+    def generate_integration_guide(
+        self,
+        server_name: str,
+        repo_info: Dict[str, Any],
+        candidates: List['MCPToolCandidate']
+    ) -> str:
+        """Generate detailed integration guide"""
+        return _integration_guide(server_name, repo_info.get('name', 'repository'))
 
-### Automated Backup with Cron
-```bash
-# Add to crontab
-0 2 * * * /usr/local/bin/backup-mcp-config.sh
-```
+    def generate_integration_guide_to(
+        self,
+        fp: TextIO,
+        server_name: str,
+        repo_info: Dict[str, Any],
+        candidates: List['MCPToolCandidate']
+    ):
+        """Write the integration guide to fp"""
+        fp.write(_integration_guide(server_name, repo_info.get('name', 'repository')))
 
-## Performance Tuning
+    def generate_servers_yaml_entry(
+        self,
+        server_name: str,
+        repo_info: Dict[str, Any],
+        candidates: List['MCPToolCandidate']
+    ) -> str:
+        """Generate servers.yaml entry for gateway integration"""
+        return _RENDERER.render("servers_yaml", self._servers_yaml_context(server_name, repo_info, candidates))
+    
+    def generate_servers_yaml_entry_to(
+        self,
+        fp: TextIO,
+        server_name: str,
+        repo_info: Dict[str, Any],
+        candidates: List['MCPToolCandidate']
+    ):
+        """Write the servers.yaml entry to fp"""
+        _stream_template(fp, "servers_yaml", self._servers_yaml_context(server_name, repo_info, candidates))
+    
+    @staticmethod
+    def _servers_yaml_context(
+        server_name: str,
+        repo_info: Dict[str, Any],
+        candidates: List['MCPToolCandidate']
+    ) -> Dict[str, Any]:
+        """Build the servers.yaml entry template context"""
+        now = datetime.now()
+        tool_count = len(candidates)
+        security_levels = [_security_level(c) for c in candidates]
+        levels = Counter(security_levels)
+        return {
+            'server_name': server_name,
+            'repo_name': repo_info.get('name', 'unknown'),
+            'tool_count': tool_count,
+            'generated_date': now.date().isoformat(),
+            'generated_at': now.isoformat(),
+            'tool_preview': ', '.join([c.suggested_tool_name for c in candidates[:5]]),
+            'preview_more': '...' if tool_count > 5 else '',
+            # Generate tool definitions for the yaml entry
+            'tool_entries': "\n".join(
+                DocumentationGenerator._generate_yaml_tool_entry(c, level in ['high', 'critical'])
+                for c, level in zip(candidates, security_levels)
+            ),
+            'safe_count': levels['safe'],
+            'medium_count': levels['medium'],
+            'high_count': levels['high'] + levels['critical'],
+        }
+    
+    @staticmethod
+    def _generate_yaml_tool_entry(candidate: 'MCPToolCandidate', high_risk: bool) -> str:
+        """
+        Generate the servers.yaml tool definition for one candidate
+        
+        Args:
+            candidate: Tool candidate to describe
+            high_risk: Whether the candidate's security level is high or critical
+            
+        Returns:
+            YAML tool entry without a trailing newline
+        """
+        
+        # Create comprehensive tool description
+        parts: List[str] = [
+            f'  - name: "{candidate.suggested_tool_name}"',
+            '    description: |',
+            f'      {candidate.description}',
+            '      ',
+            f'      Original function: {candidate.function.function_name}() from {candidate.function.file_path}',
+            f"      Security level: {getattr(candidate, 'security_level', 'safe')}",
+            f'      MCP score: {candidate.mcp_score}/10',
+            '    ',
+            '    when_to_use: |',
+            f'      Use this tool when you need to {candidate.description.lower()}.',
+            "      ⚠️  High security risk - review parameters carefully"
+            if high_risk
+            else "      Safe for general use",
+            '    ',
+            '    parameters:',
+            '      type: "object"',
+            '      properties:',
+        ]
+        
+        # Add parameter definitions, collecting the required ones as we go
+        required_params = []
+        for param in candidate.function.parameters:
+            if param.required:
+                required_params.append(param.name)
+            parts.extend((
+                f'        {param.name}:',
+                f'''          type: "{param.type_hint.lower() if param.type_hint else 'string'}"''',
+                f'''          description: "{param.description or f'Parameter {param.name}'}"''',
+                '          ' if param.required else f'                    default: {param.default_value or "null"}',
+            ))
+        
+        # Add required parameters
+        if required_params:
+            parts.append(f'      required: {json.dumps(required_params)}')
+        
+        # Add examples
+        parts.extend((
+            '    ',
+            '    examples:',
+            '      - description: "Basic usage example"',
+            '        parameters:',
+        ))
+        
+        # Generate example parameters
+        for param in candidate.function.parameters[:2]:  # Limit to first 2 params
+            type_hint = (param.type_hint or 'string').lower()
+            example_json = next(
+                (value for name, value in _EXAMPLE_VALUES_JSON.items() if name in type_hint),
+                '"example_value"'
+            )
+            
+            parts.append(f'          {param.name}: {example_json}')
+        
+        parts.extend((
+            '        expected_output: |',
+            f'          Execution result from {candidate.function.function_name}() function',
+        ))
+        
+        return "\n".join(parts)
 
-### Container Resource Optimization
-```yaml
-# Optimized resource limits
-resources:
-  requests:
-    memory: "64Mi"    # Minimum required
-    cpu: "50m"        # Minimal CPU
-  limits:
-    memory: "256Mi"   # Maximum allowed
-    cpu: "200m"       # CPU limit
-```
+    def generate_deployment_guide(self, server_name: str, candidates: List['MCPToolCandidate']) -> str:
+        """Generate deployment guide for various platforms"""
+        return _deployment_guide(server_name, len(candidates))
 
-### Scaling Strategies
-```bash
-# Horizontal Pod Autoscaler
-kubectl autoscale deployment {server_name} --cpu-percent=70 --min=2 --max=10 -n mcp-servers
+    def generate_deployment_guide_to(self, fp: TextIO, server_name: str, candidates: List['MCPToolCandidate']):
+        """Write the deployment guide to fp"""
+        fp.write(_deployment_guide(server_name, len(candidates)))
 
-# Manual scaling
-kubectl scale deployment {server_name} --replicas=5 -n mcp-servers
-```
+    def iter_deployment_guide(self, server_name: str, candidates: List['MCPToolCandidate']) -> Iterator[str]:
+        """Yield the deployment guide in chunks for writers that stream to a file or socket"""
+        return _RENDERER.generate("deployment", _deployment_context(server_name, len(candidates)))
 
-This deployment guide provides comprehensive instructions for deploying the {server_name} MCP server in various environments with proper monitoring, security, and scaling considerations.
-"""
\ No newline at end of file
+    def generate_all(
+        self,
+        specs: List[Tuple[str, Dict[str, Any], List['MCPToolCandidate']]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Generate the README, integration guide and servers.yaml entry for several servers
+        
+        Args:
+            specs: (server_name, repo_info, candidates) for each server
+            max_workers: Threads used to generate the documents, 1 to run serially
+            
+        Returns:
+            Documents keyed by 'readme', 'integration' and 'servers_entry', in spec order
+        """
+        def generate(spec):
+            server_name, repo_info, candidates = spec
+            return {
+                'readme': self.generate_readme(candidates, server_name, repo_info),
+                'integration': self.generate_integration_guide(server_name, repo_info, candidates),
+                'servers_entry': self.generate_servers_yaml_entry(server_name, repo_info, candidates),
+            }
+        
+        if max_workers is None:
+            max_workers = min(len(specs), os.cpu_count() or 4)
+        
+        if max_workers <= 1:
+            return [generate(spec) for spec in specs]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(generate, specs))
@@ -88,12 +88,13 @@ class ServerWrapperGenerator:
         # Generate tool handlers
         tool_handlers = []
         for candidate in candidates:
-            func_name = candidate.function.function_name
+            func = candidate.function
+            func_name = func.function_name
             tool_name = candidate.suggested_tool_name
             
             # Generate parameter extraction
             param_extractions = []
-            for param in candidate.function.parameters:
+            for param in func.parameters:
                 if param.required:
                     param_extractions.append(
                         f'{param.name} = arguments.get("{param.name}")'
@@ -105,7 +106,7 @@ class ServerWrapperGenerator:
                     )
             
             param_section = '\n        '.join(param_extractions)
-            param_names = [p.name for p in candidate.function.parameters]
+            param_names = [p.name for p in func.parameters]
             param_call = ', '.join(param_names)
             
             handler = f'''if name == "{tool_name}":
@@ -235,12 +236,13 @@ if __name__ == "__main__":
         # Generate tool handlers
         tool_handlers = []
         for candidate in candidates:
-            func_name = candidate.function.function_name
+            func = candidate.function
+            func_name = func.function_name
             tool_name = candidate.suggested_tool_name
             
             # Generate parameter extraction
             param_extractions = []
-            for param in candidate.function.parameters:
+            for param in func.parameters:
                 if param.required:
                     param_extractions.append(
                         f'const {param.name} = request.params.arguments?.{param.name};'
@@ -252,7 +254,7 @@ if __name__ == "__main__":
                     )
             
             param_section = '\n        '.join(param_extractions)
-            param_names = [p.name for p in candidate.function.parameters]
+            param_names = [p.name for p in func.parameters]
             param_call = ', '.join(param_names)
             
             handler = f'''if (request.params.name === "{tool_name}") {{
@@ -6,6 +6,7 @@ import sys
 import os
 import tempfile
 import json
+import re
 from pathlib import Path
 from unittest import TestCase, main
 
@@ -77,8 +78,73 @@ class TestDockerfileGenerator(TestCase):
         language = self.generator._determine_primary_language(candidates)
         self.assertEqual(language, "python")
         
-        # Test with mixed languages (would need more candidates)
-        # For now, just test the basic case
+        # Test with mixed languages; the first language seen wins ties
+        import copy
+        js_candidate = copy.deepcopy(self.sample_candidate)
+        js_candidate.function.language = "javascript"
+        self.assertEqual(
+            self.generator._determine_primary_language([js_candidate, self.sample_candidate, js_candidate]),
+            "javascript"
+        )
+        self.assertEqual(
+            self.generator._determine_primary_language([self.sample_candidate, js_candidate]),
+            "python"
+        )
+
+    def test_environment_and_templates_are_reused(self):
+        """Test that generators share one Jinja2 environment per template directory"""
+        if self.generator.env is None:
+            self.skipTest("Jinja2 is not installed")
+
+        other = DockerfileGenerator(str(self.generator.template_dir))
+        self.assertIs(other.env, self.generator.env)
+
+        context = self.generator._build_generation_context(
+            [self.sample_candidate], "python", "test-server", {"name": "test-repo"}
+        )
+        first = self.generator._generate_dockerfile("python", context)
+        template = self.generator._template_cache["python.dockerfile.j2"]
+        self.assertEqual(self.generator._generate_dockerfile("python", context), first)
+        self.assertIs(self.generator._template_cache["python.dockerfile.j2"], template)
+
+    def test_compiled_templates_render_like_sources(self):
+        """Test that precompiled templates produce the same Dockerfiles"""
+        if self.generator.env is None:
+            self.skipTest("Jinja2 is not installed")
+        from jinja2 import ModuleLoader
+
+        target = DockerfileGenerator.compile_templates(Path(self.temp_dir) / "compiled.zip")
+        compiled_env = DockerfileGenerator._new_env(ModuleLoader(str(target)))
+
+        context = self.generator._build_generation_context(
+            [self.sample_candidate], "python", "test-server", {"name": "test-repo"}
+        )
+        for language in ("python", "javascript"):
+            template_name = f"{language}.dockerfile.j2"
+            self.assertEqual(
+                compiled_env.get_template(template_name).render(**context),
+                self.generator.env.get_template(template_name).render(**context)
+            )
+
+    def test_failed_template_stream_falls_back_to_basic_dockerfile(self):
+        """Test that a template failing mid-render leaves only the basic Dockerfile"""
+        if self.generator.env is None:
+            self.skipTest("Jinja2 is not installed")
+        
+        template_dir = Path(self.temp_dir) / "templates"
+        template_dir.mkdir()
+        (template_dir / "python.dockerfile.j2").write_text("FROM {{ base_image }}\n{{ missing.attribute }}\n")
+        generator = DockerfileGenerator(str(template_dir))
+        
+        context = generator._build_generation_context(
+            [self.sample_candidate], "python", "test-server", {"name": "test-repo"}
+        )
+        dockerfile_path = Path(self.temp_dir) / "Dockerfile"
+        generator._write(dockerfile_path, lambda f: generator._generate_dockerfile_to(f, "python", context))
+        
+        self.assertEqual(
+            dockerfile_path.read_text(), generator._generate_basic_dockerfile("python", context)
+        )
     
     def test_build_generation_context(self):
         """Test context generation"""
@@ -93,6 +159,62 @@ class TestDockerfileGenerator(TestCase):
         self.assertEqual(context['security_level'], "low")
         self.assertIn("mcp>=1.0.0", context['dependencies'])
     
+    def test_extract_environment_vars(self):
+        """Test environment variable detection from function sources"""
+        def candidate(source_code):
+            function = FunctionCandidate(
+                function_name="f", file_path="/test/f.py", language="python",
+                line_number=1, source_code=source_code
+            )
+            return MCPToolCandidate(function=function, mcp_score=1.0, description="f")
+
+        candidates = [
+            candidate("def f():\n    return os.environ['API_KEY']"),
+            candidate("def f(key):\n    return SECRETS[key]"),
+            candidate("def f():\n    return 1"),
+            candidate("def f():\n    return os.environ['API_KEY']"),
+        ]
+        self.assertEqual(
+            self.generator._extract_environment_vars(candidates),
+            {'API_KEY': '${API_KEY}', 'SECRET_KEY': '${SECRET_KEY}'}
+        )
+        self.assertEqual(
+            self.generator._extract_environment_vars([candidate("url = DB_URL")]),
+            {'DATABASE_URL': '${DATABASE_URL}'}
+        )
+    
+    def test_extract_original_functions_is_valid_python(self):
+        """Test that extracted functions form an importable module"""
+        functions_code = self.generator._extract_original_functions(
+            [self.sample_candidate, self.sample_candidate], "python"
+        )
+        
+        compile(functions_code, "original_functions.py", "exec")
+        self.assertIn("# Line: 10\n\ndef process_data(", functions_code)
+    
+    def test_package_json_matches_without_orjson(self):
+        """Test that package.json output does not depend on the JSON backend"""
+        from dockerfile_generator import dockerfile_generator as module
+        context = {
+            'server_name': 'caf\u00e9-server',
+            'server_file': 'mcp_server.js',
+            'dependencies': ['@modelcontextprotocol/sdk', 'axios==1.6.0', 'lodash']
+        }
+        
+        package_json = self.generator._generate_requirements_file("javascript", context)
+        self.assertEqual(json.loads(package_json)['dependencies'], {
+            '@modelcontextprotocol/sdk': 'latest', 'axios': 'latest', 'lodash': 'latest'
+        })
+        
+        has_orjson = module.HAS_ORJSON
+        module.HAS_ORJSON = False
+        try:
+            self.assertEqual(
+                self.generator._generate_requirements_file("javascript", context), package_json
+            )
+        finally:
+            module.HAS_ORJSON = has_orjson
+    
     def test_generate_basic_dockerfile(self):
         """Test basic Dockerfile generation"""
         context = {
@@ -127,6 +249,7 @@ class TestDockerfileGenerator(TestCase):
         self.assertEqual(result['server_name'], "test-server")
         self.assertEqual(result['language'], "python")
         self.assertEqual(result['total_functions'], 1)
+        self.assertEqual(result['generation_time'], result['context']['generation_date'])
         
         # Check generated files exist
         generated_files = result['generated_files']
@@ -145,6 +268,363 @@ class TestDockerfileGenerator(TestCase):
         self.assertIn("mcp>=1.0.0", requirements_content)
         self.assertIn("requests", requirements_content)
 
+    def test_threaded_generation_matches_serial(self):
+        """Test that concurrent file generation writes the same package"""
+        def generate(max_workers, name):
+            result = DockerfileGenerator(max_workers=max_workers).generate_mcp_server_package(
+                candidates=[self.sample_candidate],
+                server_name="test-server",
+                repo_info={"name": "test-repo"},
+                output_dir=str(Path(self.temp_dir) / name)
+            )
+            return {key: Path(path).name for key, path in result['generated_files'].items()}
+
+        def read(name, file_name):
+            # Generated files embed their generation timestamp
+            content = (Path(self.temp_dir) / name / file_name).read_text()
+            return re.sub(r"\d{4}-\d\d-\d\d[T ][\d:.]+", "<timestamp>", content)
+
+        serial = generate(1, "serial")
+        self.assertEqual(generate(4, "threaded"), serial)
+        for file_name in serial.values():
+            self.assertEqual(read("threaded", file_name), read("serial", file_name), file_name)
+
+    def test_generation_error_writes_no_files(self):
+        """Test that files are only written after every in-memory output was generated"""
+        output_dir = Path(self.temp_dir) / "package"
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("server wrapper failed")
+
+        self.generator.server_wrapper_generator.generate_wrapper = fail
+        with self.assertRaises(RuntimeError):
+            self.generator.generate_mcp_server_package(
+                candidates=[self.sample_candidate],
+                server_name="test-server",
+                repo_info={"name": "test-repo"},
+                output_dir=str(output_dir)
+            )
+        self.assertFalse(output_dir.exists())
+
+
+class TestDocumentationGenerator(TestCase):
+    """Test the documentation generator"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        from dockerfile_generator.documentation_generator import DocumentationGenerator
+        self.docs = DocumentationGenerator()
+        
+        self.candidates = []
+        for name in ("first_tool", "second_tool"):
+            function = FunctionCandidate(
+                function_name=name, file_path="/test/tools.py", language="python",
+                line_number=1, source_code=f"def {name}(count: int): pass",
+                parameters=[FunctionParameter(name="count", type_hint="int", required=True)]
+            )
+            self.candidates.append(MCPToolCandidate(
+                function=function, mcp_score=7.0, description=f"Run {name}",
+                suggested_tool_name=name
+            ))
+    
+    def test_servers_yaml_entry_streams_same_text(self):
+        """Test that the streamed servers.yaml entry matches the returned one"""
+        import io
+        
+        stream = io.StringIO()
+        self.docs.generate_servers_yaml_entry_to(stream, "test-server", {"name": "test-repo"}, self.candidates)
+        entry = self.docs.generate_servers_yaml_entry("test-server", {"name": "test-repo"}, self.candidates)
+        
+        timestamp = r"\d{4}-\d\d-\d\d(T[\d:.]+)?"
+        self.assertEqual(re.sub(timestamp, "", stream.getvalue()), re.sub(timestamp, "", entry))
+        self.assertIn('  tools:\n  - name: "first_tool"', entry)
+        self.assertIn('function\n  - name: "second_tool"', entry)
+    
+    def test_tools_table_tracks_candidate_changes(self):
+        """Test that cached tool tables follow changes to the candidates"""
+        table = self.docs._generate_tools_table(self.candidates)
+        self.assertIn("| `first_tool` | Run first_tool | 1 (1 req) | 7.0/10 |", table)
+        self.assertIs(self.docs._generate_tools_table(self.candidates), table)
+        
+        self.candidates[0].mcp_score = 7
+        self.assertIn("| `first_tool` | Run first_tool | 1 (1 req) | 7/10 |",
+                      self.docs._generate_tools_table(self.candidates))
+    
+    def test_generate_all_matches_individual_documents(self):
+        """Test that batch generation matches generating each document directly"""
+        specs = [
+            ("first-server", {"name": "first-repo"}, self.candidates),
+            ("second-server", {"name": "second-repo"}, self.candidates[:1]),
+        ]
+        timestamp = r"\d{4}-\d\d-\d\d([T ][\d:.]+)?"
+        
+        def normalized(documents):
+            return {key: re.sub(timestamp, "", text) for key, text in documents.items()}
+        
+        expected = [normalized({
+            'readme': self.docs.generate_readme(candidates, server_name, repo_info),
+            'integration': self.docs.generate_integration_guide(server_name, repo_info, candidates),
+            'servers_entry': self.docs.generate_servers_yaml_entry(server_name, repo_info, candidates),
+        }) for server_name, repo_info, candidates in specs]
+        
+        self.assertEqual([normalized(d) for d in self.docs.generate_all(specs)], expected)
+        self.assertEqual([normalized(d) for d in self.docs.generate_all(specs, max_workers=1)], expected)
+    
+    def test_deployment_guide_chunks_join_to_guide(self):
+        """Test that the streamed deployment guide chunks match the rendered guide"""
+        chunks = list(self.docs.iter_deployment_guide("test-server", self.candidates))
+        
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), self.docs.generate_deployment_guide("test-server", self.candidates))
+    
+    def test_deployment_guide_sizes_resources_by_tool_count(self):
+        """Test that the deployment guide's Kubernetes resources grow with the tool count"""
+        small = self.docs.generate_deployment_guide("test-server", self.candidates)
+        large = self.docs.generate_deployment_guide("test-server", self.candidates * 50)
+        
+        self.assertIn('memory: "68Mi"', small)
+        self.assertIn('memory: "272Mi"', small)
+        self.assertIn('cpu: "60m"', small)
+        self.assertIn('memory: "264Mi"', large)
+        self.assertIn('cpu: "250m"', large)
+        self.assertIn('cpu: "1000m"', large)
+    
+    def test_deployment_guide_healthcheck_runs_python(self):
+        """Test that the Dockerfile HEALTHCHECK execs python directly"""
+        guide = self.docs.generate_deployment_guide("test-server", self.candidates)
+        
+        self.assertIn(
+            """  CMD ["python", "-c", "import urllib.request; """
+            """urllib.request.urlopen('http://127.0.0.1:8080/healthz', timeout=2)"]\n""",
+            guide
+        )
+    
+    def test_default_manifests_do_not_probe_http(self):
+        """Test that only the opt-in monitoring section probes the metrics port"""
+        guide = self.docs.generate_deployment_guide("test-server", self.candidates)
+        manifests, monitoring = guide.split("## Monitoring and Observability")
+        
+        self.assertNotIn("/healthz", manifests)
+        self.assertIn("startupProbe:", monitoring)
+    
+    def test_templates_render_without_jinja2(self):
+        """Test that documents render and stream identically without the Jinja2 environment"""
+        import io
+        from dockerfile_generator import documentation_generator as module
+        repo_info = {"name": "test-repo", "path": "/test"}
+        
+        def render():
+            stream = io.StringIO()
+            self.docs.generate_readme_to(stream, self.candidates, "test-server", repo_info)
+            return [
+                self.docs.generate_readme(self.candidates, "test-server", repo_info),
+                self.docs.generate_integration_guide("test-server", repo_info, self.candidates),
+                self.docs.generate_servers_yaml_entry("test-server", repo_info, self.candidates),
+                stream.getvalue(),
+                self.docs.generate_deployment_guide("test-server", self.candidates),
+            ]
+        
+        timestamp = r"\d{4}-\d\d-\d\d([T ][\d:.]+)?"
+        documents = [re.sub(timestamp, "", text) for text in render()]
+        self.assertIn("# test-server MCP Server", documents[0])
+        self.assertIn('"mcpServers": {\n    "test-server": {', documents[1])
+        self.assertNotIn("{{", "".join(documents))
+        self.assertEqual(documents[3], documents[0])
+        self.assertIn('- "mcp.tools.count=2"', documents[4])
+        
+        env = module._RENDERER.env
+        module._RENDERER.env = None
+        module._integration_guide.cache_clear()
+        module._deployment_guide.cache_clear()
+        try:
+            self.assertEqual([re.sub(timestamp, "", text) for text in render()], documents)
+        finally:
+            module._RENDERER.env = env
+
+
+class TestPromptResourceGenerator(TestCase):
+    """Test MCP prompt and resource generation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        from dockerfile_generator.prompt_generator import PromptResourceGenerator
+        self.prompts = PromptResourceGenerator()
+        self.candidates = [
+            MCPToolCandidate(
+                function=FunctionCandidate(
+                    function_name=name, file_path="/test/tools.py", language="python",
+                    line_number=1, source_code=f"def {name}(count: int): pass",
+                    parameters=[FunctionParameter(name="count", type_hint="int", required=True)]
+                ),
+                mcp_score=7.0,
+                description=f"Run {name}",
+                suggested_tool_name=name
+            )
+            for name in ("first_tool", "second_tool")
+        ]
+
+    def test_detailed_tool_list_separates_tools_and_parameters(self):
+        """Test the layout of the detailed tool list"""
+        self.candidates[1].function.parameters.append(
+            FunctionParameter(name="label", type_hint=None, default_value="'x'", required=False)
+        )
+        tool_list = self.prompts._generate_detailed_tool_list(self.candidates)
+
+        first, second = tool_list.split("\n\n### ")
+        self.assertTrue(first.startswith("### first_tool\n\n**Description**: Run first_tool\n"))
+        self.assertIn("**Parameters**:\n  - **count** (int) *required*\n\n**Returns**: Any", first)
+        self.assertIn(
+            "  - **count** (int) *required*\n  - **label** (any) *optional* (default: 'x')\n\n", second
+        )
+        self.assertTrue(second.endswith("**Security Level**: Unknown\n"))
+        self.assertEqual(self.prompts._generate_detailed_tool_list([]), "")
+
+    def test_sample_values_follow_type_precedence(self):
+        """Test that example values match the first recognized type name"""
+        from dockerfile_generator.prompt_generator import _canon_type, _dump_example
+        kinds = [_canon_type(t) for t in ("Optional[int]", "Float", "str", "bool", "Dict[str, float]", "Any")]
+        self.assertEqual(kinds, ["int", "float", "str", "bool", "float", None])
+
+        example = _dump_example(tuple(zip("abcdef", kinds)))
+        self.assertEqual(
+            json.loads(example),
+            {"a": 42, "b": 3.14, "c": "example", "d": True, "e": 3.14, "f": "value"}
+        )
+        self.assertIs(_dump_example(tuple(zip("abcdef", kinds))), example)
+
+    def test_single_parameter_examples_match_json_encoder(self):
+        """Test that directly written single-parameter examples equal the encoded ones"""
+        from dockerfile_generator.prompt_generator import _SAMPLE_BY_TYPE, _dump_example, _example_arguments
+        for name in ("count", "_x1", "ñame", 'say "hi"'):
+            for kind in [*_SAMPLE_BY_TYPE, None]:
+                signature = ((name, kind),)
+                self.assertEqual(_example_arguments(signature), _dump_example(signature))
+
+    def test_tool_help_is_embedded_by_name(self):
+        """Test that the generated tool_help prompt looks tools up in a prebuilt table"""
+        import ast
+        self.candidates[1].description = 'Handles "quoted" \\ text'
+        prompts = self.prompts.generate_prompts(self.candidates, "test-server", {"name": "test-repo"})
+
+        table = ast.parse(prompts[:prompts.index("@app.list_prompts()")]).body[0]
+        self.assertEqual(table.targets[0].id, "_TOOL_HELP")
+        tool_help = ast.literal_eval(table.value)
+        self.assertEqual(list(tool_help), ["first_tool", "second_tool"])
+        self.assertEqual(tool_help["first_tool"], self.prompts._generate_detailed_tool_help(self.candidates[0]))
+        self.assertIn('Handles "quoted" \\ text', tool_help["second_tool"])
+        self.assertIn("content = _TOOL_HELP.get(tool_name)", prompts)
+        self.assertNotIn("for c in candidates", prompts)
+
+    def test_static_guides_are_embedded_as_constants(self):
+        """Test that the architecture and troubleshooting prompts are rendered at generation time"""
+        import ast
+        repo_info = {"name": "test-repo"}
+        prompts = self.prompts.generate_prompts(self.candidates, "test-server", repo_info)
+        resources = self.prompts.generate_resources(self.candidates, "test-server", repo_info)
+
+        module = ast.parse(prompts[:prompts.index("@app.list_prompts()")])
+        constants = {node.targets[0].id: ast.literal_eval(node.value) for node in module.body}
+        self.assertEqual(
+            constants["_ARCHITECTURE_GUIDE"], self.prompts._get_architecture_explanation("test-server")
+        )
+        self.assertEqual(
+            constants["_TROUBLESHOOTING_GUIDE"], self.prompts._get_troubleshooting_guide("test-server")
+        )
+        self.assertIn("content = _ARCHITECTURE_GUIDE\n", prompts)
+        self.assertIn("content = _TROUBLESHOOTING_GUIDE\n", prompts)
+        self.assertIn("return _ARCHITECTURE_GUIDE\n", resources)
+        self.assertNotIn("self._get_", prompts + resources)
+
+    def test_resource_documents_are_embedded_as_constants(self):
+        """Test that the API, examples and integration resources are rendered at generation time"""
+        import ast
+        repo_info = {"name": "test-repo"}
+        resources = self.prompts.generate_resources(self.candidates, "test-server", repo_info)
+
+        module = ast.parse(resources)
+        constants = {
+            node.targets[0].id: ast.literal_eval(node.value)
+            for node in module.body if isinstance(node, ast.Assign)
+        }
+        self.assertEqual(
+            constants["_API_DOCUMENTATION"],
+            self.prompts._generate_api_documentation(self.candidates, "test-server")
+        )
+        self.assertEqual(
+            constants["_EXAMPLES_DOCUMENTATION"],
+            self.prompts._generate_examples_documentation(self.candidates, "test-server")
+        )
+        self.assertEqual(
+            constants["_INTEGRATION_DOCUMENTATION"],
+            self.prompts._generate_integration_documentation("test-server", repo_info)
+        )
+        for name in ("_API_DOCUMENTATION", "_EXAMPLES_DOCUMENTATION", "_INTEGRATION_DOCUMENTATION"):
+            self.assertIn(f"return {name}\n", resources)
+        self.assertNotIn("self._generate_", resources)
+
+    def test_usage_guide_is_embedded_as_constant(self):
+        """Test that the usage guide prompt is rendered with the tool list at generation time"""
+        import ast
+        prompts = self.prompts.generate_prompts(self.candidates, "test-server", {"name": "test-repo"})
+
+        module = ast.parse(prompts)
+        constants = {
+            node.targets[0].id: ast.literal_eval(node.value)
+            for node in module.body if isinstance(node, ast.Assign)
+        }
+        usage_guide = constants["_USAGE_GUIDE"]
+        self.assertIn("repository: **test-repo**", usage_guide)
+        self.assertIn("- **first_tool**: Run first_tool\n- **second_tool**: Run second_tool\n", usage_guide)
+        self.assertIn(
+            "## Available Tools (2 total)\n\n" + self.prompts._generate_detailed_tool_list(self.candidates),
+            usage_guide
+        )
+        self.assertIn("content = _USAGE_GUIDE\n", prompts)
+
+    def test_tool_list_and_examples_track_candidate_changes(self):
+        """Test that cached tool lists and examples are keyed by candidate content"""
+        tool_list = self.prompts._generate_detailed_tool_list(self.candidates)
+        examples = self.prompts._generate_tool_examples(self.candidates[0])
+        self.assertIs(self.prompts._generate_detailed_tool_list(list(self.candidates)), tool_list)
+        self.assertIs(self.prompts._generate_tool_examples(self.candidates[0]), examples)
+
+        self.candidates[0].description = "Run the first tool"
+        self.candidates[0].function.parameters[0].type_hint = "str"
+        self.assertIn("**Description**: Run the first tool\n", self.prompts._generate_detailed_tool_list(self.candidates))
+        self.assertIn('"count": "example"', self.prompts._generate_tool_examples(self.candidates[0]))
+
+    def test_templates_render_without_jinja2(self):
+        """Test that prompts and resources render identically without the Jinja2 environment"""
+        from dockerfile_generator import prompt_generator as module
+        repo_info = {"name": "test-repo", "path": "/test"}
+
+        def render():
+            return [
+                self.prompts.generate_prompts(self.candidates, "test-server", repo_info),
+                self.prompts.generate_resources(self.candidates, "test-server", repo_info),
+                self.prompts._get_architecture_explanation("test-server"),
+                self.prompts._get_troubleshooting_guide("test-server"),
+                self.prompts._generate_api_documentation(self.candidates, "test-server"),
+                self.prompts._generate_integration_documentation("test-server", repo_info),
+            ]
+
+        documents = render()
+        self.assertIn('description="Complete usage guide for test-server MCP server"', documents[0])
+        self.assertIn('uri="docs://test-server/api"', documents[1])
+        self.assertIn("This MCP server provides 2 tools", documents[4])
+        self.assertIn('description: "Generated MCP server from test-repo"', documents[5])
+        self.assertNotIn("{{ ", "".join(documents))
+        self.assertIs(self.prompts._get_architecture_explanation("test-server"), documents[2])
+
+        env = module._RENDERER.env
+        module._RENDERER.env = None
+        module._architecture_explanation.cache_clear()
+        module._troubleshooting_guide.cache_clear()
+        try:
+            self.assertEqual(render(), documents)
+        finally:
+            module._RENDERER.env = env
+
 
 class TestDependencyResolver(TestCase):
     """Test the dependency resolver"""
@@ -211,6 +691,39 @@ def fetch_data(url: str) -> dict:
         self.assertTrue(any("pandas" in dep for dep in dependencies))
 
 
+    def test_resolution_is_cached_by_candidate_content(self):
+        """Test that dependency resolution is cached per candidate set"""
+        def candidate(source_code, requirements):
+            function = FunctionCandidate(
+                function_name="f", file_path="/test/f.py", language="python",
+                line_number=1, source_code=source_code
+            )
+            return MCPToolCandidate(
+                function=function, mcp_score=1.0, description="f",
+                docker_requirements=requirements
+            )
+
+        first = candidate("import requests\ndef f(): pass", [])
+        second = candidate("def f(): pass", ["pandas"])
+        dependencies = self.resolver.resolve_dependencies([first, second], "python")
+
+        calls = []
+        resolve = self.resolver._resolve_uncached
+        self.resolver._resolve_uncached = lambda *args: calls.append(args) or resolve(*args)
+
+        # Order does not matter, and callers get their own copy
+        cached = self.resolver.resolve_dependencies([second, first], "python")
+        self.assertEqual(cached, dependencies)
+        cached.append("mutated")
+        self.assertEqual(self.resolver.resolve_dependencies([first, second], "python"), dependencies)
+        self.assertEqual(calls, [])
+
+        # Changed requirements resolve again
+        second.docker_requirements = ["numpy"]
+        self.assertIn("numpy>=1.20.0,<2.0.0", self.resolver.resolve_dependencies([first, second], "python"))
+        self.assertEqual(len(calls), 1)
+
+
 class TestServerWrapperGenerator(TestCase):
     """Test the server wrapper generator"""
     
@@ -0,0 +1,29 @@
+"""
+Precompile the Dockerfile templates to Python modules
+
+Run at build time so DockerfileGenerator loads templates without parsing them:
+
+    python scripts/compile_templates.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add the repository root to path so we can import the generator
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dockerfile_generator.dockerfile_generator import HAS_JINJA2, DockerfileGenerator
+
+
+def main():
+    """CLI entry point"""
+    if not HAS_JINJA2:
+        print("Jinja2 is required to compile templates")
+        sys.exit(1)
+    
+    target = DockerfileGenerator.compile_templates()
+    print(f"Compiled templates written to {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Tests for the JavaScript analyzer
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to path so we can import the analyzer
+sys.path.append(str(Path(__file__).parent.parent))
+
+from analyzer.language_parsers import javascript_analyzer
+from analyzer.language_parsers.javascript_analyzer import JavaScriptAnalyzer, JavaScriptRegexParser
+
+
+MOCK_JS_REPO = Path(__file__).parent / "mock_repos" / "simple_javascript"
+
+
+def test_analysis_cache_returns_copies(monkeypatch):
+    """Repeated analysis of the same source is served from the cache"""
+    monkeypatch.setattr(javascript_analyzer, 'HAS_ESPRIMA', False)
+    monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+    javascript_analyzer.clear_analysis_cache()
+
+    test_file = MOCK_JS_REPO / "calculator.js"
+    source = test_file.read_text()
+    analyzer = JavaScriptAnalyzer()
+
+    first = analyzer.analyze_source(source, str(test_file))
+
+    def fail_extract(self):
+        raise AssertionError("cache miss on unchanged source")
+
+    monkeypatch.setattr(JavaScriptRegexParser, 'extract_functions', fail_extract)
+    second = analyzer.analyze_source(source, str(test_file))
+
+    assert first
+    assert [f.function_name for f in first] == [f.function_name for f in second]
+    assert all(a is not b for a, b in zip(first, second))
+
+    javascript_analyzer.clear_analysis_cache()
+
+
+def test_sources_without_functions_skip_parsing(monkeypatch):
+    """Sources with no function-like tokens never reach a parser backend"""
+    monkeypatch.setattr(javascript_analyzer, 'HAS_ESPRIMA', False)
+    monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+
+    def fail_extract(self):
+        raise AssertionError("parser invoked for a source without functions")
+
+    monkeypatch.setattr(JavaScriptRegexParser, 'extract_functions', fail_extract)
+    analyzer = JavaScriptAnalyzer()
+
+    source = "import { a } from './a';\nexport const LIMITS = { max: 10, min: 1 };\n"
+    assert analyzer.analyze_source(source, "constants.js") == []
+    assert analyzer.skipped_sources == 1
+
+
+def test_regex_parser_ignores_braces_in_strings_and_comments():
+    """Function source extraction matches braces at code level only"""
+    source = (
+        "function wrap(text) {\n"
+        "    // closing } in a comment\n"
+        "    return '{' + text + \"}\";\n"
+        "}\n"
+        "\n"
+        "function after() {\n"
+        "    return 1;\n"
+        "}\n"
+    )
+    functions = JavaScriptRegexParser(source, "wrap.js").extract_functions()
+
+    assert [f.function_name for f in functions] == ['wrap', 'after']
+    assert functions[0].source_code == source[:source.index('\n\nfunction after')]
+    assert functions[1].line_number == 6
+
+
+def test_analyze_files_matches_sequential_analysis():
+    """Parallel multi-file analysis yields the same candidates as per-file analysis"""
+    javascript_analyzer.clear_analysis_cache()
+    file_paths = [str(path) for path in sorted(MOCK_JS_REPO.glob("*.js"))]
+    analyzer = JavaScriptAnalyzer()
+
+    sequential = [f for path in file_paths for f in analyzer.analyze_file(path)]
+    parallel = list(analyzer.analyze_files(file_paths, max_workers=2))
+
+    assert [(f.file_path, f.function_name) for f in parallel] == \
+        [(f.file_path, f.function_name) for f in sequential]
+
+
+def test_esprima_extracts_documented_functions(monkeypatch):
+    """The esprima backend attaches JSDoc, defaults and line numbers to candidates"""
+    if not javascript_analyzer.HAS_ESPRIMA:
+        pytest.skip("esprima is not installed")
+    monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+    javascript_analyzer.clear_analysis_cache()
+
+    test_file = MOCK_JS_REPO / "calculator.js"
+    functions = {f.function_name: f for f in JavaScriptAnalyzer().analyze_file(str(test_file))}
+
+    power = functions['calculatePower']
+    assert power.line_number == 38
+    assert power.docstring.startswith("Calculate base raised to the power")
+    assert [(p.name, p.default_value, p.required) for p in power.parameters] == \
+        [('base', None, True), ('exponent', '2', False)]
+    assert functions['addNumbers'].docstring.startswith("Add two numbers")
+
+
+def test_esprima_backend_picks_parser_from_module_hints(monkeypatch):
+    """Only sources with top-level import/export are parsed as ES modules"""
+    if not javascript_analyzer.HAS_ESPRIMA:
+        pytest.skip("esprima is not installed")
+    esprima = javascript_analyzer.esprima
+    backend = javascript_analyzer.EsprimaBackend()
+
+    monkeypatch.setattr(esprima, 'parseModule', lambda *args, **kwargs: pytest.fail("module parse of a script"))
+    assert backend.parse("module.exports = function add(a, b) { return a + b; };\n").sourceType == 'script'
+
+    monkeypatch.undo()
+    monkeypatch.setattr(esprima, 'parseScript', lambda *args, **kwargs: pytest.fail("script parse of a module"))
+    assert backend.parse("import x from './x';\nexport function f() {}\n").sourceType == 'module'
+
+
+def test_tree_sitter_backend_matches_esprima(monkeypatch):
+    """The tree-sitter node shim yields the same candidates as esprima"""
+    if not javascript_analyzer.HAS_ESPRIMA:
+        pytest.skip("esprima is not installed")
+    if not isinstance(javascript_analyzer._get_parser_backend(), javascript_analyzer.TreeSitterBackend):
+        pytest.skip("tree-sitter is not available")
+
+    def describe(functions):
+        return [(f.function_name, f.class_name, f.line_number, f.docstring, f.source_code,
+                 [(p.name, p.default_value, p.required) for p in f.parameters]) for f in functions]
+
+    source = (
+        "class Greeter {\n"
+        "    /** Greet someone by name */\n"
+        "    greet(name = 'w\u00f6rld', ...rest) {\n"
+        "        return `hi ${name}`;\n"
+        "    }\n"
+        "}\n"
+        "handlers[key] = function(event) {};\n"
+        "export const double = (x) => x * 2;\n"
+    )
+    analyzer = JavaScriptAnalyzer()
+    for test_file in sorted(MOCK_JS_REPO.glob("*.js")):
+        javascript_analyzer.clear_analysis_cache()
+        tree_sitter = describe(analyzer.analyze_file(str(test_file)))
+        with monkeypatch.context() as patch:
+            patch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+            javascript_analyzer.clear_analysis_cache()
+            assert describe(analyzer.analyze_file(str(test_file))) == tree_sitter
+
+    javascript_analyzer.clear_analysis_cache()
+    tree_sitter = describe(analyzer.analyze_source(source, "greeter.js"))
+    monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+    javascript_analyzer.clear_analysis_cache()
+    assert describe(analyzer.analyze_source(source, "greeter.js")) == tree_sitter
+    assert [f[0] for f in tree_sitter] == ['greet', 'key', 'double']
+
+    # Anonymous default exports are declarations in ESTree but expressions in tree-sitter
+    default_exports = {
+        "default_function.js": ("export default function (q) {\n    return q;\n}\n", ['anonymous']),
+        "default_class.js": ("export default class {\n    m(a) {\n        return a;\n    }\n}\n", ['m']),
+    }
+    for file_name, (default_source, names) in default_exports.items():
+        monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', True)
+        javascript_analyzer.clear_analysis_cache()
+        tree_sitter = describe(analyzer.analyze_source(default_source, file_name))
+        monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+        javascript_analyzer.clear_analysis_cache()
+        assert describe(analyzer.analyze_source(default_source, file_name)) == tree_sitter
+        assert [f[0] for f in tree_sitter] == names
+
+    javascript_analyzer.clear_analysis_cache()
+
+
+def test_iter_functions_streams_candidates():
+    """Visitors yield candidates lazily in the same order extract_functions returns them"""
+    backend = javascript_analyzer._get_parser_backend()
+    if backend is None:
+        pytest.skip("no AST parser backend is installed")
+
+    test_file = MOCK_JS_REPO / "calculator.js"
+    source = test_file.read_text()
+    visitor = javascript_analyzer.JavaScriptFunctionVisitor(source, str(test_file))
+
+    stream = visitor.iter_functions(backend.parse(source))
+    first = next(stream)
+    names = [first.function_name] + [f.function_name for f in stream]
+
+    assert names == [f.function_name for f in visitor.extract_functions(backend.parse(source))]
+    assert list(JavaScriptRegexParser(source, str(test_file)).iter_functions())
+
+
+def test_analysis_errors_are_logged(tmp_path, caplog):
+    """Unreadable files are reported through the module logger and yield no candidates"""
+    missing = tmp_path / "missing.js"
+
+    with caplog.at_level("WARNING", logger=javascript_analyzer.__name__):
+        assert JavaScriptAnalyzer().analyze_file(str(missing)) == []
+
+    assert any(str(missing) in record.getMessage() for record in caplog.records)
+
+
+def test_disk_cache_reuses_results_until_file_changes(tmp_path, monkeypatch):
+    """The persistent cache is keyed by file size and mtime"""
+    monkeypatch.setattr(javascript_analyzer, 'HAS_ESPRIMA', False)
+    monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+    javascript_analyzer.clear_analysis_cache()
+
+    source_file = tmp_path / "utils.js"
+    source_file.write_text("function first(a) {\n    return a;\n}\n")
+    cache_dir = tmp_path / "cache"
+
+    first = JavaScriptAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source_file))
+    assert [f.function_name for f in first] == ['first']
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    # A fresh analyzer with an empty in-memory cache is served from disk
+    javascript_analyzer.clear_analysis_cache()
+    with monkeypatch.context() as patch:
+        patch.setattr(JavaScriptRegexParser, 'extract_functions',
+                      lambda self: pytest.fail("disk cache miss on unchanged file"))
+        cached = JavaScriptAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source_file))
+    assert [f.function_name for f in cached] == ['first']
+
+    source_file.write_text("function second(b) {\n    return b * 2;\n}\n")
+    changed = JavaScriptAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source_file))
+    assert [f.function_name for f in changed] == ['second']
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    javascript_analyzer.clear_analysis_cache()
+
+
+def test_disk_cache_is_keyed_by_backend_and_skips_failures(tmp_path, monkeypatch):
+    """Cache entries from another parser backend are not reused and parse failures are not cached"""
+    monkeypatch.setattr(javascript_analyzer, 'HAS_ESPRIMA', False)
+    monkeypatch.setattr(javascript_analyzer, 'HAS_TREE_SITTER', False)
+    javascript_analyzer.clear_analysis_cache()
+
+    source_file = tmp_path / "utils.js"
+    source_file.write_text("function first(a) {\n    return a;\n}\n")
+    cache_dir = tmp_path / "cache"
+
+    def fail_extract(self):
+        raise ValueError("unparseable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(JavaScriptRegexParser, 'extract_functions', fail_extract)
+        analyzer = JavaScriptAnalyzer(cache_dir=str(cache_dir))
+        assert analyzer.analyze_file(str(source_file)) == []
+    assert analyzer.failed_sources == 1
+    assert not list(cache_dir.glob("*.pickle"))
+
+    javascript_analyzer.clear_analysis_cache()
+    regex = JavaScriptAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source_file))
+    assert [f.function_name for f in regex] == ['first']
+    [entry] = cache_dir.glob("*.pickle")
+    assert f"-{javascript_analyzer._CACHE_VERSION}-regex-" in entry.name
+
+    if javascript_analyzer.esprima is None:
+        return
+    # The in-memory entry from the regex parser must not be reused either
+    monkeypatch.setattr(javascript_analyzer, 'HAS_ESPRIMA', True)
+    parses = []
+    parse = javascript_analyzer.EsprimaBackend.parse
+    with monkeypatch.context() as patch:
+        patch.setattr(javascript_analyzer, '_load_disk_cache',
+                      lambda path: pytest.fail("regex cache entry served to esprima") if path == entry else None)
+        patch.setattr(javascript_analyzer.EsprimaBackend, 'parse',
+                      lambda self, source: parses.append(source) or parse(self, source))
+        JavaScriptAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source_file))
+    assert parses
+    [entry] = cache_dir.glob("*.pickle")
+    assert "-esprima-" in entry.name
+
+    javascript_analyzer.clear_analysis_cache()
@@ -0,0 +1,86 @@
+"""
+Tests for the Python analyzer
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to path so we can import the analyzer
+sys.path.append(str(Path(__file__).parent.parent))
+
+from analyzer.language_parsers.python_analyzer import PythonAnalyzer
+
+
+def test_function_source_ends_at_function_body():
+    """Function source spans the whole body, including nested definitions, and nothing after it"""
+    source = (
+        "def outer(value):\n"
+        "    def inner():\n"
+        "        return value\n"
+        "    return inner()\n"
+        "\n"
+        "\n"
+        "RESULT = outer(1)\n"
+        "\n"
+        "def after():\n"
+        "    pass\n"
+    )
+    functions = {f.function_name: f for f in PythonAnalyzer().analyze_source(source, "nested.py")}
+
+    assert functions['outer'].source_code == source[:source.index('\n\n\nRESULT')]
+    assert functions['inner'].source_code == "    def inner():\n        return value"
+    assert functions['after'].source_code == "def after():\n    pass"
+
+
+def test_analyze_files_matches_sequential_analysis():
+    """Parallel multi-file analysis yields the same candidates as per-file analysis"""
+    mock_repo = Path(__file__).parent / "mock_repos" / "simple_python"
+    file_paths = [str(path) for path in sorted(mock_repo.glob("*.py"))]
+    analyzer = PythonAnalyzer()
+
+    sequential = [f for path in file_paths for f in analyzer.analyze_file(path)]
+    parallel = list(analyzer.analyze_files(file_paths, max_workers=2))
+
+    assert sequential
+    assert [(f.file_path, f.function_name) for f in parallel] == \
+        [(f.file_path, f.function_name) for f in sequential]
+
+
+def test_simple_hints_and_defaults_match_unparse():
+    """Fast-path rendering of annotations and defaults agrees with ast.unparse"""
+    source = (
+        "def configure(path: str, mode: os.PathLike = None, retries: int = 3,\n"
+        "              label: 'Label' = u'x', ratio: float = 1e309, *, flag: bool = True,\n"
+        "              items: Optional[List[str]] = (), level=logging.INFO):\n"
+        "    return path\n"
+    )
+    function = PythonAnalyzer().analyze_source(source, "config.py")[0]
+
+    assert [(p.name, p.type_hint, p.default_value) for p in function.parameters] == [
+        ('path', 'str', None),
+        ('mode', 'os.PathLike', 'None'),
+        ('retries', 'int', '3'),
+        ('label', "'Label'", "u'x'"),
+        ('ratio', 'float', '1e309'),
+        ('flag', 'bool', 'True'),
+        ('items', 'Optional[List[str]]', '()'),
+        ('level', None, 'logging.INFO'),
+    ]
+
+
+def test_analyze_file_honors_coding_cookie(tmp_path):
+    """Files are parsed from bytes, so non-UTF-8 sources with a coding cookie are analyzed"""
+    source_file = tmp_path / "legacy.py"
+    source_file.write_bytes(
+        b"# -*- coding: latin-1 -*-\r\n"
+        b"def greet(name):\r\n"
+        b"    \"\"\"Say hello in fran\xe7ais\"\"\"\r\n"
+        b"    return 'bonjour ' + name\r\n"
+    )
+
+    functions = PythonAnalyzer().analyze_file(str(source_file))
+
+    assert [f.function_name for f in functions] == ['greet']
+    assert functions[0].docstring == "Say hello in français"
+    assert functions[0].source_code.splitlines()[0] == "def greet(name):"
+    assert '\r' not in functions[0].source_code